@@ -9,9 +9,31 @@ Architecture:
 """
 
 import json
-from typing import Dict, Any, List
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
-from tqdm import tqdm
+try:
+    from tqdm import tqdm
+except ImportError:
+    # Progress bar is optional (batch/server contexts)
+    class tqdm:
+        """No-op stand-in for tqdm when it is not installed."""
+
+        def __init__(self, iterable=None, **kwargs):
+            self.iterable = iterable
+
+        def __iter__(self):
+            return iter(self.iterable)
+
+        def set_postfix_str(self, *args, **kwargs):
+            pass
+
+        def update(self, n=1):
+            pass
+
+        def close(self):
+            pass
 
 from .llm_provider import LLMProvider
 from .models import (
@@ -24,6 +46,22 @@ from .models import (
     Section,
     TokenCounter,
 )
+from .concurrency import map_in_order
+from .templates import compile_template, fast_format
+
+logger = logging.getLogger(__name__)
+
+
+# Shared background writer for progressive chunk output (reused across documents)
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chunk-writer")
+
+# Progressive output layouts
+OUTPUT_MODE_PER_CHUNK = "per_chunk"  # one {document_id}_chunk_nnn.json per chunk (resumable)
+OUTPUT_MODE_JSONL = "jsonl"          # one {document_id}_chunks.jsonl per document
+OUTPUT_MODES = (OUTPUT_MODE_PER_CHUNK, OUTPUT_MODE_JSONL)
+
+# Write buffer for JSONL output (coalesces many chunk lines into one syscall)
+JSONL_BUFFER_BYTES = 1 << 20
 
 
 # ============================================================================
@@ -151,6 +189,14 @@ GUIDELINES:
 OUTPUT (contextual prefix):"""
 
 
+# ============================================================================
+# Template Rendering
+# ============================================================================
+
+_EXTRACTION_COMPILED = compile_template(EXTRACTION_INSTRUCTIONS)
+_PREFIX_COMPILED = compile_template(PREFIX_INSTRUCTIONS)
+
+
 # ============================================================================
 # Chunk Extractor
 # ============================================================================
@@ -173,15 +219,30 @@ class ChunkExtractor:
         model: str = "anthropic/claude-haiku-4.5",
         max_chunk_tokens: int = 1000,
         output_dir=None,
-        document_id: str = None
+        document_id: str = None,
+        output_mode: str = OUTPUT_MODE_PER_CHUNK,
+        max_concurrency: int = 8
     ):
-        """Initialize chunk extractor."""
+        """
+        Initialize chunk extractor.
+
+        output_mode selects progressive output under output_dir: "per_chunk"
+        (one JSON file per chunk, skipped on re-runs) or "jsonl" (one file per
+        document, rewritten on every run). max_concurrency bounds how many
+        sections are extracted at once (1 = sequential).
+        """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(
+                f"output_mode must be '{OUTPUT_MODE_PER_CHUNK}' or '{OUTPUT_MODE_JSONL}', got '{output_mode}'"
+            )
         self.llm_client = llm_client
         self.token_counter = token_counter
         self.model = model
         self.max_chunk_tokens = max_chunk_tokens
         self.output_dir = output_dir
         self.document_id = document_id
+        self.output_mode = output_mode
+        self.max_concurrency = max(1, max_concurrency)
 
     def _build_cached_message(
         self,
@@ -233,136 +294,213 @@ class ChunkExtractor:
 
         Returns dict with chunks, tokens_consumed, and llm_responses.
         """
+        totals: Dict[str, Any] = {}
+        chunks = list(self.iter_chunks(document, structure, redo=redo, totals=totals))
+
+        return {
+            "chunks": chunks,
+            "tokens_consumed": totals["tokens_consumed"]
+        }
+
+    def iter_chunks(
+        self,
+        document: Document,
+        structure: Structure,
+        redo: bool = False,
+        totals: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Chunk]:
+        """
+        Yield chunks one by one as each section finishes extraction.
+
+        Same work and output files as extract_chunks(), but the caller decides
+        whether to keep the chunks, so memory can stay bounded by one section.
+
+        Args:
+            document: Document to extract chunks from
+            structure: Document structure from Phase 1
+            redo: If True, force reprocessing even if chunk files exist (default: False)
+            totals: Optional dict; "tokens_consumed" and "total_chunks" are set
+                in it once the iterator is exhausted
+
+        Yields:
+            Chunk objects in section order
+        """
         # Validate inputs
         if not structure.sections:
             raise ChunkExtractionError("No sections provided for extraction")
 
         # Check for V2 format (word boundaries)
         first_section = structure.sections[0]
-        if not hasattr(first_section, 'start_words') or not hasattr(first_section, 'end_words'):
+        if not isinstance(first_section, Section):
             raise ChunkExtractionError(
                 "Structure does not contain word boundaries (start_words/end_words). "
                 "Use StructureAnalyzer to generate compatible structures."
             )
 
-        chunks = []
+        total_chunks = 0
         total_tokens_consumed = 0
 
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Count total sections to process (skip title-only)
         sections_to_process = [s for s in structure.sections if s.start_words or s.end_words]
 
         # Progress bar
-        pbar = tqdm(sections_to_process, desc="Extracting chunks", unit="section")
+        pbar = tqdm(total=len(sections_to_process), desc="Extracting chunks", unit="section")
 
-        # Extract chunk for each section
-        for i, section in enumerate(pbar):
-            try:
-                # Update progress bar description
-                pbar.set_postfix_str(f"{section.title[:40]}...")
+        # Chunk writes run on _WRITE_EXECUTOR so the section loop does not block on disk I/O
+        write_futures = []
 
-                # Check if chunk file already exists (unless redo flag is set)
-                chunk_number = i + 1
-                chunk_file = None
-                if self.output_dir and not redo:
-                    chunk_file = self.output_dir / f"{document.document_id}_chunk_{chunk_number:03d}.json"
-                    if chunk_file.exists():
-                        try:
-                            # Validate file can be parsed
-                            with open(chunk_file, 'r') as f:
-                                chunk_data = json.load(f)
-                            chunk = Chunk(**chunk_data)
-                            logger.info(f"Chunk {chunk_number} exists and valid, skipping: {chunk_file}")
-                            chunks.append(chunk)
-                            continue
-                        except Exception as e:
-                            logger.warning(f"Chunk {chunk_number} exists but invalid, will regenerate: {e}")
-
-                # Get is_table flag (default to False for backward compatibility)
-                is_table = getattr(section, 'is_table', False)
-
-                # Extract text
-                extraction_result = self._extract_section_text(
-                    document,
-                    section.title,
-                    section.summary,
-                    section.start_words,
-                    section.end_words,
-                    self.max_chunk_tokens,
-                    is_table=is_table
-                )
-                extracted_text = extraction_result["extracted_text"]
-                total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
-
-                # Derive metadata from Phase 1 (no LLM call!)
-                metadata = derive_metadata_from_structure(structure, section)
-
-                # Generate contextual prefix
-                prefix_result = self._generate_contextual_prefix(
-                    document.document_id,
-                    metadata.chapter_title,
-                    metadata.section_title,
-                    metadata.subsection_title,
-                    extracted_text,
-                    document.content
-                )
-                contextual_prefix = prefix_result["prefix"]
-                total_tokens_consumed += prefix_result.get("tokens_consumed", 0)
-
-                # Combine prefix with extracted text
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
-
-                # Count tokens
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
-
-                # Warn if token limit exceeded
-                if token_count > self.max_chunk_tokens * 3:
-                    logger.debug(f"Chunk '{section.title}' has {token_count} tokens (>{self.max_chunk_tokens*3})")
-
-                # Create chunk
-                chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
-                cache_hit = structure.metadata.get("cache_hit", False)
-
-                processing_metadata = ProcessingMetadata(
-                    phase_1_model=structure.analysis_model,
-                    phase_2_model=self.model,
-                    cache_hit=cache_hit
-                )
-
-                chunk = Chunk(
-                    chunk_id=chunk_id,
-                    source_document=document.document_id,
-                    chunk_text=chunk_text,
-                    original_text=extracted_text,
-                    contextual_prefix=contextual_prefix,
-                    metadata=metadata,
-                    token_count=token_count,
-                    processing_metadata=processing_metadata
-                )
-
-                chunks.append(chunk)
-
-                # Write chunk to file immediately (progressive output)
-                if self.output_dir:
-                    chunk_file = self.output_dir / f"{document.document_id}_chunk_{i+1:03d}.json"
-                    chunk_file.write_text(json.dumps(chunk.dict(), default=str, indent=2))
+        # JSONL mode: one buffered file per document instead of a file per chunk
+        jsonl_file = None
+        if self.output_dir and self.output_mode == OUTPUT_MODE_JSONL:
+            jsonl_file = open(
+                self.output_dir / f"{document.document_id}_chunks.jsonl", "wb",
+                buffering=JSONL_BUFFER_BYTES
+            )
 
+        def extract(item: Tuple[int, Section]) -> Tuple[Chunk, int, bool]:
+            i, section = item
+            try:
+                return self._process_section(i, section, document, structure, redo)
+            except (ChunkExtractionError, ValueError):
+                raise
             except Exception as e:
-                if isinstance(e, (ChunkExtractionError, ValueError)):
-                    raise
                 raise ChunkExtractionError(
                     f"Failed to extract chunk for section '{section.title}': {str(e)}"
                 ) from e
 
-        pbar.close()
-        logger.info(f"Extracted {len(chunks)} chunks, {total_tokens_consumed:,} tokens")
+        # Sections are independent given the structure: run up to max_concurrency
+        # at once, but collect (and yield/write) them in section order
+        section_results = map_in_order(extract, enumerate(sections_to_process), self.max_concurrency)
 
-        return {
-            "chunks": chunks,
-            "tokens_consumed": total_tokens_consumed
-        }
+        try:
+            for i, (chunk, tokens_consumed, from_file) in enumerate(section_results):
+                section = sections_to_process[i]
+                pbar.set_postfix_str(f"{section.title[:40]}...")
+                pbar.update(1)
+                total_tokens_consumed += tokens_consumed
+                total_chunks += 1
+
+                # Append to the JSONL file or queue the chunk file write (progressive output)
+                if from_file:
+                    pass  # Already on disk
+                elif jsonl_file is not None:
+                    jsonl_file.write(chunk.model_dump_json().encode() + b"\n")
+                elif self.output_dir:
+                    chunk_file = self.output_dir / f"{document.document_id}_chunk_{i+1:03d}.json"
+                    write_futures.append(_WRITE_EXECUTOR.submit(
+                        chunk_file.write_bytes, chunk.model_dump_json(indent=2).encode()
+                    ))
+
+                yield chunk
+        finally:
+            # Fail fast (or early close by the caller): drop sections not started yet
+            section_results.close()
+            pbar.close()
+            wait(write_futures)
+            if jsonl_file is not None:
+                jsonl_file.close()
+
+        # Surface any failed chunk writes
+        for future in write_futures:
+            future.result()
+
+        logger.info("Extracted %d chunks, %s tokens", total_chunks, f"{total_tokens_consumed:,}")
+
+        if totals is not None:
+            totals["tokens_consumed"] = total_tokens_consumed
+            totals["total_chunks"] = total_chunks
+
+    def _process_section(
+        self,
+        i: int,
+        section: Section,
+        document: Document,
+        structure: Structure,
+        redo: bool = False
+    ) -> Tuple[Chunk, int, bool]:
+        """
+        Build the chunk for one section (runs on the section thread pool).
+
+        Returns:
+            Tuple of (chunk, tokens_consumed, loaded_from_existing_file)
+        """
+        # Check if chunk file already exists (unless redo flag is set)
+        chunk_number = i + 1
+        if self.output_dir and self.output_mode == OUTPUT_MODE_PER_CHUNK and not redo:
+            chunk_file = self.output_dir / f"{document.document_id}_chunk_{chunk_number:03d}.json"
+            if chunk_file.exists():
+                try:
+                    # Validate file can be parsed
+                    with open(chunk_file, 'r') as f:
+                        chunk_data = json.load(f)
+                    chunk = Chunk(**chunk_data)
+                    logger.info("Chunk %d exists and valid, skipping: %s", chunk_number, chunk_file)
+                    return chunk, 0, True
+                except Exception as e:
+                    logger.warning("Chunk %d exists but invalid, will regenerate: %s", chunk_number, e)
+
+        total_tokens_consumed = 0
+
+        # Extract text
+        extraction_result = self._extract_section_text(
+            document,
+            section.title,
+            section.summary,
+            section.start_words,
+            section.end_words,
+            self.max_chunk_tokens,
+            is_table=section.is_table
+        )
+        extracted_text = extraction_result["extracted_text"]
+        total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
+
+        # Derive metadata from Phase 1 (no LLM call!)
+        metadata = derive_metadata_from_structure(structure, section)
+
+        # Generate contextual prefix
+        prefix_result = self._generate_contextual_prefix(
+            document.document_id,
+            metadata.chapter_title,
+            metadata.section_title,
+            metadata.subsection_title,
+            extracted_text,
+            document.content
+        )
+        contextual_prefix = prefix_result["prefix"]
+        total_tokens_consumed += prefix_result.get("tokens_consumed", 0)
+
+        # Combine prefix with extracted text
+        chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+
+        # Count tokens
+        token_count = self.token_counter.count_tokens(chunk_text, self.model)
+
+        # Warn if token limit exceeded
+        if token_count > self.max_chunk_tokens * 3:
+            logger.debug("Chunk %r has %d tokens (>%d)", section.title, token_count, self.max_chunk_tokens * 3)
+
+        # Create chunk
+        chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
+        cache_hit = structure.metadata.get("cache_hit", False)
+
+        processing_metadata = ProcessingMetadata(
+            phase_1_model=structure.analysis_model,
+            phase_2_model=self.model,
+            cache_hit=cache_hit
+        )
+
+        chunk = Chunk(
+            chunk_id=chunk_id,
+            source_document=document.document_id,
+            chunk_text=chunk_text,
+            original_text=extracted_text,
+            contextual_prefix=contextual_prefix,
+            metadata=metadata,
+            token_count=token_count,
+            processing_metadata=processing_metadata
+        )
+
+        return chunk, total_tokens_consumed, False
 
     def _extract_section_text(
         self,
@@ -376,7 +514,8 @@ class ChunkExtractor:
     ) -> Dict[str, Any]:
         """Extract text for section using LLM (plain text output)."""
         # Build instructions with dynamic params
-        instructions = EXTRACTION_INSTRUCTIONS.format(
+        instructions = fast_format(
+            _EXTRACTION_COMPILED,
             section_title=section_title,
             section_summary=section_summary,
             max_tokens=max_tokens,
@@ -428,7 +567,8 @@ class ChunkExtractor:
             subsection_display = "no subsections"
 
         # Build instructions
-        instructions = PREFIX_INSTRUCTIONS.format(
+        instructions = fast_format(
+            _PREFIX_COMPILED,
             document_id=document_id,
             chapter_title=chapter_title,
             section_title=section_title,
@@ -8,17 +8,18 @@ Phase 2: Chunk Extraction (ChunkExtractor with Claude Haiku)
 It also handles validation, batch processing, and performance tracking.
 """
 
-import json
 import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from time import time as get_time
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from tqdm import tqdm
 
-from .chunk_extractor import ChunkExtractor
-from .llm_provider import LLMProvider
+from .chunk_extractor import ChunkExtractor, OUTPUT_MODE_PER_CHUNK, OUTPUT_MODES
+from .llm_provider import LLMProvider, OpenAIBatchProvider
 from .models import (
     BatchProcessingResult,
     BatchReport,
@@ -36,6 +37,10 @@ from .structure_analyzer import StructureAnalyzer
 from .text_aligner import TextAligner
 
 
+# Documents read and hashed ahead of the one being processed by process_folder
+DOCUMENT_PREFETCH = 2
+
+
 class ChunkingPipeline:
     """
     Main orchestrator for document chunking system.
@@ -53,7 +58,9 @@ class ChunkingPipeline:
         output_dir: Path,
         structure_model: str = "google/gemini-2.5-pro",
         extraction_model: str = "anthropic/claude-haiku-4.5",
-        max_chunk_tokens: int = 1000
+        max_chunk_tokens: int = 1000,
+        output_mode: str = OUTPUT_MODE_PER_CHUNK,
+        section_concurrency: int = 8
     ):
         """
         Initialize chunking pipeline.
@@ -64,12 +71,25 @@ class ChunkingPipeline:
             structure_model: Model for Phase 1 structure analysis (default: Gemini Pro)
             extraction_model: Model for Phase 2 chunk extraction (default: Claude Haiku)
             max_chunk_tokens: Maximum tokens per chunk (default: 1000)
+            output_mode: Chunk output layout, "per_chunk" or "jsonl" (default: per_chunk)
+            section_concurrency: Sections extracted in parallel per document (default: 8)
+
+        Raises:
+            ValueError: If output_mode is not one of OUTPUT_MODES (checked here so
+                a bad value fails before any Phase 1 call, not per document)
         """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(
+                f"output_mode must be one of {', '.join(OUTPUT_MODES)}, got '{output_mode}'"
+            )
+
         self.llm_provider = llm_provider
         self.output_dir = Path(output_dir)
         self.structure_model = structure_model
         self.extraction_model = extraction_model
         self.max_chunk_tokens = max_chunk_tokens
+        self.output_mode = output_mode
+        self.section_concurrency = section_concurrency
 
         # Initialize shared utilities
         self.token_counter = TokenCounter()
@@ -171,10 +191,112 @@ class ChunkingPipeline:
                     logger.error(f"Chunk extraction failed after {max_retries} attempts")
                     raise
 
+    def _analyze_marshaled(
+        self,
+        document_files: List[Path],
+        redo: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run Phase 1 for several documents through one marshaled LLM request.
+
+        Best effort: documents that fail to load, or are missing from the
+        batched result, are simply left out and get the regular per-document
+        analysis (with retries) in process_document().
+
+        Args:
+            document_files: Files in this group
+            redo: If True, bypass existing structure files
+
+        Returns:
+            Mapping document_id -> structure analysis result
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
+        documents = []
+        for doc_file in document_files:
+            try:
+                documents.append(Document.from_file(doc_file))
+            except Exception:
+                continue  # Reported when the document itself is processed
+
+        try:
+            return self.structure_analyzer.analyze_batch(documents, redo=redo)
+        except Exception as e:
+            logger.warning("Marshaled structure analysis failed, falling back to per-document: %s", e)
+            return {}
+
+    def analyze_with_batch_api(
+        self,
+        document_files: List[Path],
+        batch_provider: OpenAIBatchProvider,
+        redo: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run Phase 1 for many documents through the offline Batch API.
+
+        Documents that already have a structure file are loaded as usual; the
+        rest are submitted as one batch, and this call blocks until it
+        completes. Each structure is written to the same
+        {document_id}_structure.json a synchronous run writes (by
+        process_document), so later runs without --redo reuse it for free.
+
+        Args:
+            document_files: Files to analyze
+            batch_provider: Batch API client
+            redo: If True, ignore existing structure files
+
+        Returns:
+            Mapping document_id -> structure analysis result. Documents that
+            failed to load, errored in the batch, or failed to parse are left
+            out and get the regular synchronous analysis in process_document().
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, Document] = {}
+        for doc_file in document_files:
+            try:
+                document = Document.from_file(doc_file)
+            except Exception:
+                continue  # Reported when the document itself is processed
+            existing = None if redo else self.structure_analyzer.load_existing_structure(document)
+            if existing is not None:
+                results[document.document_id] = existing
+            else:
+                pending[document.document_id] = document
+
+        if not pending:
+            return results
+
+        requests_by_id = {
+            document_id: self.structure_analyzer.batch_request(document)
+            for document_id, document in pending.items()
+        }
+        jsonl_path = self.output_dir / "_batches" / f"structure_{uuid.uuid4().hex}.jsonl"
+        try:
+            responses = batch_provider.run_batch(requests_by_id, jsonl_path)
+        except Exception as e:
+            logger.warning("Batch API structure analysis failed, falling back to per-document: %s", e)
+            return results
+
+        for document_id, response in responses.items():
+            document = pending.get(document_id)
+            if document is None:
+                continue
+            try:
+                results[document_id] = self.structure_analyzer.result_from_response(document, response)
+            except StructureAnalysisError as e:
+                logger.warning("Batch structure for %s failed to parse: %s", document_id, e)
+
+        return results
+
     def process_document(
         self,
         document: Document,
-        redo: bool = False
+        redo: bool = False,
+        structure_result: Optional[Dict[str, Any]] = None
     ) -> ProcessingResult:
         """
         Process a single document through the 2-phase pipeline.
@@ -184,10 +306,13 @@ class ChunkingPipeline:
         - output_dir/{document_id}/{document_id}_chunk_001.json
         - output_dir/{document_id}/{document_id}_chunk_002.json
         - ...
+        (or output_dir/{document_id}/{document_id}_chunks.jsonl in jsonl mode)
 
         Args:
             document: Document to process
             redo: If True, bypass cache and force reprocessing (default: False)
+            structure_result: Phase 1 result obtained ahead of time (e.g. from a
+                marshaled batch); Phase 1 runs here when None
 
         Returns:
             ProcessingResult with chunks, metrics, and validation results
@@ -214,8 +339,9 @@ class ChunkingPipeline:
             # ================================================================
             # Phase 1: Structure Analysis (with retry logic for Gemini)
             # ================================================================
-            print(f"Analyzing structure for document: {document.document_id}")
-            structure_result = self._analyze_with_retry(document, redo=redo)
+            if structure_result is None:
+                print(f"Analyzing structure for document: {document.document_id}")
+                structure_result = self._analyze_with_retry(document, redo=redo)
 
             structure: Structure = structure_result["structure"]
             phase_1_tokens = structure_result.get("tokens_consumed", 0)
@@ -226,9 +352,7 @@ class ChunkingPipeline:
 
             # Save structure JSON to document output directory
             structure_file = doc_output_dir / f"{document.document_id}_structure.json"
-            structure_file.write_text(
-                json.dumps(structure.dict(), default=str, indent=2)
-            )
+            structure_file.write_bytes(structure.model_dump_json(indent=2).encode())
 
             # ================================================================
             # Phase 2: Chunk Extraction (with document-specific output)
@@ -240,7 +364,9 @@ class ChunkingPipeline:
                 model=self.extraction_model,
                 max_chunk_tokens=self.max_chunk_tokens,
                 output_dir=doc_output_dir,  # Document-specific output directory
-                document_id=document.document_id
+                document_id=document.document_id,
+                output_mode=self.output_mode,
+                max_concurrency=self.section_concurrency
             )
 
             extraction_result = self._extract_with_retry(
@@ -319,10 +445,110 @@ class ChunkingPipeline:
                     f"Unexpected error during document processing: {error_context}"
                 ) from e
 
+    def iter_chunks(
+        self,
+        document: Document,
+        redo: bool = False,
+        report: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Chunk]:
+        """
+        Run both phases on a document, yielding chunks as sections finish.
+
+        Streaming counterpart of process_document() for large documents: the
+        caller writes each chunk out and drops it, so memory holds one
+        section's chunk plus the original texts needed for the coverage check,
+        not the full chunk list. Phase 1 is retried as usual; Phase 2 is not,
+        since chunks already yielded cannot be taken back.
+
+        Args:
+            document: Document to process
+            redo: If True, bypass cache and force reprocessing (default: False)
+            report: Optional dict; once the iterator is exhausted it holds
+                total_chunks, phase_1_tokens, phase_2_tokens and
+                text_coverage_ratio
+
+        Yields:
+            Chunk objects in section order
+        """
+        doc_output_dir = self.output_dir / document.document_id
+        doc_output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Phase 1: Structure Analysis (with retry logic)
+        structure_result = self._analyze_with_retry(document, redo=redo)
+        structure: Structure = structure_result["structure"]
+
+        structure_file = doc_output_dir / f"{document.document_id}_structure.json"
+        structure_file.write_bytes(structure.model_dump_json(indent=2).encode())
+
+        # Phase 2: Chunk Extraction, streamed
+        chunk_extractor = ChunkExtractor(
+            llm_client=self.llm_provider,
+            token_counter=self.token_counter,
+            model=self.extraction_model,
+            max_chunk_tokens=self.max_chunk_tokens,
+            output_dir=doc_output_dir,
+            document_id=document.document_id,
+            output_mode=self.output_mode,
+            max_concurrency=self.section_concurrency
+        )
+
+        totals: Dict[str, Any] = {}
+        original_texts: List[str] = []
+        for chunk in chunk_extractor.iter_chunks(document, structure, redo=redo, totals=totals):
+            original_texts.append(chunk.original_text)
+            yield chunk
+
+        # Validation: Text Coverage (99% coverage required)
+        coverage_ratio, _ = TextAligner.verify_text_coverage(
+            original_text=document.content,
+            texts=original_texts,
+            min_coverage=0.99
+        )
+
+        if report is not None:
+            report.update({
+                "total_chunks": totals["total_chunks"],
+                "phase_1_tokens": structure_result.get("tokens_consumed", 0),
+                "phase_2_tokens": totals["tokens_consumed"],
+                "text_coverage_ratio": coverage_ratio
+            })
+
+    @staticmethod
+    def _prefetch_documents(
+        document_files: List[Path]
+    ) -> Iterator[Tuple[Path, "Future[Document]"]]:
+        """
+        Load documents on a background thread, DOCUMENT_PREFETCH ahead.
+
+        Reading and hashing the next files overlaps with the LLM calls for
+        the current one. Load errors surface from the future's result(), so
+        the caller attributes them to the right document.
+
+        Yields:
+            (path, future resolving to the loaded Document), in input order
+        """
+        files = iter(document_files)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque(
+                (doc_file, executor.submit(Document.from_file, doc_file))
+                for _, doc_file in zip(range(DOCUMENT_PREFETCH), files)
+            )
+            try:
+                while pending:
+                    next_file = next(files, None)
+                    if next_file is not None:
+                        pending.append((next_file, executor.submit(Document.from_file, next_file)))
+                    yield pending.popleft()
+            finally:
+                for _, loading in pending:
+                    loading.cancel()
+
     def process_folder(
         self,
         folder_path: Path,
-        redo: bool = False
+        redo: bool = False,
+        marshal_batch: int = 1,
+        batch_provider: Optional[OpenAIBatchProvider] = None
     ) -> BatchProcessingResult:
         """
         Process all documents in a folder (batch processing).
@@ -330,6 +556,11 @@ class ChunkingPipeline:
         Args:
             folder_path: Path to folder containing documents
             redo: If True, bypass cache and force reprocessing (default: False)
+            marshal_batch: Documents per Phase 1 request (default: 1). Values > 1
+                marshal that many documents into one structure-analysis prompt;
+                Phase 2 still runs per document.
+            batch_provider: If given, Phase 1 for the whole folder goes through
+                the offline Batch API first (marshal_batch is then ignored)
 
         Returns:
             BatchProcessingResult with aggregated metrics
@@ -367,16 +598,30 @@ class ChunkingPipeline:
         total_tokens_consumed = 0
         total_cache_hits = 0
 
-        for doc_file in tqdm(sorted(document_files)):
+        document_files = sorted(document_files)
+        structure_results: Dict[str, Dict[str, Any]] = {}
+        if batch_provider is not None:
+            structure_results = self.analyze_with_batch_api(document_files, batch_provider, redo=redo)
+            marshal_batch = 1
+
+        prefetched = self._prefetch_documents(document_files)
+        for index, (doc_file, loading) in enumerate(tqdm(prefetched, total=len(document_files))):
             print(f"Processing document: {doc_file.name}")
             try:
-                # Load document
-                document = Document.from_file(doc_file)
+                # Phase 1 for the next group of documents in one request
+                if marshal_batch > 1 and index % marshal_batch == 0:
+                    structure_results = self._analyze_marshaled(
+                        document_files[index:index + marshal_batch], redo=redo
+                    )
+
+                # Load document (read and hashed in the background)
+                document = loading.result()
 
                 # Process document
                 result = self.process_document(
                     document=document,
-                    redo=redo
+                    redo=redo,
+                    structure_result=structure_results.get(document.document_id)
                 )
 
                 # Accumulate results
@@ -396,6 +641,7 @@ class ChunkingPipeline:
                     f"Processed: {len(results)}/{len(document_files)} | "
                     f"Error: {type(e).__name__}: {str(e)}"
                 )
+                prefetched.close()
                 raise ChunkExtractionError(batch_context) from e
 
         # ================================================================
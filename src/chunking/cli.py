@@ -14,10 +14,7 @@ import typer
 from dotenv import load_dotenv
 from rich.console import Console
 
-from .chunking_pipeline import ChunkingPipeline
-from .llm_provider import OpenRouterProvider
 from .logger import setup_logging
-from .models import Document
 
 # Initialize
 console = Console()
@@ -83,7 +80,37 @@ def process(
             "--log-level",
             help="Logging level (DEBUG, INFO, WARNING, ERROR)"
         )
-    ] = "INFO"
+    ] = "INFO",
+    output_mode: Annotated[
+        str,
+        typer.Option(
+            "--output-mode",
+            help="'per_chunk' (one JSON per chunk, resumable) or 'jsonl' (one file per document)"
+        )
+    ] = "per_chunk",
+    marshal_batch: Annotated[
+        int,
+        typer.Option(
+            "--marshal-batch",
+            help="Documents per structure-analysis request when processing a folder",
+            min=1
+        )
+    ] = 1,
+    batch_api: Annotated[
+        bool,
+        typer.Option(
+            "--batch-api",
+            help="Run structure analysis through the OpenAI Batch API (~50% cost, up to 24h; needs OPENAI_API_KEY and an openai/ structure model)"
+        )
+    ] = False,
+    section_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--section-concurrency",
+            help="Sections extracted in parallel per document",
+            min=1
+        )
+    ] = 8
 ):
     """
     Process documents into contextual chunks using 2-phase pipeline.
@@ -98,6 +125,7 @@ def process(
             ├── document_id_chunk_001.json
             ├── document_id_chunk_002.json
             └── ...
+        (--output-mode jsonl writes document_id_chunks.jsonl instead of chunk files)
 
     Examples:
         # Process single file
@@ -115,7 +143,19 @@ def process(
 
         # Force reprocess
         python -m src.chunking.cli process --input chapter1.txt --output output/ --redo
+
+        # Analyze structure for 4 short documents per request
+        python -m src.chunking.cli process --input book/ --output output/ --marshal-batch 4
+
+        # Offline run: structure analysis via the OpenAI Batch API
+        python -m src.chunking.cli process --input book/ --output output/ \\
+            --structure-model openai/gpt-4o --batch-api
     """
+    # Deferred so `--help` and argument errors do not load pydantic / requests
+    from .chunking_pipeline import ChunkingPipeline
+    from .llm_provider import OpenAIBatchProvider, OpenRouterProvider
+    from .models import Document
+
     # Setup environment
     load_dotenv()
     api_key = os.getenv("OPENROUTER_API_KEY")
@@ -124,6 +164,17 @@ def process(
         console.print("Please set OPENROUTER_API_KEY in .env file or environment variables")
         raise typer.Exit(2)
 
+    batch_provider = None
+    if batch_api:
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            console.print("[red]Error:[/red] --batch-api requires OPENAI_API_KEY")
+            raise typer.Exit(2)
+        if not structure_model.startswith("openai/"):
+            console.print("[red]Error:[/red] --batch-api requires an openai/ structure model")
+            raise typer.Exit(2)
+        batch_provider = OpenAIBatchProvider(api_key=openai_api_key)
+
     # Setup logging
     logger = setup_logging(log_level, use_context=False)
 
@@ -140,13 +191,19 @@ def process(
     console.print(f"[dim]Max tokens: {max_tokens}[/dim]")
     console.print(f"[dim]Output: {output_dir}[/dim]\n")
 
-    pipeline = ChunkingPipeline(
-        llm_provider=llm_provider,
-        output_dir=output_dir,
-        structure_model=structure_model,
-        extraction_model=extraction_model,
-        max_chunk_tokens=max_tokens
-    )
+    try:
+        pipeline = ChunkingPipeline(
+            llm_provider=llm_provider,
+            output_dir=output_dir,
+            structure_model=structure_model,
+            extraction_model=extraction_model,
+            max_chunk_tokens=max_tokens,
+            output_mode=output_mode,
+            section_concurrency=section_concurrency
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(2)
 
     # Process input
     if input_path.is_file():
@@ -154,7 +211,12 @@ def process(
         console.print(f"[cyan]Processing file: {input_path.name}[/cyan]\n")
 
         document = Document.from_file(input_path)
-        result = pipeline.process_document(document, redo=redo)
+        structure_result = None
+        if batch_provider is not None:
+            structure_result = pipeline.analyze_with_batch_api(
+                [input_path], batch_provider, redo=redo
+            ).get(document.document_id)
+        result = pipeline.process_document(document, redo=redo, structure_result=structure_result)
 
         # Print results
         console.print(f"\n[green]✓[/green] Processed: {result.document_id}")
@@ -174,7 +236,12 @@ def process(
         # Folder processing
         console.print(f"[cyan]Processing folder: {input_path}[/cyan]\n")
 
-        result = pipeline.process_folder(input_path, redo=redo)
+        result = pipeline.process_folder(
+            input_path,
+            redo=redo,
+            marshal_batch=marshal_batch,
+            batch_provider=batch_provider
+        )
 
         # Print results
         console.print("\n[green]✓[/green] Batch complete")
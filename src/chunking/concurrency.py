@@ -0,0 +1,71 @@
+"""
+Ordered thread-pool fan-out for per-section LLM work.
+
+Shared by the production extractor and the V2 / V3 research extractors, which
+all extract sections independently but must emit chunks in section order.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_in_order(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    window: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Run fn over items on a thread pool, yielding results in item order.
+
+    The first item runs alone before the rest fan out, so its LLM call writes
+    the provider's prompt cache (the shared document prefix) before the other
+    sections try to read it. Up to window items (default: 2 * max_workers)
+    are submitted ahead of the one being yielded, so finished results waiting
+    behind a slow item stay bounded.
+
+    If fn raises, or the caller stops iterating early, items that have not
+    started yet are cancelled and running ones are waited for; fn's exception
+    propagates unchanged.
+
+    Args:
+        fn: Work for one item (called from worker threads)
+        items: Items to process
+        max_workers: Thread pool size
+        window: Max items submitted but not yet yielded
+
+    Yields:
+        fn(item) for each item, in item order
+    """
+    items = iter(items)
+    for first in items:
+        yield fn(first)
+        break
+    else:
+        return
+
+    max_workers = max(1, max_workers)
+    window = window or 2 * max_workers
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures: Deque[Future] = deque()
+
+    def submit_next() -> None:
+        for item in items:
+            futures.append(executor.submit(fn, item))
+            return
+
+    try:
+        for _ in range(window):
+            submit_next()
+        while futures:
+            future = futures.popleft()
+            submit_next()
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -5,13 +5,24 @@ This module provides abstraction over LLM APIs with concrete implementations
 for OpenRouter and testing.
 """
 
+import json
+import logging
+import time
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .models import LLMProviderError
 
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds: fail fast on a dead host without
+# cutting off slow completions
+REQUEST_TIMEOUT = (10, 60)
+
 
 # ============================================================================
 # Abstract Interface
@@ -58,7 +69,8 @@ class OpenRouterProvider(LLMProvider):
         api_key: str,
         base_url: str = "https://openrouter.ai/api/v1",
         enable_prompt_caching: bool = True,
-        cache_ttl: int = 3600
+        cache_ttl: int = 3600,
+        max_connections: int = 32
     ):
         """
         Initialize OpenRouter provider.
@@ -68,12 +80,45 @@ class OpenRouterProvider(LLMProvider):
             base_url: API base URL (default: https://openrouter.ai/api/v1)
             enable_prompt_caching: Enable prompt caching via Cache-Control headers
             cache_ttl: Cache TTL in seconds (default: 3600 = 1 hour)
+            max_connections: Keep-alive connections pooled for concurrent calls (default: 32)
         """
         self.api_key = api_key
         self.base_url = base_url
         self.enable_prompt_caching = enable_prompt_caching
         self.cache_ttl = cache_ttl
 
+        # Pooled keep-alive session: concurrent calls reuse TLS connections
+        # instead of a new handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # Add prompt caching headers if enabled
+        if self.enable_prompt_caching:
+            self._session.headers["Cache-Control"] = f"max-age={self.cache_ttl}"
+
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection ahead of the first completion.
+
+        Moves the TCP + TLS handshake off the first request's critical path.
+        Best effort: failures are ignored and surface on the real call instead.
+        """
+        try:
+            self._session.head(self.base_url, timeout=REQUEST_TIMEOUT[0])
+        except requests.exceptions.RequestException as e:
+            logger.debug("OpenRouter warm-up failed: %s", e)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
     def chat_completion(
         self,
         model: str,
@@ -84,15 +129,6 @@ class OpenRouterProvider(LLMProvider):
 
         # TODO: check how caching works on OpenRouter side
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        # Add prompt caching headers if enabled
-        if self.enable_prompt_caching:
-            headers["Cache-Control"] = f"max-age={self.cache_ttl}"
-
         payload = {
             "model": model,
             "messages": messages,
@@ -100,11 +136,10 @@ class OpenRouterProvider(LLMProvider):
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 json=payload,
-                headers=headers,
-                timeout=60  # 60 second timeout
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             return response.json()
@@ -126,7 +161,7 @@ class OpenRouterProvider(LLMProvider):
 
         except requests.exceptions.Timeout as e:
             raise LLMProviderError(
-                "OpenRouter API timeout after 60 seconds"
+                f"OpenRouter API timeout (connect {REQUEST_TIMEOUT[0]}s, read {REQUEST_TIMEOUT[1]}s)"
             ) from e
 
         except requests.exceptions.RequestException as e:
@@ -140,6 +175,203 @@ class OpenRouterProvider(LLMProvider):
             ) from e
 
 
+# ============================================================================
+# OpenAI Batch API (offline runs)
+# ============================================================================
+
+
+# Terminal states of an OpenAI batch
+BATCH_DONE_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Default overall wait for a batch: the 24h completion window plus margin for
+# the service to move an expiring batch into a terminal state
+BATCH_MAX_WAIT = 26 * 3600.0
+
+
+class OpenAIBatchProvider:
+    """
+    OpenAI Batch API client for non-interactive runs.
+
+    Requests are uploaded as one JSONL file and completed asynchronously
+    within 24 hours at roughly half the synchronous price. Results come back
+    in the same OpenAI-compatible format chat_completion() returns, keyed by
+    each request's custom_id.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+        max_wait: float = BATCH_MAX_WAIT
+    ):
+        """
+        Initialize batch provider.
+
+        Args:
+            api_key: OpenAI API key
+            base_url: API base URL (default: https://api.openai.com/v1)
+            poll_interval: First wait between status checks in seconds (default: 30)
+            max_poll_interval: Cap for the exponential poll backoff (default: 600)
+            max_wait: Overall seconds to wait for one batch (default: 26h)
+        """
+        self.base_url = base_url
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_wait = max_wait
+
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+    @staticmethod
+    def native_model(model: str) -> str:
+        """
+        Map an OpenRouter-style model id to the OpenAI one ("openai/gpt-4o" -> "gpt-4o").
+
+        Raises:
+            LLMProviderError: If the model belongs to another vendor
+        """
+        vendor, _, name = model.rpartition("/")
+        if vendor and vendor != "openai":
+            raise LLMProviderError(f"OpenAI Batch API cannot serve model: {model}")
+        return name
+
+    def write_requests(self, requests_by_id: Dict[str, Dict[str, Any]], jsonl_path: Path) -> Path:
+        """
+        Write chat-completion request bodies as a batch input file.
+
+        Args:
+            requests_by_id: custom_id -> request body ({"model", "messages", ...})
+            jsonl_path: Destination file
+
+        Returns:
+            jsonl_path
+        """
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        with jsonl_path.open("w", encoding="utf-8") as f:
+            for custom_id, body in requests_by_id.items():
+                body = {**body, "model": self.native_model(body["model"])}
+                f.write(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }) + "\n")
+        return jsonl_path
+
+    def submit_batch(self, jsonl_path: Path) -> str:
+        """
+        Upload a batch input file and create the batch.
+
+        Returns:
+            Batch ID
+
+        Raises:
+            LLMProviderError: If upload or creation fails
+        """
+        with jsonl_path.open("rb") as f:
+            upload = self._request(
+                "post", "/files", files={"file": (jsonl_path.name, f)}, data={"purpose": "batch"}
+            )
+        batch = self._request("post", "/batches", json={
+            "input_file_id": upload["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        })
+        logger.info("Submitted batch %s (%s)", batch["id"], jsonl_path.name)
+        return batch["id"]
+
+    def wait_for_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Poll a batch with exponential backoff until it reaches a terminal state.
+
+        Gives up after max_wait seconds, so a batch stuck in an unknown or
+        missing status cannot block the run indefinitely.
+
+        Returns:
+            Final batch object
+
+        Raises:
+            LLMProviderError: If the batch does not complete, or max_wait elapses first
+        """
+        deadline = time.monotonic() + self.max_wait
+        delay = self.poll_interval
+        while True:
+            batch = self._request("get", f"/batches/{batch_id}")
+            status = batch.get("status")
+            if status in BATCH_DONE_STATUSES:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMProviderError(
+                    f"Batch {batch_id} still {status} after {self.max_wait:.0f}s"
+                )
+            logger.info("Batch %s is %s, checking again in %.0fs", batch_id, status, delay)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_poll_interval)
+
+        if status != "completed":
+            raise LLMProviderError(f"Batch {batch_id} ended with status: {status}")
+        return batch
+
+    def download_results(self, batch: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Download a completed batch's output.
+
+        Returns:
+            custom_id -> chat completion response (requests that errored are omitted)
+
+        Raises:
+            LLMProviderError: If the download fails or the output is not valid JSONL
+        """
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            return {}
+
+        text = self._request("get", f"/files/{output_file_id}/content", raw=True)
+        results: Dict[str, Dict[str, Any]] = {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise LLMProviderError(
+                    f"OpenAI Batch API returned invalid output for batch {batch.get('id')}: {str(e)}"
+                ) from e
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[record["custom_id"]] = response["body"]
+            else:
+                logger.warning("Batch request %s failed: %s", record.get("custom_id"), record.get("error"))
+        return results
+
+    def run_batch(self, requests_by_id: Dict[str, Dict[str, Any]], jsonl_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Write, submit, wait for and download one batch (blocking)."""
+        self.write_requests(requests_by_id, jsonl_path)
+        batch = self.wait_for_batch(self.submit_batch(jsonl_path))
+        return self.download_results(batch)
+
+    def _request(self, method: str, path: str, raw: bool = False, **kwargs) -> Any:
+        """Call the OpenAI API, wrapping failures in LLMProviderError."""
+        try:
+            response = self._session.request(
+                method, f"{self.base_url}{path}", timeout=REQUEST_TIMEOUT, **kwargs
+            )
+            response.raise_for_status()
+            return response.text if raw else response.json()
+        except requests.exceptions.RequestException as e:
+            raise LLMProviderError(f"OpenAI Batch API request failed ({path}): {str(e)}") from e
+        except ValueError as e:
+            # Non-JSON body (older requests versions raise a bare ValueError)
+            raise LLMProviderError(f"OpenAI Batch API returned invalid JSON ({path}): {str(e)}") from e
+
+
 # ============================================================================
 # Mock Implementation (for Testing)
 # ============================================================================
@@ -6,12 +6,15 @@ strict validation and type safety.
 """
 
 import hashlib
+import mmap
+import os
 import re
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 
 
 # ============================================================================
@@ -70,15 +73,56 @@ class Document(BaseModel):
     file_hash: str
     encoding: str = "utf-8"
 
-    class Config:
-        frozen = True  # Immutable
+    model_config = ConfigDict(frozen=True)  # Immutable
 
     @classmethod
     def from_file(cls, file_path: Path) -> "Document":
-        """Create Document from file path"""
-        content = file_path.read_text(encoding="utf-8")
+        """Create Document from file path.
+
+        Loaded documents are memoized per process, keyed by path, mtime and
+        size, so repeated runs over the same file (e.g. trying several models
+        in one session) skip re-reading, re-decoding and re-hashing it. An
+        edited file gets a new key and is read again.
+
+        Nothing is persisted across runs: every run has to read the content
+        anyway, so an on-disk hash would only save the sha256 pass, and a
+        (path, mtime, size) key kept on disk goes stale after an edit that
+        preserves both.
+        """
+        file_path = Path(file_path)
+        if cls is not Document:
+            return cls._load(file_path)
+        stat = file_path.stat()
+        return _load_document(
+            str(file_path), str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+
+    @classmethod
+    def _load(cls, file_path: Path) -> "Document":
+        """Read, decode and hash a document file (uncached)
+
+        The file is memory-mapped and decoded / hashed straight from the
+        mapping, so no re-encoded copy of the text is built just for hashing.
+        The hash is over the same bytes as before (sha256 of the UTF-8 text),
+        which keeps existing structure caches valid. Files containing '\\r'
+        get the same newline translation read_text() applied, and are hashed
+        from the translated text.
+        """
+        content = ""
+        file_hash = None
+        with file_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = str(mapped, "utf-8")
+                    if mapped.find(b"\r") < 0:
+                        file_hash = hashlib.sha256(mapped).hexdigest()
+                    else:
+                        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        if file_hash is None:
+            file_hash = hashlib.sha256(content.encode()).hexdigest()
+
         document_id = file_path.stem  # filename without extension
-        file_hash = hashlib.sha256(content.encode()).hexdigest()
         return cls(
             file_path=file_path,
             content=content,
@@ -94,6 +138,16 @@ class Document(BaseModel):
         return v
 
 
+# Documents are frozen, so one cached instance can be shared safely
+DOCUMENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _load_document(path: str, resolved: str, mtime_ns: int, size: int) -> Document:
+    """Load a Document; the resolved path, mtime and size only key the cache"""
+    return Document._load(Path(path))
+
+
 class Section(BaseModel):
     """Section within document structure with word-based boundary markers.
 
@@ -115,8 +169,7 @@ class Section(BaseModel):
     end_words: str = Field(default="", max_length=1000)
     is_table: bool = False  # True if this segment is a table
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     # @field_validator('summary')
     # @classmethod
@@ -194,13 +247,12 @@ class Structure(BaseModel):
     document_id: str
     chapter_title: str = Field(..., min_length=1)
     chapter_number: Optional[int] = Field(None, ge=1)
-    sections: List[Section] = Field(..., min_items=1)
+    sections: List[Section] = Field(..., min_length=1)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     analysis_model: str
     analyzed_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('sections')
     @classmethod
@@ -221,8 +273,7 @@ class ChunkMetadata(BaseModel):
     subsection_title: List[str] = Field(default_factory=list)
     summary: str = Field(..., min_length=10, max_length=500)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('summary')
     @classmethod
@@ -249,8 +300,7 @@ class ProcessingMetadata(BaseModel):
     cache_hit: bool = False  # Was structure cached?
     processing_time_ms: Optional[int] = None
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class Chunk(BaseModel):
@@ -265,8 +315,7 @@ class Chunk(BaseModel):
     token_count: int = Field(..., ge=1)  # No upper limit - allow any token count for analysis
     processing_metadata: ProcessingMetadata
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('chunk_text', 'original_text')
     @classmethod
@@ -295,23 +344,21 @@ class ProcessingReport(BaseModel):
     cache_hits: int
     errors: List[str] = Field(default_factory=list)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class ProcessingResult(BaseModel):
     """Complete output from processing a single document"""
 
     document_id: str
-    chunks: List[Chunk] = Field(..., min_items=1)
+    chunks: List[Chunk] = Field(..., min_length=1)
     structure: Structure
     text_coverage_ratio: float = Field(..., ge=0.0, le=1.0)
     total_chunks: int
     total_tokens: int
     processing_report: ProcessingReport
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('total_chunks')
     @classmethod
@@ -332,8 +379,7 @@ class BatchReport(BaseModel):
     average_chunks_per_document: float
     errors_by_document: Dict[str, List[str]] = Field(default_factory=dict)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     def cache_hit_rate(self) -> float:
         """
@@ -385,8 +431,7 @@ class BatchProcessingResult(BaseModel):
     total_chunks: int
     batch_report: BatchReport
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
     @field_validator('successful_documents')
     @classmethod
@@ -407,6 +452,41 @@ class TokenCounter:
     def __init__(self):
         self._tiktoken_cache = {}
 
+    def _get_encoding(self, model: str):
+        """
+        Get cached tiktoken encoding for model.
+
+        Args:
+            model: Model name (e.g., "openai/gpt-4o")
+
+        Returns:
+            tiktoken Encoding, or None if the model is not OpenAI or tiktoken is unavailable
+        """
+        # Only use tiktoken for OpenAI models
+        if "openai" not in model.lower() and "gpt" not in model.lower():
+            return None
+
+        try:
+            import tiktoken
+        except ImportError:
+            # tiktoken not available, fall back to character-based
+            return None
+
+        # Cache encoding for performance
+        if model not in self._tiktoken_cache:
+            # Extract base model name (e.g., "gpt-4o" from "openai/gpt-4o")
+            base_model = model.split("/")[-1] if "/" in model else model
+
+            try:
+                encoding = tiktoken.encoding_for_model(base_model)
+            except KeyError:
+                # Fallback to cl100k_base for unknown models
+                encoding = tiktoken.get_encoding("cl100k_base")
+
+            self._tiktoken_cache[model] = encoding
+
+        return self._tiktoken_cache[model]
+
     def count_tokens(self, text: str, model: str) -> int:
         """
         Count tokens in text for given model.
@@ -418,30 +498,49 @@ class TokenCounter:
         Returns:
             Token count
         """
-        # Try tiktoken for OpenAI models
-        if "openai" in model.lower() or "gpt" in model.lower():
-            try:
-                import tiktoken
+        encoding = self._get_encoding(model)
+        if encoding is not None:
+            # Ordinary encoding: no special-token scan (chunk text is plain text)
+            return len(encoding.encode_ordinary(text))
+
+        # Conservative fallback: 1 token ≈ 4 characters
+        return len(text) // 4
+
+    def count_tokens_parts(self, parts: List[str], model: str) -> int:
+        """
+        Count tokens across several text parts without concatenating them.
+
+        Each part is encoded separately, so the result can differ by a few tokens
+        from count_tokens on the joined string (no merges across part boundaries).
+
+        Args:
+            parts: Text parts (e.g., [prefix, "\n\n", text])
+            model: Model name (e.g., "openai/gpt-4o")
 
-                # Cache encoding for performance
-                if model not in self._tiktoken_cache:
-                    # Extract base model name (e.g., "gpt-4o" from "openai/gpt-4o")
-                    base_model = model.split("/")[-1] if "/" in model else model
+        Returns:
+            Total token count
+        """
+        encoding = self._get_encoding(model)
+        if encoding is not None:
+            return sum(len(tokens) for tokens in encoding.encode_ordinary_batch(parts))
 
-                    try:
-                        encoding = tiktoken.encoding_for_model(base_model)
-                    except KeyError:
-                        # Fallback to cl100k_base for unknown models
-                        encoding = tiktoken.get_encoding("cl100k_base")
+        # Conservative fallback: 1 token ≈ 4 characters
+        return sum(len(part) for part in parts) // 4
 
-                    self._tiktoken_cache[model] = encoding
+    def count_tokens_batch(self, texts: List[str], model: str) -> List[int]:
+        """
+        Count tokens for several texts with one batched tokenizer call.
 
-                encoding = self._tiktoken_cache[model]
-                return len(encoding.encode(text))
+        Args:
+            texts: Texts to count tokens for
+            model: Model name (e.g., "openai/gpt-4o")
 
-            except ImportError:
-                # tiktoken not available, fall back to character-based
-                pass
+        Returns:
+            Token count per text, in input order
+        """
+        encoding = self._get_encoding(model)
+        if encoding is not None:
+            return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
 
         # Conservative fallback: 1 token ≈ 4 characters
-        return len(text) // 4
+        return [len(text) // 4 for text in texts]
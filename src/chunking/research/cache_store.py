@@ -15,10 +15,17 @@ implementation for structure analysis results.
 """
 
 import json
+import logging
+import os
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Abstract Interface
@@ -58,23 +65,64 @@ class CacheStore(ABC):
 # ============================================================================
 
 
+# Concurrent unlinks when clearing the file cache
+CLEAR_WORKERS = 16
+
+
+def _cache_entries(directory: Path, suffix: str) -> List[os.DirEntry]:
+    """List the cache files in directory with os.scandir (no extra stat per name)"""
+    with os.scandir(directory) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+
+def _total_size(entries: List[os.DirEntry]) -> int:
+    """Sum file sizes, skipping files removed since they were listed"""
+    total = 0
+    for entry in entries:
+        try:
+            total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _unlink(path: str) -> bool:
+    """Delete one cache file; False if it could not be removed"""
+    try:
+        os.unlink(path)
+    except OSError:
+        return False
+    return True
+
+
 class FileCacheStore(CacheStore):
     """File-based cache implementation using JSON files with content-hash based keys"""
 
     def __init__(
         self,
-        cache_dir: Path = Path(".cache")
+        cache_dir: Path = Path(".cache"),
+        memory_cache_size: int = 512
     ):
         """
         Initialize file cache store.
 
         Args:
             cache_dir: Root directory for cache files (default: .cache)
+            memory_cache_size: Max LLM responses kept in the in-process LRU
+                layer in front of the response files (default: 512, 0 disables)
         """
         self.cache_dir = cache_dir
         self.structures_dir = cache_dir / "structures"
         self.llm_responses_dir = cache_dir / "llm_responses"
 
+        # In-process LRU of raw LLM responses (key -> response text)
+        self.memory_cache_size = memory_cache_size
+        self._llm_response_memory: "OrderedDict[str, str]" = OrderedDict()
+        self._llm_response_memory_lock = threading.Lock()
+
         # Create cache directories
         self.structures_dir.mkdir(parents=True, exist_ok=True)
         self.llm_responses_dir.mkdir(parents=True, exist_ok=True)
@@ -123,25 +171,21 @@ class FileCacheStore(CacheStore):
         Returns:
             Number of files deleted
         """
-        deleted_count = 0
-
-        # Clear structure cache
-        for cache_file in self.structures_dir.glob("*.json"):
-            try:
-                cache_file.unlink()
-                deleted_count += 1
-            except OSError:
-                pass
-
-        # Clear LLM response cache
-        for cache_file in self.llm_responses_dir.glob("*.txt"):
-            try:
-                cache_file.unlink()
-                deleted_count += 1
-            except OSError:
-                pass
-
-        return deleted_count
+        with self._llm_response_memory_lock:
+            self._llm_response_memory.clear()
+
+        cache_files = [
+            entry.path
+            for entries in (
+                _cache_entries(self.structures_dir, ".json"),
+                _cache_entries(self.llm_responses_dir, ".txt")
+            )
+            for entry in entries
+        ]
+
+        # Unlinks are latency-bound metadata operations, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=CLEAR_WORKERS) as executor:
+            return sum(executor.map(_unlink, cache_files))
 
     def get_llm_response(self, key: str) -> Optional[str]:
         """
@@ -153,13 +197,22 @@ class FileCacheStore(CacheStore):
         Returns:
             Raw LLM response text or None if not found
         """
+        # Check in-process layer first
+        with self._llm_response_memory_lock:
+            response = self._llm_response_memory.get(key)
+            if response is not None:
+                self._llm_response_memory.move_to_end(key)
+                return response
+
         cache_file = self.llm_responses_dir / f"{key}.txt"
 
         if cache_file.exists():
             try:
-                return cache_file.read_text(encoding="utf-8")
+                response = cache_file.read_text(encoding="utf-8")
             except (IOError, UnicodeDecodeError):
                 return None
+            self._remember_llm_response(key, response)
+            return response
 
         return None
 
@@ -180,6 +233,19 @@ class FileCacheStore(CacheStore):
             # Caching is optional, should not break the pipeline
             pass
 
+        self._remember_llm_response(key, response)
+
+    def _remember_llm_response(self, key: str, response: str) -> None:
+        """Store response in the in-process LRU, evicting the oldest entry if full."""
+        if self.memory_cache_size <= 0:
+            return
+
+        with self._llm_response_memory_lock:
+            self._llm_response_memory[key] = response
+            self._llm_response_memory.move_to_end(key)
+            if len(self._llm_response_memory) > self.memory_cache_size:
+                self._llm_response_memory.popitem(last=False)
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -187,22 +253,11 @@ class FileCacheStore(CacheStore):
         Returns:
             Dict with cache stats (file_count, total_size_bytes)
         """
-        structure_files = list(self.structures_dir.glob("*.json"))
-        llm_response_files = list(self.llm_responses_dir.glob("*.txt"))
-
-        structure_size = 0
-        for cache_file in structure_files:
-            try:
-                structure_size += cache_file.stat().st_size
-            except (IOError, OSError):
-                continue
+        structure_files = _cache_entries(self.structures_dir, ".json")
+        llm_response_files = _cache_entries(self.llm_responses_dir, ".txt")
 
-        llm_response_size = 0
-        for cache_file in llm_response_files:
-            try:
-                llm_response_size += cache_file.stat().st_size
-            except (IOError, OSError):
-                continue
+        structure_size = _total_size(structure_files)
+        llm_response_size = _total_size(llm_response_files)
 
         return {
             "structure_files": len(structure_files),
@@ -212,3 +267,432 @@ class FileCacheStore(CacheStore):
             "total_size_bytes": structure_size + llm_response_size,
             "cache_dir": str(self.cache_dir)
         }
+
+
+# ============================================================================
+# Single-File (SQLite) Implementation
+# ============================================================================
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    Single-file cache backed by SQLite in WAL mode with memory-mapped reads.
+
+    Drop-in alternative to FileCacheStore for large caches: one indexed lookup
+    per key instead of a filesystem stat + open + read, and crash-safe writes.
+    Safe to share across the extractor's worker threads.
+    """
+
+    def __init__(self, db_path: Path = Path(".cache/cache.sqlite3"), mmap_size: int = 2**30):
+        """
+        Initialize SQLite cache store.
+
+        Args:
+            db_path: Path of the cache database file (default: .cache/cache.sqlite3)
+            mmap_size: Bytes of the database file to memory-map for reads (default: 1 GiB)
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS structures (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _get_value(self, table: str, key: str) -> Optional[str]:
+        """Read one value from table, or None if absent."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_value(self, table: str, key: str, value: str) -> None:
+        """Insert or replace one value in table."""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, value) VALUES (?, ?)", (key, value)
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached structure by key."""
+        value = self._get_value("structures", key)
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            # Invalid cache entry, return None
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store structure in cache."""
+        try:
+            self._set_value("structures", key, json.dumps(value, default=str))
+        except (sqlite3.Error, TypeError):
+            # Caching is optional, should not break the pipeline
+            pass
+
+    def get_llm_response(self, key: str) -> Optional[str]:
+        """Retrieve cached raw LLM response by key."""
+        return self._get_value("llm_responses", key)
+
+    def set_llm_response(self, key: str, response: str) -> None:
+        """Store raw LLM response in cache."""
+        try:
+            self._set_value("llm_responses", key, response)
+        except sqlite3.Error:
+            # Caching is optional, should not break the pipeline
+            pass
+
+    def clear(self) -> int:
+        """
+        Clear all cached entries (structures and LLM responses).
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            deleted_count = self._conn.execute("DELETE FROM structures").rowcount
+            deleted_count += self._conn.execute("DELETE FROM llm_responses").rowcount
+            self._conn.commit()
+        return deleted_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry counts and sizes (same keys as FileCacheStore)
+        """
+        with self._lock:
+            structure_files, structure_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM structures"
+            ).fetchone()
+            llm_response_files, llm_response_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM llm_responses"
+            ).fetchone()
+
+        return {
+            "structure_files": structure_files,
+            "llm_response_files": llm_response_files,
+            "structure_size_bytes": structure_size,
+            "llm_response_size_bytes": llm_response_size,
+            "total_size_bytes": structure_size + llm_response_size,
+            "cache_dir": str(self.db_path)
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# Shared (Redis) Implementation
+# ============================================================================
+
+
+class RedisCacheStore(CacheStore):
+    """
+    Cache shared across processes and machines through a Redis server.
+
+    Concurrent runs over the same corpus (CI fan-out, several people) reuse
+    each other's structures and LLM responses instead of each paying for the
+    calls. Entries expire after ttl_seconds. Requires the optional `redis`
+    package.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        ttl_seconds: Optional[int] = 7 * 24 * 3600,
+        key_prefix: str = "chunking:"
+    ):
+        """
+        Initialize Redis cache store.
+
+        Args:
+            redis_url: Redis connection URL (default: redis://localhost:6379/0)
+            ttl_seconds: Expiry for new entries (default: 7 days, None keeps forever)
+            key_prefix: Namespace for this cache's keys (default: "chunking:")
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisCacheStore requires the optional redis package "
+                "(poetry install -E redis, or pip install redis)"
+            ) from e
+
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._errors = (redis.RedisError,)
+        # Client is thread-safe (connection pool), so the extractor's workers can share it
+        self._client = redis.Redis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, kind: str, key: str) -> str:
+        """Namespaced Redis key for a structure or LLM response."""
+        return f"{self.key_prefix}{kind}:{key}"
+
+    def _get_value(self, kind: str, key: str) -> Optional[str]:
+        """Read one value, or None if absent or Redis is unreachable."""
+        try:
+            return self._client.get(self._key(kind, key))
+        except self._errors:
+            return None
+
+    def _set_value(self, kind: str, key: str, value: str) -> None:
+        """Write one value with the configured TTL."""
+        try:
+            self._client.set(self._key(kind, key), value, ex=self.ttl_seconds)
+        except self._errors:
+            # Caching is optional, should not break the pipeline
+            pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached structure by key."""
+        value = self._get_value("structures", key)
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            # Invalid cache entry, return None
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store structure in cache."""
+        try:
+            self._set_value("structures", key, json.dumps(value, default=str))
+        except TypeError:
+            # Caching is optional, should not break the pipeline
+            pass
+
+    def get_llm_response(self, key: str) -> Optional[str]:
+        """Retrieve cached raw LLM response by key."""
+        return self._get_value("llm_responses", key)
+
+    def set_llm_response(self, key: str, response: str) -> None:
+        """Store raw LLM response in cache."""
+        self._set_value("llm_responses", key, response)
+
+    def _scan_keys(self, kind: str) -> List[str]:
+        """All keys of one kind under this store's prefix."""
+        return list(self._client.scan_iter(match=self._key(kind, "*"), count=1000))
+
+    def clear(self) -> int:
+        """
+        Clear all cached entries under this store's prefix.
+
+        Returns:
+            Number of entries deleted (those deleted before any Redis error)
+        """
+        deleted_count = 0
+        try:
+            for kind in ("structures", "llm_responses"):
+                keys = self._scan_keys(kind)
+                if keys:
+                    deleted_count += self._client.delete(*keys)
+        except self._errors as e:
+            logger.warning("Redis cache clear failed after %d entries: %s", deleted_count, e)
+        return deleted_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry counts and sizes (same keys as FileCacheStore);
+            counts are zero if Redis is unreachable
+        """
+        counts = {"structures": 0, "llm_responses": 0}
+        sizes = {"structures": 0, "llm_responses": 0}
+        try:
+            for kind in ("structures", "llm_responses"):
+                keys = self._scan_keys(kind)
+                pipe = self._client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.strlen(key)
+                counts[kind] = len(keys)
+                sizes[kind] = sum(pipe.execute()) if keys else 0
+        except self._errors as e:
+            logger.warning("Redis cache stats unavailable: %s", e)
+
+        return {
+            "structure_files": counts["structures"],
+            "llm_response_files": counts["llm_responses"],
+            "structure_size_bytes": sizes["structures"],
+            "llm_response_size_bytes": sizes["llm_responses"],
+            "total_size_bytes": sizes["structures"] + sizes["llm_responses"],
+            "cache_dir": self.redis_url
+        }
+
+
+# ============================================================================
+# In-Process Memo Layer
+# ============================================================================
+
+
+# LLM response lookups (hits and misses) kept in front of the backend store
+RESPONSE_MEMO_SIZE = 4096
+
+
+class MemoizedCacheStore(CacheStore):
+    """
+    In-process LRU of LLM response lookups in front of any cache store.
+
+    Remembers misses as well as hits, so repeated lookups of a key that is
+    not cached (cold runs, or the same section re-processed) cost a dict
+    lookup instead of a stat, an SQLite query or a Redis round-trip. A write
+    replaces any remembered miss. Misses written by another process are not
+    seen until the entry is evicted. Other attributes are delegated to the
+    wrapped store.
+    """
+
+    def __init__(self, store: CacheStore, memo_size: int = RESPONSE_MEMO_SIZE):
+        """
+        Initialize memo layer.
+
+        Args:
+            store: Backend cache store
+            memo_size: Max LLM response lookups remembered (default: 4096)
+        """
+        self.store = store
+        self.memo_size = memo_size
+
+        # key -> response text, or None for a known miss
+        self._memo: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper (cache_dir, close, ...)
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached structure by key (not memoized)"""
+        return self.store.get(key)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store structure in the backend"""
+        self.store.set(key, value)
+
+    def get_llm_response(self, key: str) -> Optional[str]:
+        """
+        Retrieve cached raw LLM response, memoizing both hits and misses.
+
+        Args:
+            key: Cache key (content hash + model + operation type)
+
+        Returns:
+            Raw LLM response text or None if not found
+        """
+        with self._memo_lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        response = self.store.get_llm_response(key)
+        self._remember(key, response)
+        return response
+
+    def set_llm_response(self, key: str, response: str) -> None:
+        """
+        Store raw LLM response, replacing any remembered miss for the key.
+
+        Args:
+            key: Cache key (content hash + model + operation type)
+            response: Raw LLM response text
+        """
+        self.store.set_llm_response(key, response)
+        self._remember(key, response)
+
+    def _remember(self, key: str, response: Optional[str]) -> None:
+        """Record a lookup result, evicting the oldest entry if full."""
+        if self.memo_size <= 0:
+            return
+
+        with self._memo_lock:
+            self._memo[key] = response
+            self._memo.move_to_end(key)
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def clear(self) -> int:
+        """
+        Clear the memo and the backend store.
+
+        Returns:
+            Number of entries deleted from the backend
+        """
+        with self._memo_lock:
+            self._memo.clear()
+        return self.store.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the backend store's statistics"""
+        return self.store.get_stats()
+
+
+# ============================================================================
+# Backend Selection
+# ============================================================================
+
+
+# Help text for the CLIs' --cache-backend option (values parsed by create_cache_store)
+CACHE_BACKEND_HELP = (
+    "Cache for structures and LLM responses: disk (JSON files in .cache/), "
+    "sqlite[:PATH] (single file, default .cache/cache.sqlite3) or a "
+    "redis://HOST:PORT/DB URL (shared across runs)"
+)
+
+
+def create_cache_store(cache_backend: str = "disk") -> CacheStore:
+    """
+    Build the cache store named by a --cache-backend value.
+
+    Every backend is wrapped in MemoizedCacheStore, so LLM response hits and
+    misses are remembered in process whichever store is behind it.
+
+    Args:
+        cache_backend: "disk" (FileCacheStore), "sqlite" or "sqlite:PATH"
+            (SQLiteCacheStore), or a redis:// / rediss:// / unix:// URL
+            (RedisCacheStore)
+
+    Returns:
+        MemoizedCacheStore wrapping the backend store
+
+    Raises:
+        ValueError: If the backend is not recognized
+        ImportError: If a redis URL is given but the redis package is missing
+    """
+    if cache_backend == "disk":
+        # The memo layer replaces FileCacheStore's own response LRU
+        store: CacheStore = FileCacheStore(memory_cache_size=0)
+    elif cache_backend == "sqlite":
+        store = SQLiteCacheStore()
+    elif cache_backend.startswith("sqlite:"):
+        store = SQLiteCacheStore(Path(cache_backend[len("sqlite:"):]).expanduser())
+    elif cache_backend.startswith(("redis://", "rediss://", "unix://")):
+        store = RedisCacheStore(cache_backend)
+    else:
+        raise ValueError(
+            f"Unknown cache backend '{cache_backend}' (use disk, sqlite[:PATH] or a redis:// URL)"
+        )
+
+    return MemoizedCacheStore(store)
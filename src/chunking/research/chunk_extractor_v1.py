@@ -19,6 +19,7 @@ from .models import (
     Structure,
     TokenCounter,
 )
+from .response_format import PREAMBLE_CHECK_LENGTH
 
 
 # ============================================================================
@@ -629,18 +630,19 @@ class ChunkExtractor:
         Raises:
             ChunkExtractionError: If response is invalid
         """
-        if not response or not response.strip():
+        stripped = response.strip() if response else ""
+        if not stripped:
             raise ChunkExtractionError("LLM returned empty response")
 
         # Check for common LLM mistakes
-        if response.strip().startswith("```"):
+        if stripped.startswith("```"):
             raise ChunkExtractionError(
                 "LLM returned markdown code block. "
                 "Expected plain TSV output without formatting."
             )
 
-        if response.strip().lower().startswith("here is") or \
-           response.strip().lower().startswith("here are"):
+        # Only the start can hold a preamble, so only that is lowercased
+        if stripped[:PREAMBLE_CHECK_LENGTH].lower().startswith(("here is", "here are")):
             raise ChunkExtractionError(
                 "LLM added preamble. Expected direct TSV output only."
             )
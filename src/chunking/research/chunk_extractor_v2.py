@@ -6,9 +6,15 @@ from documents based on semantic structure with word-based boundary hints
 for improved extraction accuracy.
 """
 
-from typing import Dict, Any
-
-from .llm_provider import LLMProvider
+import json
+import logging
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+from .concurrency import map_in_order
+from .llm_provider import LLMProvider, OpenAIBatchProvider
 from .metadata_validator import MetadataValidator
 from .models import (
     Chunk,
@@ -16,10 +22,16 @@ from .models import (
     Document,
     ProcessingMetadata,
     ChunkExtractionError,
+    LLMProviderError,
     Structure,
     TokenCounter,
 )
+from .response_format import PREAMBLE_CHECK_LENGTH
+
+logger = logging.getLogger(__name__)
 
+# Lower temperature for accurate extraction and structured output
+LLM_TEMPERATURE = 0.3
 
 # ============================================================================
 # Prompt Templates V2 (with start_words/end_words guidance)
@@ -128,6 +140,71 @@ IMPORTANT RULES:
 OUTPUT:"""
 
 
+FUSED_SECTION_PROMPT_V2 = """You are preparing one chunk of a document for a RAG pipeline.
+
+For the section described below, do three things in a single answer:
+1. Extract the COMPLETE text of the section, exactly as it appears in the document (clean formatting allowed, no summarizing, no content from other sections)
+2. Write its metadata
+3. Write a contextual prefix that situates the chunk within the document
+
+CONTEXT:
+- Document: {document_id}
+- Chapter: {chapter_title}
+
+TARGET SECTION:
+- Title: {section_title}
+- Summary: {section_summary}
+- Maximum tokens: {max_tokens}
+
+BOUNDARY HINTS (approximate, not exact quotes):
+- Section STARTS near: "{start_words}"
+- Section ENDS near: "{end_words}"
+
+OUTPUT FORMAT: a single JSON object with these fields:
+- "extracted_text": the complete section text
+- "metadata": object with
+  - "chapter_title": main chapter title (same as context)
+  - "section_title": section within chapter (same as target section)
+  - "subsection_title": subsection if applicable, otherwise null
+  - "summary": brief summary of the section content (20-100 words)
+- "contextual_prefix": one sentence (20-50 words) starting with "This chunk is from...", naming the chapter, section and main topic
+
+Output ONLY the JSON object, no explanations or code fences.
+
+DOCUMENT TEXT:
+{document_text}
+
+OUTPUT (JSON):"""
+
+
+# Structured-output schema for FUSED_SECTION_PROMPT_V2 (OpenAI json_schema format)
+FUSED_SECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "extracted_text": {"type": "string"},
+        "metadata": {
+            "type": "object",
+            "properties": {
+                "chapter_title": {"type": "string"},
+                "section_title": {"type": "string"},
+                "subsection_title": {"type": ["string", "null"]},
+                "summary": {"type": "string"}
+            },
+            "required": ["chapter_title", "section_title", "subsection_title", "summary"],
+            "additionalProperties": False
+        },
+        "contextual_prefix": {"type": "string"}
+    },
+    "required": ["extracted_text", "metadata", "contextual_prefix"],
+    "additionalProperties": False
+}
+
+FUSED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "section_chunk", "strict": True, "schema": FUSED_SECTION_SCHEMA}
+}
+
+
 # ============================================================================
 # ChunkExtractor V2 Implementation
 # ============================================================================
@@ -143,7 +220,11 @@ class ChunkExtractorV2:
         metadata_validator: MetadataValidator,
         model: str = "google/gemini-2.0-flash-exp",
         max_chunk_tokens: int = 1000,
-        cache_store=None
+        cache_store=None,
+        max_concurrency: int = 8,
+        batch_provider: Optional[OpenAIBatchProvider] = None,
+        batch_dir: Path = Path(".cache") / "batches",
+        fused_calls: bool = False
     ):
         """
         Initialize chunk extractor V2.
@@ -155,6 +236,18 @@ class ChunkExtractorV2:
             model: Model identifier for LLM calls
             max_chunk_tokens: Maximum tokens per chunk (default: 1000)
             cache_store: Optional cache store for LLM responses
+            max_concurrency: Sections extracted in parallel (default: 8); each
+                section's three LLM calls stay sequential
+            batch_provider: If given (and the model is an openai/ one), each of
+                the three LLM steps runs for all sections as one offline Batch
+                API job instead of per-section calls
+            batch_dir: Where Batch API input files are written
+            fused_calls: If True, each section is extracted, described and
+                prefixed by one structured-output (JSON schema) call instead
+                of three, so the document is sent once per section. Sections
+                whose fused answer is unusable fall back to the three calls,
+                and so does every section once the provider rejects
+                structured output. Not used with the Batch API.
         """
         self.llm_client = llm_client
         self.token_counter = token_counter
@@ -162,6 +255,15 @@ class ChunkExtractorV2:
         self.model = model
         self.max_chunk_tokens = max_chunk_tokens
         self.cache_store = cache_store
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_provider = batch_provider
+        self.batch_dir = batch_dir
+        self.fused_calls = fused_calls
+        # Worker threads switch fused_calls off; the lock makes one of them do it (and log it)
+        self._fused_calls_lock = threading.Lock()
+
+        # Batch API responses not yet consumed by _chat(), keyed by prompt
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
 
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
@@ -204,22 +306,72 @@ class ChunkExtractorV2:
                 - tokens_consumed: Total tokens consumed in LLM calls
                 - llm_responses: Dict mapping section titles to their LLM responses
                   (includes: extraction, metadata, prefix for each section)
+                - cache_hits: LLM calls answered from cache_store
+                - cache_misses: LLM calls sent to the provider
 
         Raises:
             ChunkExtractionError: If extraction or metadata generation fails
             MetadataValidationError: If any chunk has invalid metadata
 
         Behavior:
-            1. For each section in structure:
+            1. For each section in structure (up to max_concurrency at once):
                a. Use LLM to extract full text for section (guided by start_words/end_words)
                b. Generate metadata via TSV format
                c. Generate contextual prefix as plain text
+                  (with fused_calls, a-c are one structured-output call)
                d. Prepend contextual prefix to extracted text
                e. Count tokens in chunk
                f. Create Chunk object
                g. Validate token count ≤ max_chunk_tokens
             2. Return all chunks with token consumption and raw LLM responses
         """
+        totals: Dict[str, Any] = {}
+        chunks = list(self.iter_chunks(document, structure, totals))
+
+        # Return chunks with token consumption and raw LLM responses
+        return {
+            "chunks": chunks,
+            "tokens_consumed": totals["tokens_consumed"],
+            "llm_responses": totals["llm_responses"],
+            "cache_hits": totals["cache_hits"],
+            "cache_misses": totals["cache_misses"]
+        }
+
+    def iter_chunks(
+        self,
+        document: Document,
+        structure: Structure,
+        totals: Optional[Dict[str, Any]] = None,
+        on_responses: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Iterator[Chunk]:
+        """
+        Yield chunks one by one, in section order, as sections finish.
+
+        Same work as extract_chunks(), but the caller decides whether to keep
+        the chunks, so it can write each one out as soon as it is produced.
+        At most 2 * max_concurrency finished sections wait to be yielded.
+
+        Raw LLM responses are kept for totals["llm_responses"] until the
+        iterator is exhausted, so memory grows with the document; pass
+        on_responses to stream them out instead and keep memory flat.
+
+        Args:
+            document: Source document
+            structure: Document structure from Phase 1 (with word boundaries)
+            totals: Optional dict; "tokens_consumed", "llm_responses",
+                "cache_hits", "cache_misses" and "total_chunks" are set in it
+                once the iterator is exhausted
+            on_responses: Optional callback given (section title, LLM
+                responses) for each section just before its chunk is yielded;
+                those responses are then not kept in totals["llm_responses"]
+
+        Yields:
+            Chunk objects in section order
+
+        Raises:
+            ChunkExtractionError: If extraction or metadata generation fails
+            MetadataValidationError: If any chunk has invalid metadata
+        """
         # Validate inputs
         if not structure.sections:
             raise ChunkExtractionError("No sections provided for extraction")
@@ -232,129 +384,599 @@ class ChunkExtractorV2:
                 "Use StructureAnalyzerV2 to generate V2-compatible structures."
             )
 
-        chunks = []
+        total_chunks = 0
         total_tokens_consumed = 0
-        llm_responses = {}  # Store all LLM responses by section
+        llm_responses = {}  # LLM responses by section (unless streamed to on_responses)
+        cache_hits = 0
+        cache_misses = 0
+
+        # Title-only sections (empty start_words and end_words) have no body
+        # content to extract: no chunk is generated for them
+        sections_to_process = [
+            (i, section) for i, section in enumerate(structure.sections)
+            if section.start_words or section.end_words
+        ]
+
+        if self._batch_api_enabled():
+            section_results = self._process_sections_batched(document, structure, sections_to_process)
+        else:
+            section_results = self._process_sections_concurrently(document, structure, sections_to_process)
+
+        for (_, section), (chunk, tokens_consumed, section_responses) in zip(
+            sections_to_process, section_results
+        ):
+            total_tokens_consumed += tokens_consumed
+
+            # Fused sections record one response, under "extraction"
+            for step in section_responses.values():
+                if step["response"] is not None:
+                    if step["cached"]:
+                        cache_hits += 1
+                    else:
+                        cache_misses += 1
+
+            if on_responses is not None:
+                on_responses(section.title, section_responses)
+            else:
+                llm_responses[section.title] = section_responses
+            total_chunks += 1
+            yield chunk
+
+        logger.info("V2 LLM response cache: %d hits, %d misses", cache_hits, cache_misses)
+
+        if totals is not None:
+            totals.update(
+                tokens_consumed=total_tokens_consumed,
+                llm_responses=llm_responses,
+                cache_hits=cache_hits,
+                cache_misses=cache_misses,
+                total_chunks=total_chunks
+            )
 
-        # Extract chunk for each section
-        for i, section in enumerate(structure.sections):
-            try:
-                # Step 1: Check if section is title-only (empty start_words and end_words)
-                is_title_only = not section.start_words and not section.end_words
-
-                if is_title_only:
-                    # Title-only section: no body content to extract
-                    # Skip this section entirely (no chunk generated)
-                    continue
-
-                # Step 1b: Extract text for this section using LLM with boundary guidance
-                extraction_result = self._extract_section_text_v2(
-                    document,
-                    section.title,
-                    section.summary,
-                    section.start_words,
-                    section.end_words,
-                    self.max_chunk_tokens
+    @staticmethod
+    def _for_section(section: Any, step: Any, *args: Any) -> Any:
+        """Run step(*args), failing fast with the section named in unexpected errors"""
+        try:
+            return step(*args)
+        except (ChunkExtractionError, ValueError):
+            raise
+        except Exception as e:
+            raise ChunkExtractionError(
+                f"Failed to extract chunk for section '{section.title}': {str(e)}"
+            ) from e
+
+    def _batch_api_enabled(self) -> bool:
+        """True if a batch provider is set and can serve this extractor's model"""
+        if self.batch_provider is None:
+            return False
+        try:
+            self.batch_provider.native_model(self.model)
+        except LLMProviderError as e:
+            logger.warning("%s; extracting with per-section calls", e)
+            return False
+        return True
+
+    def _process_sections_concurrently(
+        self,
+        document: Document,
+        structure: Structure,
+        sections_to_process: List[Tuple[int, Any]]
+    ) -> Iterator[Tuple[Chunk, int, Dict[str, Any]]]:
+        """
+        Process sections on a thread pool, yielding results in section order.
+
+        Sections are independent given the structure, so up to max_concurrency
+        run at once, after the first section has run alone (see map_in_order).
+        Sections not yet started are cancelled on failure.
+        """
+        return map_in_order(
+            lambda item: self._for_section(
+                item[1], self._process_section, item[0], item[1], document, structure
+            ),
+            sections_to_process,
+            self.max_concurrency
+        )
+
+    def _process_sections_batched(
+        self,
+        document: Document,
+        structure: Structure,
+        sections_to_process: List[Tuple[int, Any]]
+    ) -> List[Tuple[Chunk, int, Dict[str, Any]]]:
+        """
+        Process sections with one Batch API job per LLM step.
+
+        Metadata prompts need the extracted text and prefix prompts need the
+        metadata, so the steps run as three consecutive batches. Responses
+        reach the per-step methods through _chat(), which keeps their caching,
+        parsing and validation unchanged.
+        """
+        sections = [section for _, section in sections_to_process]
+        try:
+            self._prefetch("extract_text_v2", [
+                self._extraction_request(
+                    document, section.title, section.summary,
+                    section.start_words, section.end_words, self.max_chunk_tokens
                 )
-                extracted_text = extraction_result["extracted_text"]
-                total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
-
-                # Step 2: Generate metadata using LLM
-                metadata_result = self._generate_metadata(
-                    document.document_id,
-                    structure.chapter_title,
-                    section.title,
-                    extracted_text
+                for section in sections
+            ])
+            extraction_results = [
+                self._for_section(
+                    section, self._extract_section_text_v2, document, section.title,
+                    section.summary, section.start_words, section.end_words, self.max_chunk_tokens
                 )
-                metadata = metadata_result["metadata"]
-                total_tokens_consumed += metadata_result.get("tokens_consumed", 0)
-
-                # Validate metadata
-                self.metadata_validator.validate_metadata(metadata)
-
-                # Step 3: Generate contextual prefix using LLM
-                prefix_result = self._generate_contextual_prefix(
-                    document.document_id,
-                    metadata.chapter_title,
-                    metadata.section_title,
-                    metadata.subsection_title,
-                    extracted_text
+                for section in sections
+            ]
+
+            self._prefetch("generate_metadata", [
+                self._metadata_request(
+                    document.document_id, structure.chapter_title, section.title,
+                    extraction_result["extracted_text"]
                 )
-                contextual_prefix = prefix_result["prefix"]
-                total_tokens_consumed += prefix_result.get("tokens_consumed", 0)
-
-                # Collect LLM responses for this section
-                llm_responses[section.title] = {
-                    "extraction": {
-                        "response": extraction_result.get("llm_response"),
-                        "cached": extraction_result.get("llm_response_cached", False)
-                    },
-                    "metadata": {
-                        "response": metadata_result.get("llm_response"),
-                        "cached": metadata_result.get("llm_response_cached", False)
-                    },
-                    "prefix": {
-                        "response": prefix_result.get("llm_response"),
-                        "cached": prefix_result.get("llm_response_cached", False)
-                    }
-                }
+                for section, extraction_result in zip(sections, extraction_results)
+            ])
+            metadata_results = []
+            for section, extraction_result in zip(sections, extraction_results):
+                metadata_result = self._for_section(
+                    section, self._generate_metadata, document.document_id,
+                    structure.chapter_title, section.title, extraction_result["extracted_text"]
+                )
+                self._for_section(
+                    section, self.metadata_validator.validate_metadata, metadata_result["metadata"]
+                )
+                metadata_results.append(metadata_result)
+
+            self._prefetch("generate_prefix", [
+                self._prefix_request(
+                    document.document_id, metadata_result["metadata"].chapter_title,
+                    metadata_result["metadata"].section_title,
+                    metadata_result["metadata"].subsection_title,
+                    extraction_result["extracted_text"]
+                )
+                for extraction_result, metadata_result in zip(extraction_results, metadata_results)
+            ])
+            prefix_results = [
+                self._for_section(
+                    section, self._generate_contextual_prefix, document.document_id,
+                    metadata_result["metadata"].chapter_title,
+                    metadata_result["metadata"].section_title,
+                    metadata_result["metadata"].subsection_title,
+                    extraction_result["extracted_text"]
+                )
+                for section, extraction_result, metadata_result in zip(
+                    sections, extraction_results, metadata_results
+                )
+            ]
 
-                # Step 4: Combine prefix with extracted text
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+            return [
+                self._for_section(
+                    section, self._build_chunk, i, section, document, structure,
+                    extraction_result, metadata_result, prefix_result
+                )
+                for (i, section), extraction_result, metadata_result, prefix_result in zip(
+                    sections_to_process, extraction_results, metadata_results, prefix_results
+                )
+            ]
+        finally:
+            self._prefetched.clear()
 
-                # Step 5: Count tokens
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+    def _process_section(
+        self,
+        i: int,
+        section: Any,
+        document: Document,
+        structure: Structure
+    ) -> Tuple[Chunk, int, Dict[str, Any]]:
+        """
+        Extract, describe and validate the chunk for one section.
 
-                # Enforce token limit
-                if token_count > self.max_chunk_tokens:
-                    raise ChunkExtractionError(
-                        f"Chunk '{section.title}' exceeds token limit: "
-                        f"{token_count} > {self.max_chunk_tokens} tokens"
-                    )
+        Runs on a worker thread of extract_chunks().
 
-                # Step 6: Create chunk ID
-                chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
+        Args:
+            i: Index of the section in structure.sections (used in the chunk ID)
+            section: Section to process (must have start_words/end_words)
+            document: Source document
+            structure: Document structure from Phase 1
 
-                # Step 7: Create processing metadata
-                cache_hit = structure.metadata.get("cache_hit", False)
+        Returns:
+            Tuple of (chunk, tokens consumed, LLM responses for this section)
+        """
+        # Tokens spent on a fused answer that turned out unusable still count
+        fused_tokens = 0
+        if self.fused_calls:
+            results, fused_tokens = self._fused_section(section, document, structure)
+            if results is not None:
+                return self._build_chunk(i, section, document, structure, *results)
+
+        # Step 1b: Extract text for this section using LLM with boundary guidance
+        extraction_result = self._extract_section_text_v2(
+            document,
+            section.title,
+            section.summary,
+            section.start_words,
+            section.end_words,
+            self.max_chunk_tokens
+        )
+        extracted_text = extraction_result["extracted_text"]
+
+        # Step 2: Generate metadata using LLM
+        metadata_result = self._generate_metadata(
+            document.document_id,
+            structure.chapter_title,
+            section.title,
+            extracted_text
+        )
+        metadata = metadata_result["metadata"]
+
+        # Validate metadata
+        self.metadata_validator.validate_metadata(metadata)
+
+        # Step 3: Generate contextual prefix using LLM
+        # (sequential: the prompt uses the titles returned by Step 2, and the
+        # prefix cache key is the chunk text alone, so a prefix started early
+        # from the structure's titles could not be told apart in the cache)
+        prefix_result = self._generate_contextual_prefix(
+            document.document_id,
+            metadata.chapter_title,
+            metadata.section_title,
+            metadata.subsection_title,
+            extracted_text
+        )
 
-                processing_metadata = ProcessingMetadata(
-                    phase_1_model=structure.analysis_model,
-                    phase_2_model=self.model,
-                    cache_hit=cache_hit
-                )
+        chunk, tokens_consumed, llm_responses = self._build_chunk(
+            i, section, document, structure, extraction_result, metadata_result, prefix_result
+        )
+        return chunk, tokens_consumed + fused_tokens, llm_responses
 
-                # Step 8: Create Chunk object
-                chunk = Chunk(
-                    chunk_id=chunk_id,
-                    source_document=document.document_id,
-                    chunk_text=chunk_text,
-                    original_text=extracted_text,
-                    contextual_prefix=contextual_prefix,
-                    metadata=metadata,
-                    token_count=token_count,
-                    processing_metadata=processing_metadata
-                )
+    def _fused_section(
+        self,
+        section: Any,
+        document: Document,
+        structure: Structure
+    ) -> Tuple[Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]], int]:
+        """
+        Extract, describe and prefix one section with a single structured-output call.
 
-                # Step 9: Validate chunk
-                self.metadata_validator.validate_chunk(chunk)
+        Returns:
+            Tuple of (results, tokens_consumed). results are the (extraction,
+            metadata, prefix) results shaped like the three per-step methods'
+            results, or None if the section should go through the three-call
+            path instead; tokens_consumed then counts the unusable fused call
+            so the caller can add it to the fallback's tokens.
+        """
+        cache_key, prompt = self._fused_request(document, structure.chapter_title, section)
 
-                chunks.append(chunk)
+        cached = False
+        response_text = None
+        tokens_consumed = 0
+        if cache_key:
+            response_text = self.cache_store.get_llm_response(cache_key)
+            cached = response_text is not None
 
-            except Exception as e:
-                # Fail fast on any error
-                if isinstance(e, (ChunkExtractionError, ValueError)):
-                    raise
-                raise ChunkExtractionError(
-                    f"Failed to extract chunk for section '{section.title}': {str(e)}"
-                ) from e
+        try:
+            if response_text is None:
+                # Another worker may have disabled fused calls since
+                # _process_section checked; an unlocked read is fine, a stale
+                # True only costs one more rejected request
+                if not self.fused_calls:
+                    return None, 0
+                response = self._chat(prompt, response_format=FUSED_RESPONSE_FORMAT)
+                tokens_consumed = (response.get("usage") or {}).get("total_tokens", 0)
+                response_text = response["choices"][0]["message"]["content"]
+
+            extraction_result, metadata_result, prefix_result = self._parse_fused_response(
+                section.title, response_text
+            )
+            self.metadata_validator.validate_metadata(metadata_result["metadata"])
+        except LLMProviderError as e:
+            # Provider-level failure (e.g. response_format unsupported): stop trying
+            with self._fused_calls_lock:
+                was_enabled = self.fused_calls
+                self.fused_calls = False
+            if was_enabled:
+                logger.warning("Fused section calls disabled, using three calls per section: %s", e)
+            return None, tokens_consumed
+        except Exception as e:
+            logger.warning(
+                "Fused call unusable for section '%s', using three calls: %s", section.title, e
+            )
+            return None, tokens_consumed
 
-        # Return chunks with token consumption and raw LLM responses
-        return {
-            "chunks": chunks,
-            "tokens_consumed": total_tokens_consumed,
-            "llm_responses": llm_responses
+        if cache_key and not cached:
+            self.cache_store.set_llm_response(cache_key, response_text)
+
+        extraction_result.update(
+            tokens_consumed=tokens_consumed,
+            llm_response=response_text,
+            llm_response_cached=cached
+        )
+        return (extraction_result, metadata_result, prefix_result), tokens_consumed
+
+    def _parse_fused_response(
+        self, section_title: str, response_text: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Parse a fused JSON answer into (extraction, metadata, prefix) results.
+
+        Raises:
+            ChunkExtractionError: If the text is too short or the prefix is malformed
+            ValueError: If the answer is not the expected JSON (or metadata is invalid)
+        """
+        data = json.loads(response_text)
+        extracted_text = data["extracted_text"].strip()
+        if len(extracted_text) < 10:
+            raise ChunkExtractionError(
+                f"LLM returned suspiciously short text ({len(extracted_text)} chars) "
+                f"for section '{section_title}'"
+            )
+
+        fields = data["metadata"]
+        subsection = (fields.get("subsection_title") or "").strip()
+        metadata = ChunkMetadata(
+            chapter_title=fields["chapter_title"].strip(),
+            section_title=fields["section_title"].strip(),
+            subsection_title=None if not subsection or subsection.upper() == "NONE" else subsection,
+            summary=fields["summary"].strip()
+        )
+        prefix = self._parse_contextual_prefix(data["contextual_prefix"])
+
+        return (
+            {"extracted_text": extracted_text},
+            {"metadata": metadata, "llm_response": None},
+            {"prefix": prefix, "llm_response": None}
+        )
+
+    def _build_chunk(
+        self,
+        i: int,
+        section: Any,
+        document: Document,
+        structure: Structure,
+        extraction_result: Dict[str, Any],
+        metadata_result: Dict[str, Any],
+        prefix_result: Dict[str, Any]
+    ) -> Tuple[Chunk, int, Dict[str, Any]]:
+        """
+        Assemble and validate a section's chunk from its three LLM step results.
+
+        Returns:
+            Tuple of (chunk, tokens consumed, LLM responses for this section)
+        """
+        extracted_text = extraction_result["extracted_text"]
+        metadata = metadata_result["metadata"]
+        contextual_prefix = prefix_result["prefix"]
+        tokens_consumed = (
+            extraction_result.get("tokens_consumed", 0)
+            + metadata_result.get("tokens_consumed", 0)
+            + prefix_result.get("tokens_consumed", 0)
+        )
+
+        # Collect LLM responses for this section
+        llm_responses = {
+            "extraction": {
+                "response": extraction_result.get("llm_response"),
+                "cached": extraction_result.get("llm_response_cached", False)
+            },
+            "metadata": {
+                "response": metadata_result.get("llm_response"),
+                "cached": metadata_result.get("llm_response_cached", False)
+            },
+            "prefix": {
+                "response": prefix_result.get("llm_response"),
+                "cached": prefix_result.get("llm_response_cached", False)
+            }
+        }
+
+        # Step 4: Combine prefix with extracted text
+        chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+
+        # Step 5: Count tokens
+        token_count = self.token_counter.count_tokens(chunk_text, self.model)
+
+        # Enforce token limit
+        if token_count > self.max_chunk_tokens:
+            raise ChunkExtractionError(
+                f"Chunk '{section.title}' exceeds token limit: "
+                f"{token_count} > {self.max_chunk_tokens} tokens"
+            )
+
+        # Step 6: Create chunk ID
+        chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
+
+        # Step 7: Create processing metadata
+        cache_hit = structure.metadata.get("cache_hit", False)
+
+        processing_metadata = ProcessingMetadata(
+            phase_1_model=structure.analysis_model,
+            phase_2_model=self.model,
+            cache_hit=cache_hit
+        )
+
+        # Step 8: Create Chunk object
+        chunk = Chunk(
+            chunk_id=chunk_id,
+            source_document=document.document_id,
+            chunk_text=chunk_text,
+            original_text=extracted_text,
+            contextual_prefix=contextual_prefix,
+            metadata=metadata,
+            token_count=token_count,
+            processing_metadata=processing_metadata
+        )
+
+        # Step 9: Validate chunk
+        self.metadata_validator.validate_chunk(chunk)
+
+        return chunk, tokens_consumed, llm_responses
+
+    # ========================================================================
+    # LLM Requests
+    # ========================================================================
+
+    def _extraction_request(
+        self,
+        document: Document,
+        section_title: str,
+        section_summary: str,
+        start_words: str,
+        end_words: str,
+        max_tokens: int
+    ) -> Tuple[Optional[str], str]:
+        """Cache key (None without a cache store) and prompt for a section text extraction"""
+        # Include boundaries in key
+        section_info = f"{section_title}_{section_summary}_{start_words}_{end_words}"
+        cache_key = None
+        if self.cache_store:
+            cache_key = self.generate_llm_response_key(
+                document.content, self.model, "extract_text_v2", section_info
+            )
+
+        # Format prompt with boundary hints
+        prompt = TEXT_EXTRACTION_PROMPT_V2.format(
+            section_title=section_title,
+            section_summary=section_summary,
+            max_tokens=max_tokens,
+            start_words=start_words,
+            end_words=end_words,
+            document_text=document.content
+        )
+        return cache_key, prompt
+
+    def _metadata_request(
+        self,
+        document_id: str,
+        chapter_title: str,
+        section_title: str,
+        chunk_text: str
+    ) -> Tuple[Optional[str], str]:
+        """Cache key (None without a cache store) and prompt for metadata generation"""
+        cache_key = None
+        if self.cache_store:
+            cache_key = self.generate_llm_response_key(
+                chunk_text, self.model, "generate_metadata"
+            )
+
+        prompt = METADATA_GENERATION_PROMPT.format(
+            document_id=document_id,
+            chapter_title=chapter_title,
+            section_title=section_title,
+            chunk_text=chunk_text
+        )
+        return cache_key, prompt
+
+    def _prefix_request(
+        self,
+        document_id: str,
+        chapter_title: str,
+        section_title: str,
+        subsection_title: str | None,
+        chunk_text: str
+    ) -> Tuple[Optional[str], str]:
+        """Cache key (None without a cache store) and prompt for contextual prefix generation"""
+        cache_key = None
+        if self.cache_store:
+            cache_key = self.generate_llm_response_key(
+                chunk_text, self.model, "generate_prefix"
+            )
+
+        subsection_display = subsection_title or "no subsection"
+        prompt = CONTEXTUAL_PREFIX_PROMPT.format(
+            document_id=document_id,
+            chapter_title=chapter_title,
+            section_title=section_title,
+            subsection_title=subsection_display,
+            chunk_text=chunk_text
+        )
+        return cache_key, prompt
+
+    def _fused_request(
+        self,
+        document: Document,
+        chapter_title: str,
+        section: Any
+    ) -> Tuple[Optional[str], str]:
+        """Cache key (None without a cache store) and prompt for a fused section call"""
+        cache_key = None
+        if self.cache_store:
+            section_info = (
+                f"{chapter_title}_{section.title}_{section.summary}_"
+                f"{section.start_words}_{section.end_words}"
+            )
+            cache_key = self.generate_llm_response_key(
+                document.content, self.model, "extract_fused_v2", section_info
+            )
+
+        prompt = FUSED_SECTION_PROMPT_V2.format(
+            document_id=document.document_id,
+            chapter_title=chapter_title,
+            section_title=section.title,
+            section_summary=section.summary,
+            max_tokens=self.max_chunk_tokens,
+            start_words=section.start_words,
+            end_words=section.end_words,
+            document_text=document.content
+        )
+        return cache_key, prompt
+
+    def _chat(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Chat completion for one prompt.
+
+        Served from a Batch API response prefetched for this prompt when there
+        is one, otherwise a synchronous call (kwargs are passed to the provider).
+        """
+        response = self._prefetched.pop(prompt, None)
+        if response is not None:
+            return response
+
+        return self.llm_client.chat_completion(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=LLM_TEMPERATURE,
+            **kwargs
+        )
+
+    def _prefetch(self, operation: str, requests: List[Tuple[Optional[str], str]]) -> None:
+        """
+        Send one step's uncached prompts as a single Batch API job.
+
+        Answers are kept by prompt for _chat() to pick up. Prompts the batch
+        did not answer (or all of them, if the batch fails) are sent
+        synchronously by _chat() instead.
+
+        Args:
+            operation: Step name, used in custom IDs and the batch file name
+            requests: (cache_key, prompt) per section, from the *_request() builders
+        """
+        custom_ids: Dict[str, str] = {}  # prompt -> custom_id (identical prompts sent once)
+        for cache_key, prompt in requests:
+            if cache_key and self.cache_store.get_llm_response(cache_key):
+                continue
+            custom_ids.setdefault(prompt, f"{operation}-{len(custom_ids)}")
+
+        if not custom_ids:
+            return
+
+        prompts = {custom_id: prompt for prompt, custom_id in custom_ids.items()}
+
+        requests_by_id = {
+            custom_id: {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": LLM_TEMPERATURE
+            }
+            for custom_id, prompt in prompts.items()
         }
+        jsonl_path = self.batch_dir / f"{operation}_{uuid.uuid4().hex}.jsonl"
+        try:
+            responses = self.batch_provider.run_batch(requests_by_id, jsonl_path)
+        except Exception as e:
+            logger.warning("Batch API %s failed, falling back to per-section calls: %s", operation, e)
+            return
+
+        for custom_id, response in responses.items():
+            if custom_id in prompts:
+                self._prefetched[prompts[custom_id]] = response
 
     def _extract_section_text_v2(
         self,
@@ -386,14 +1008,10 @@ class ChunkExtractorV2:
         Raises:
             ChunkExtractionError: If LLM call fails or extraction fails
         """
-        # Generate cache key for this extraction (include boundaries in key)
-        section_info = f"{section_title}_{section_summary}_{start_words}_{end_words}"
-        cache_key = None
+        cache_key, prompt = self._extraction_request(
+            document, section_title, section_summary, start_words, end_words, max_tokens
+        )
         if self.cache_store:
-            cache_key = self.generate_llm_response_key(
-                document.content, self.model, "extract_text_v2", section_info
-            )
-
             # Check cache first
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -406,23 +1024,9 @@ class ChunkExtractorV2:
                     "llm_response_cached": True
                 }
 
-        # Format prompt with boundary hints
-        prompt = TEXT_EXTRACTION_PROMPT_V2.format(
-            section_title=section_title,
-            section_summary=section_summary,
-            max_tokens=max_tokens,
-            start_words=start_words,
-            end_words=end_words,
-            document_text=document.content
-        )
-
         # Make LLM call
         try:
-            response = self.llm_client.chat_completion(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3  # Lower temperature for accurate extraction
-            )
+            response = self._chat(prompt)
 
             # Extract token usage
             tokens_consumed = 0
@@ -489,13 +1093,10 @@ class ChunkExtractorV2:
         Raises:
             ChunkExtractionError: If LLM call fails or response is malformed
         """
-        # Generate cache key for this metadata generation
-        cache_key = None
+        cache_key, prompt = self._metadata_request(
+            document_id, chapter_title, section_title, chunk_text
+        )
         if self.cache_store:
-            cache_key = self.generate_llm_response_key(
-                chunk_text, self.model, "generate_metadata"
-            )
-
             # Check cache first
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -509,21 +1110,9 @@ class ChunkExtractorV2:
                     "llm_response_cached": True
                 }
 
-        # Format prompt
-        prompt = METADATA_GENERATION_PROMPT.format(
-            document_id=document_id,
-            chapter_title=chapter_title,
-            section_title=section_title,
-            chunk_text=chunk_text
-        )
-
         # Make LLM call
         try:
-            response = self.llm_client.chat_completion(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3  # Lower temperature for structured output
-            )
+            response = self._chat(prompt)
 
             # Extract token usage
             tokens_consumed = 0
@@ -586,13 +1175,10 @@ class ChunkExtractorV2:
         Raises:
             ChunkExtractionError: If LLM call fails or response is malformed
         """
-        # Generate cache key for this prefix generation
-        cache_key = None
+        cache_key, prompt = self._prefix_request(
+            document_id, chapter_title, section_title, subsection_title, chunk_text
+        )
         if self.cache_store:
-            cache_key = self.generate_llm_response_key(
-                chunk_text, self.model, "generate_prefix"
-            )
-
             # Check cache first
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -605,23 +1191,9 @@ class ChunkExtractorV2:
                     "llm_response_cached": True
                 }
 
-        # Format prompt
-        subsection_display = subsection_title or "no subsection"
-        prompt = CONTEXTUAL_PREFIX_PROMPT.format(
-            document_id=document_id,
-            chapter_title=chapter_title,
-            section_title=section_title,
-            subsection_title=subsection_display,
-            chunk_text=chunk_text
-        )
-
         # Make LLM call
         try:
-            response = self.llm_client.chat_completion(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3  # Lower temperature for structured output
-            )
+            response = self._chat(prompt)
 
             # Extract token usage
             tokens_consumed = 0
@@ -663,18 +1235,19 @@ class ChunkExtractorV2:
         Raises:
             ChunkExtractionError: If response is invalid
         """
-        if not response or not response.strip():
+        stripped = response.strip() if response else ""
+        if not stripped:
             raise ChunkExtractionError("LLM returned empty response")
 
         # Check for common LLM mistakes
-        if response.strip().startswith("```"):
+        if stripped.startswith("```"):
             raise ChunkExtractionError(
                 "LLM returned markdown code block. "
                 "Expected plain TSV output without formatting."
             )
 
-        if response.strip().lower().startswith("here is") or \
-           response.strip().lower().startswith("here are"):
+        # Only the start can hold a preamble, so only that is lowercased
+        if stripped[:PREAMBLE_CHECK_LENGTH].lower().startswith(("here is", "here are")):
             raise ChunkExtractionError(
                 "LLM added preamble. Expected direct TSV output only."
             )
@@ -18,11 +18,15 @@ Cache Efficiency:
     V2C: ~80-90% (document cached once, reused for all sections)
 """
 
+import functools
+import hashlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from .llm_provider import LLMProvider
 from .metadata_validator import MetadataValidator
-from .tag_parser import parse_tagged_output, validate_tagged_format, TagParsingError
+from .tag_parser import parse_tagged_output, TagParsingError
 from .models import (
     Chunk,
     ChunkMetadata,
@@ -43,6 +47,96 @@ DOCUMENT_SECTION = """DOCUMENT TEXT:
 
 ---"""
 
+@functools.lru_cache(maxsize=2048)
+def generate_llm_response_key(
+    content: str, model: str, operation: str, section_info: str = ""
+) -> str:
+    """
+    Generate cache key for raw LLM response.
+
+    Memoized: retries and repeated sections within a run reuse the computed key
+    instead of re-hashing the full document.
+
+    Args:
+        content: Input content (document or chunk text)
+        model: Model identifier
+        operation: Operation type (e.g., "extract_text_v2a")
+        section_info: Optional section-specific info (title + summary + boundaries)
+
+    Returns:
+        Cache key for LLM response
+    """
+    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
+    section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
+    if section_hash:
+        return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
+    return f"llm_{operation}_{content_hash}_{model_hash}"
+
+
+# Approximate characters per token, used to estimate section size before any LLM call
+CHARS_PER_TOKEN_ESTIMATE = 3.5
+
+# Sections estimated above max_chunk_tokens * this factor are rejected up front
+OVERSIZED_SECTION_FACTOR = 1.5
+
+
+def _estimate_section_tokens(
+    document_text: str,
+    start_words: str,
+    end_words: str
+) -> int | None:
+    """
+    Estimate token count of a section from its boundary hints.
+
+    Locates start_words (first occurrence) and the first end_words after it, and
+    converts the character span to tokens with a fixed ratio. Searching forward
+    keeps a phrase repeated later in the document from stretching the span.
+
+    Args:
+        document_text: Full document content
+        start_words: Boundary hint for section start
+        end_words: Boundary hint for section end
+
+    Returns:
+        Estimated token count, or None if the boundaries cannot be located exactly
+    """
+    if not start_words or not end_words:
+        return None
+
+    start = document_text.find(start_words)
+    if start == -1:
+        return None
+
+    end = document_text.find(end_words, start)
+    if end == -1:
+        return None
+
+    span = end + len(end_words) - start
+    return int(span / CHARS_PER_TOKEN_ESTIMATE)
+
+
+def _check_section_size(
+    document_text: str,
+    section_title: str,
+    start_words: str,
+    end_words: str,
+    max_chunk_tokens: int
+) -> None:
+    """
+    Reject sections that are clearly oversized before paying for any LLM call.
+
+    Raises:
+        ChunkExtractionError: If the estimated size exceeds
+            max_chunk_tokens * OVERSIZED_SECTION_FACTOR
+    """
+    estimate = _estimate_section_tokens(document_text, start_words, end_words)
+    if estimate is not None and estimate > max_chunk_tokens * OVERSIZED_SECTION_FACTOR:
+        raise ChunkExtractionError(
+            f"Chunk '{section_title}' exceeds token limit before extraction: "
+            f"~{estimate} estimated > {max_chunk_tokens} tokens"
+        )
+
 
 # ============================================================================
 # Version V2A: Separate Calls + Document Context (Conservative)
@@ -200,14 +294,8 @@ class ChunkExtractorV2A:
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
     ) -> str:
-        """Generate cache key for raw LLM response."""
-        import hashlib
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
-        section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
-        if section_hash:
-            return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
-        return f"llm_{operation}_{content_hash}_{model_hash}"
+        """Generate cache key for raw LLM response (memoized module-level helper)."""
+        return generate_llm_response_key(content, model, operation, section_info)
 
     def extract_chunks(
         self,
@@ -243,6 +331,12 @@ class ChunkExtractorV2A:
                 if is_title_only:
                     continue
 
+                # Reject clearly oversized sections before any LLM call
+                _check_section_size(
+                    document.content, section.title,
+                    section.start_words, section.end_words, self.max_chunk_tokens
+                )
+
                 # Step 1: Extract text
                 extraction_result = self._extract_section_text(
                     document,
@@ -266,9 +360,6 @@ class ChunkExtractorV2A:
                 metadata = metadata_result["metadata"]
                 total_tokens_consumed += metadata_result.get("tokens_consumed", 0)
 
-                # Validate metadata
-                self.metadata_validator.validate_metadata(metadata)
-
                 # Step 3: Generate contextual prefix
                 prefix_result = self._generate_contextual_prefix(
                     document.document_id,
@@ -297,11 +388,10 @@ class ChunkExtractorV2A:
                     }
                 }
 
-                # Step 4: Combine prefix with extracted text
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
-
-                # Step 5: Count tokens
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+                # Step 4: Count tokens on the parts (no concatenation needed for the gate)
+                token_count = self.token_counter.count_tokens_parts(
+                    [contextual_prefix, "\n\n", extracted_text], self.model
+                )
 
                 # Enforce token limit
                 if token_count > self.max_chunk_tokens:
@@ -310,6 +400,9 @@ class ChunkExtractorV2A:
                         f"{token_count} > {self.max_chunk_tokens} tokens"
                     )
 
+                # Step 5: Combine prefix with extracted text
+                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+
                 # Step 6: Create chunk
                 chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
                 cache_hit = structure.metadata.get("cache_hit", False)
@@ -331,8 +424,6 @@ class ChunkExtractorV2A:
                     processing_metadata=processing_metadata
                 )
 
-                # Validate chunk
-                self.metadata_validator.validate_chunk(chunk)
                 chunks.append(chunk)
 
             except Exception as e:
@@ -342,6 +433,11 @@ class ChunkExtractorV2A:
                     f"Failed to extract chunk for section '{section.title}': {str(e)}"
                 ) from e
 
+        # Validate all chunks (metadata included) in one finalization pass,
+        # off the per-section LLM critical path
+        if chunks:
+            self.metadata_validator.validate_chunks(chunks)
+
         return {
             "chunks": chunks,
             "tokens_consumed": total_tokens_consumed,
@@ -551,17 +647,15 @@ class ChunkExtractorV2A:
     def _parse_metadata_tags(self, response_text: str) -> ChunkMetadata:
         """Parse tagged metadata output into ChunkMetadata."""
         try:
-            # Validate format first
+            # Single scan: validate=True keeps validate_tagged_format's checks
             expected_tags = ["CHAPTER_TITLE", "SECTION_TITLE", "SUBSECTION_TITLE", "SUMMARY"]
-            validate_tagged_format(response_text, expected_tags)
-
-            # Parse tags
-            parsed = parse_tagged_output(response_text, expected_tags)
+            parsed = parse_tagged_output(response_text, expected_tags, validate=True)
 
             # Convert to ChunkMetadata
             return ChunkMetadata(
-                chapter_title=parsed["CHAPTER_TITLE"],
-                section_title=parsed["SECTION_TITLE"],
+                # Titles repeat across every chunk of a document; intern to share storage
+                chapter_title=sys.intern(parsed["CHAPTER_TITLE"]),
+                section_title=sys.intern(parsed["SECTION_TITLE"]),
                 subsection_title=None if parsed["SUBSECTION_TITLE"].upper() == "NONE"
                                       else parsed["SUBSECTION_TITLE"],
                 summary=parsed["SUMMARY"]
@@ -601,15 +695,19 @@ METADATA_PREFIX_MERGED_PROMPT_V2B = """DOCUMENT TEXT:
 
 You are generating metadata AND contextual prefix for a document chunk in a RAG pipeline.
 
-Your task: Create both metadata and prefix that help users find and understand this chunk.
+Your task: Create both metadata and prefix that help users find and understand the section of the above document described below.
 
 CONTEXT:
 - Document: {document_id}
 - Chapter: {chapter_title}
 - Section: {section_title}
+- Section Summary: {section_summary}
 
-CHUNK TEXT:
-{chunk_text}
+BOUNDARY HINTS (for locating the section):
+- Section STARTS near: "{start_words}"
+- Section ENDS near: "{end_words}"
+
+Note: These boundary hints are approximate guides, not exact quotes. Use them to locate the section in the document, then describe the content between them.
 
 OUTPUT FORMAT: Tagged structure with exactly 5 fields:
 
@@ -635,9 +733,11 @@ class ChunkExtractorV2B:
     Version V2B: Merged metadata + prefix (Moderate).
 
     Architecture:
-        - 2 LLM calls per section: extract → (metadata + prefix merged)
+        - 2 LLM calls per section: extract + (metadata + prefix merged), run concurrently
         - Extraction uses same prompt as V2A (document-first)
         - Metadata and prefix generated together with tagged output
+        - Metadata call locates the section via start_words/end_words instead of
+          the extracted text, so it does not have to wait for extraction
 
     Cache Efficiency: ~50-60% (document cached, reused 2x per section)
 
@@ -672,14 +772,8 @@ class ChunkExtractorV2B:
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
     ) -> str:
-        """Generate cache key for raw LLM response."""
-        import hashlib
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
-        section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
-        if section_hash:
-            return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
-        return f"llm_{operation}_{content_hash}_{model_hash}"
+        """Generate cache key for raw LLM response (memoized module-level helper)."""
+        return generate_llm_response_key(content, model, operation, section_info)
 
     def extract_chunks(
         self,
@@ -707,91 +801,109 @@ class ChunkExtractorV2B:
         total_tokens_consumed = 0
         llm_responses = {}
 
-        for i, section in enumerate(structure.sections):
-            try:
-                # Skip title-only sections
-                is_title_only = not section.start_words and not section.end_words
-                if is_title_only:
-                    continue
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for i, section in enumerate(structure.sections):
+                try:
+                    # Skip title-only sections
+                    is_title_only = not section.start_words and not section.end_words
+                    if is_title_only:
+                        continue
+
+                    # Reject clearly oversized sections before any LLM call
+                    _check_section_size(
+                        document.content, section.title,
+                        section.start_words, section.end_words, self.max_chunk_tokens
+                    )
 
-                # Step 1: Extract text (reuse V2A implementation)
-                extraction_result = self._extract_section_text(
-                    document,
-                    section.title,
-                    section.summary,
-                    section.start_words,
-                    section.end_words,
-                    self.max_chunk_tokens
-                )
-                extracted_text = extraction_result["extracted_text"]
-                total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
+                    # Step 1 + 2: Extract text and generate metadata + prefix concurrently.
+                    # The merged call only needs the section boundaries, not the extracted text.
+                    extraction_future = executor.submit(
+                        self._extract_section_text,
+                        document,
+                        section.title,
+                        section.summary,
+                        section.start_words,
+                        section.end_words,
+                        self.max_chunk_tokens
+                    )
+                    merged_future = executor.submit(
+                        self._generate_metadata_and_prefix,
+                        document.document_id,
+                        structure.chapter_title,
+                        section.title,
+                        section.summary,
+                        section.start_words,
+                        section.end_words,
+                        document.content
+                    )
+                    extraction_result = extraction_future.result()
+                    merged_result = merged_future.result()
+
+                    extracted_text = extraction_result["extracted_text"]
+                    total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
+
+                    metadata = merged_result["metadata"]
+                    contextual_prefix = merged_result["prefix"]
+                    total_tokens_consumed += merged_result.get("tokens_consumed", 0)
+
+                    # Collect LLM responses
+                    llm_responses[section.title] = {
+                        "extraction": {
+                            "response": extraction_result.get("llm_response"),
+                            "cached": extraction_result.get("llm_response_cached", False)
+                        },
+                        "metadata_prefix": {
+                            "response": merged_result.get("llm_response"),
+                            "cached": merged_result.get("llm_response_cached", False)
+                        }
+                    }
 
-                # Step 2: Generate metadata + prefix together
-                merged_result = self._generate_metadata_and_prefix(
-                    document.document_id,
-                    structure.chapter_title,
-                    section.title,
-                    extracted_text,
-                    document.content
-                )
-                metadata = merged_result["metadata"]
-                contextual_prefix = merged_result["prefix"]
-                total_tokens_consumed += merged_result.get("tokens_consumed", 0)
+                    # Step 3: Check size on the parts, then combine and create chunk
+                    token_count = self.token_counter.count_tokens_parts(
+                        [contextual_prefix, "\n\n", extracted_text], self.model
+                    )
 
-                # Validate metadata
-                self.metadata_validator.validate_metadata(metadata)
+                    if token_count > self.max_chunk_tokens:
+                        raise ChunkExtractionError(
+                            f"Chunk '{section.title}' exceeds token limit: "
+                            f"{token_count} > {self.max_chunk_tokens} tokens"
+                        )
 
-                # Collect LLM responses
-                llm_responses[section.title] = {
-                    "extraction": {
-                        "response": extraction_result.get("llm_response"),
-                        "cached": extraction_result.get("llm_response_cached", False)
-                    },
-                    "metadata_prefix": {
-                        "response": merged_result.get("llm_response"),
-                        "cached": merged_result.get("llm_response_cached", False)
-                    }
-                }
+                    chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
 
-                # Step 3: Combine and create chunk
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+                    chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
+                    cache_hit = structure.metadata.get("cache_hit", False)
 
-                if token_count > self.max_chunk_tokens:
-                    raise ChunkExtractionError(
-                        f"Chunk '{section.title}' exceeds token limit: "
-                        f"{token_count} > {self.max_chunk_tokens} tokens"
+                    processing_metadata = ProcessingMetadata(
+                        phase_1_model=structure.analysis_model,
+                        phase_2_model=self.model,
+                        cache_hit=cache_hit
                     )
 
-                chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
-                cache_hit = structure.metadata.get("cache_hit", False)
+                    chunk = Chunk(
+                        chunk_id=chunk_id,
+                        source_document=document.document_id,
+                        chunk_text=chunk_text,
+                        original_text=extracted_text,
+                        contextual_prefix=contextual_prefix,
+                        metadata=metadata,
+                        token_count=token_count,
+                        processing_metadata=processing_metadata
+                    )
 
-                processing_metadata = ProcessingMetadata(
-                    phase_1_model=structure.analysis_model,
-                    phase_2_model=self.model,
-                    cache_hit=cache_hit
-                )
+                    chunks.append(chunk)
 
-                chunk = Chunk(
-                    chunk_id=chunk_id,
-                    source_document=document.document_id,
-                    chunk_text=chunk_text,
-                    original_text=extracted_text,
-                    contextual_prefix=contextual_prefix,
-                    metadata=metadata,
-                    token_count=token_count,
-                    processing_metadata=processing_metadata
-                )
-
-                self.metadata_validator.validate_chunk(chunk)
-                chunks.append(chunk)
+                except Exception as e:
+                    if isinstance(e, (ChunkExtractionError, ValueError)):
+                        raise
+                    raise ChunkExtractionError(
+                        f"Failed to extract chunk for section '{section.title}': {str(e)}"
+                    ) from e
 
-            except Exception as e:
-                if isinstance(e, (ChunkExtractionError, ValueError)):
-                    raise
-                raise ChunkExtractionError(
-                    f"Failed to extract chunk for section '{section.title}': {str(e)}"
-                ) from e
+        # Validate all chunks (metadata included) in one finalization pass,
+        # off the per-section LLM critical path
+        if chunks:
+            self.metadata_validator.validate_chunks(chunks)
 
         return {
             "chunks": chunks,
@@ -868,14 +980,17 @@ class ChunkExtractorV2B:
         document_id: str,
         chapter_title: str,
         section_title: str,
-        chunk_text: str,
+        section_summary: str,
+        start_words: str,
+        end_words: str,
         document_text: str
     ) -> Dict[str, Any]:
-        """Generate metadata and prefix together using tagged output."""
+        """Generate metadata and prefix together using tagged output (located by boundaries)."""
+        section_info = f"{chapter_title}_{section_title}_{section_summary}_{start_words}_{end_words}"
         cache_key = None
         if self.cache_store:
             cache_key = self.generate_llm_response_key(
-                chunk_text, self.model, "generate_metadata_prefix_v2b"
+                document_text, self.model, "generate_metadata_prefix_v2b", section_info
             )
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -893,7 +1008,9 @@ class ChunkExtractorV2B:
             document_id=document_id,
             chapter_title=chapter_title,
             section_title=section_title,
-            chunk_text=chunk_text
+            section_summary=section_summary,
+            start_words=start_words,
+            end_words=end_words
         )
 
         try:
@@ -932,14 +1049,13 @@ class ChunkExtractorV2B:
                 "CHAPTER_TITLE", "SECTION_TITLE", "SUBSECTION_TITLE",
                 "SUMMARY", "CONTEXTUAL_PREFIX"
             ]
-            validate_tagged_format(response_text, expected_tags)
-
-            parsed = parse_tagged_output(response_text, expected_tags)
+            # Single scan: validate=True keeps validate_tagged_format's checks
+            parsed = parse_tagged_output(response_text, expected_tags, validate=True)
 
             # Extract metadata
             metadata = ChunkMetadata(
-                chapter_title=parsed["CHAPTER_TITLE"],
-                section_title=parsed["SECTION_TITLE"],
+                chapter_title=sys.intern(parsed["CHAPTER_TITLE"]),
+                section_title=sys.intern(parsed["SECTION_TITLE"]),
                 subsection_title=None if parsed["SUBSECTION_TITLE"].upper() == "NONE"
                                       else parsed["SUBSECTION_TITLE"],
                 summary=parsed["SUMMARY"]
@@ -1062,14 +1178,8 @@ class ChunkExtractorV2C:
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
     ) -> str:
-        """Generate cache key for raw LLM response."""
-        import hashlib
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
-        section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
-        if section_hash:
-            return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
-        return f"llm_{operation}_{content_hash}_{model_hash}"
+        """Generate cache key for raw LLM response (memoized module-level helper)."""
+        return generate_llm_response_key(content, model, operation, section_info)
 
     def extract_chunks(
         self,
@@ -1104,6 +1214,12 @@ class ChunkExtractorV2C:
                 if is_title_only:
                     continue
 
+                # Reject clearly oversized sections before any LLM call
+                _check_section_size(
+                    document.content, section.title,
+                    section.start_words, section.end_words, self.max_chunk_tokens
+                )
+
                 # Single call: extract + metadata + prefix all together
                 merged_result = self._extract_and_generate_all(
                     document,
@@ -1120,9 +1236,6 @@ class ChunkExtractorV2C:
                 contextual_prefix = merged_result["prefix"]
                 total_tokens_consumed += merged_result.get("tokens_consumed", 0)
 
-                # Validate metadata
-                self.metadata_validator.validate_metadata(metadata)
-
                 # Collect LLM response
                 llm_responses[section.title] = {
                     "merged": {
@@ -1131,9 +1244,10 @@ class ChunkExtractorV2C:
                     }
                 }
 
-                # Combine and create chunk
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+                # Check size on the parts, then combine and create chunk
+                token_count = self.token_counter.count_tokens_parts(
+                    [contextual_prefix, "\n\n", extracted_text], self.model
+                )
 
                 if token_count > self.max_chunk_tokens:
                     raise ChunkExtractionError(
@@ -1141,6 +1255,8 @@ class ChunkExtractorV2C:
                         f"{token_count} > {self.max_chunk_tokens} tokens"
                     )
 
+                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+
                 chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
                 cache_hit = structure.metadata.get("cache_hit", False)
 
@@ -1161,7 +1277,6 @@ class ChunkExtractorV2C:
                     processing_metadata=processing_metadata
                 )
 
-                self.metadata_validator.validate_chunk(chunk)
                 chunks.append(chunk)
 
             except Exception as e:
@@ -1171,6 +1286,11 @@ class ChunkExtractorV2C:
                     f"Failed to extract chunk for section '{section.title}': {str(e)}"
                 ) from e
 
+        # Validate all chunks (metadata included) in one finalization pass,
+        # off the per-section LLM critical path
+        if chunks:
+            self.metadata_validator.validate_chunks(chunks)
+
         return {
             "chunks": chunks,
             "tokens_consumed": total_tokens_consumed,
@@ -1267,17 +1387,16 @@ class ChunkExtractorV2C:
                 "CHUNK_TEXT", "CHAPTER_TITLE", "SECTION_TITLE",
                 "SUBSECTION_TITLE", "SUMMARY", "CONTEXTUAL_PREFIX"
             ]
-            validate_tagged_format(response_text, expected_tags)
-
-            parsed = parse_tagged_output(response_text, expected_tags)
+            # Single scan: validate=True keeps validate_tagged_format's checks
+            parsed = parse_tagged_output(response_text, expected_tags, validate=True)
 
             # Extract text
             extracted_text = parsed["CHUNK_TEXT"]
 
             # Extract metadata
             metadata = ChunkMetadata(
-                chapter_title=parsed["CHAPTER_TITLE"],
-                section_title=parsed["SECTION_TITLE"],
+                chapter_title=sys.intern(parsed["CHAPTER_TITLE"]),
+                section_title=sys.intern(parsed["SECTION_TITLE"]),
                 subsection_title=None if parsed["SUBSECTION_TITLE"].upper() == "NONE"
                                       else parsed["SUBSECTION_TITLE"],
                 summary=parsed["SUMMARY"]
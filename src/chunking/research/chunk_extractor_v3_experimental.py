@@ -1,7 +1,7 @@
 """
 Experimental chunk extraction V3: Cache-optimized with tag-based parsing (metadata-free).
 
-This module contains 2 experimental versions optimized for LLM caching by placing
+This module contains 3 experimental versions optimized for LLM caching by placing
 static content (document text) at the beginning of prompts. Metadata is derived
 from Phase 1 structure analysis (no redundant LLM calls).
 
@@ -12,22 +12,33 @@ Key Improvements over V2:
     - Simpler debugging (fewer moving parts)
 
 Versions:
-    V3A: 2 LLM calls (extract, prefix) - CONSERVATIVE
+    V3A: 1 merged LLM call by default; strategy="separate" keeps 2 calls
+         (extract, prefix) - CONSERVATIVE
     V3B: 1 LLM call (extract + prefix merged) - AGGRESSIVE
+    V3C: 1 LLM call for many sections (V3B mega-batch) - EXPERIMENTAL
 
 Cache Efficiency:
-    V3A: ~50-60% (document cached, reused 2x per section)
+    V3A: ~50-60% with separate calls (document cached, reused 2x per section)
     V3B: ~80-90% (document cached, reused for all sections)
+    V3C: document sent once per batch instead of once per section
 """
 
+import functools
+import hashlib
 import json
-from typing import Dict, Any, List
-
-from tqdm import tqdm
-
+import logging
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Sequence
+
+from .concurrency import map_in_order
 from .llm_provider import LLMProvider
 from .metadata_validator import MetadataValidator
-from .tag_parser import parse_tagged_output, validate_tagged_format, TagParsingError
+from .tag_parser import parse_tag_families
 from .models import (
     Chunk,
     ChunkMetadata,
@@ -38,15 +49,35 @@ from .models import (
     SectionV2,
     TokenCounter,
 )
+from .templates import compile_template, fast_format
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
 # Metadata Derivation (No LLM Needed!)
 # ============================================================================
 
+def build_children_index(structure: Structure) -> Dict[tuple, List[str]]:
+    """
+    Index section titles by (parent_section, level) in a single pass.
+
+    Args:
+        structure: Document structure from Phase 1
+
+    Returns:
+        Dict mapping (parent_title, level) to child titles in section order
+    """
+    children_index: Dict[tuple, List[str]] = {}
+    for s in structure.sections:
+        children_index.setdefault((s.parent_section, s.level), []).append(s.title)
+    return children_index
+
+
 def derive_metadata_from_structure(
     structure: Structure,
-    section: SectionV2
+    section: SectionV2,
+    children_index: Dict[tuple, List[str]] | None = None
 ) -> ChunkMetadata:
     """
     Derive chunk metadata from Phase 1 structure (no LLM call needed).
@@ -57,6 +88,8 @@ def derive_metadata_from_structure(
     Args:
         structure: Document structure from Phase 1
         section: Current section being processed
+        children_index: Optional index from build_children_index(); pass it when
+            deriving metadata for many sections to avoid rescanning all sections
 
     Returns:
         ChunkMetadata with fields derived from Phase 1 data
@@ -67,15 +100,15 @@ def derive_metadata_from_structure(
         - subsection_title: From hierarchy (find ALL child sections)
         - summary: From section.summary (already generated in Phase 1!)
     """
-    # Find ALL subsection titles from hierarchy
-    subsection_titles = []
+    if children_index is None:
+        children_index = build_children_index(structure)
 
     # Collect all direct children (one level deeper)
-    for s in structure.sections:
-        if s.parent_section == section.title and s.level == section.level + 1:
-            subsection_titles.append(s.title)
+    subsection_titles = list(children_index.get((section.title, section.level + 1), []))
 
-    return ChunkMetadata(
+    # Built from our own Phase 1 data: skip Pydantic validation, callers run
+    # MetadataValidator.validate_metadata() on the result
+    return ChunkMetadata.model_construct(
         chapter_title=structure.chapter_title,
         section_title=section.title,
         subsection_title=subsection_titles,  # ← List of all subsections!
@@ -87,20 +120,13 @@ def derive_metadata_from_structure(
 # Instruction Templates (No Document Text - For Cache Optimization)
 # ============================================================================
 
-EXTRACTION_INSTRUCTIONS_V3 = """You are extracting a specific section of text from the above document for chunking purposes.
-
-Your task: Extract and format the complete text for the section described below. Output EXACTLY as it appears in the document, preserving all content but with clean formatting.
-
-TARGET SECTION:
-- Title: {section_title}
-- Summary: {section_summary}
-- Is Table: {is_table}
-- Maximum tokens: {max_tokens}
+# Static part of the extraction instructions (identical for every section).
+# Sent right after the document so it falls inside the cached prefix.
+EXTRACTION_STATIC_PROLOGUE_V3 = """You are extracting a specific section of text from the above document for chunking purposes.
 
-BOUNDARY HINTS (for locating the section):
-- Section STARTS near: "{start_words}"
+Your task: Extract and format the complete text for the section described at the end of these instructions. Output EXACTLY as it appears in the document, preserving all content but with clean formatting.
 
-Note: These boundary hints are approximate guides, not exact quotes. The actual text may have minor variations in capitalization, punctuation, or word order. Use them to locate the general boundaries, then extract the complete section content.
+Note: The boundary hints given for the section are approximate guides, not exact quotes. The actual text may have minor variations in capitalization, punctuation, or word order. Use them to locate the general boundaries, then extract the complete section content.
 
 EXTRACTION RULES:
 1. Output the COMPLETE text for this section - do NOT summarize or paraphrase
@@ -131,11 +157,26 @@ EXTRACTION RULES:
    - Skip any content from the target section (unless it's a table in non-table segment)
    - Add content not in the original section
    - Include content from other sections (respect the boundaries!)
-6. Output ONLY the extracted text, no explanations or preamble
+6. Output ONLY the extracted text, no explanations or preamble"""
+
+
+# Per-section part of the extraction instructions (not cached)
+EXTRACTION_DYNAMIC_TAIL_V3 = """TARGET SECTION:
+- Title: {section_title}
+- Summary: {section_summary}
+- Is Table: {is_table}
+- Maximum tokens: {max_tokens}
+
+BOUNDARY HINTS (for locating the section):
+- Section STARTS near: "{start_words}"
+- Section ENDS near: "{end_words}"
 
 OUTPUT (extracted section text):"""
 
 
+EXTRACTION_INSTRUCTIONS_V3 = f"{EXTRACTION_STATIC_PROLOGUE_V3}\n\n{EXTRACTION_DYNAMIC_TAIL_V3}"
+
+
 PREFIX_INSTRUCTIONS_V3 = """You are generating a contextual prefix for a document chunk to improve RAG retrieval.
 
 Your task: Write a concise sentence that situates this chunk within the overall document.
@@ -164,21 +205,10 @@ GUIDELINES:
 OUTPUT (contextual prefix):"""
 
 
-MERGED_INSTRUCTIONS_V3 = """You are processing a document chunk for a RAG pipeline. Your task: extract the section text AND create a contextual prefix - both in one operation.
-
-CONTEXT:
-- Document: {document_id}
-- Chapter: {chapter_title}
-- Target Section: {section_title}
-- Section Summary: {section_summary}
-- Is Table: {is_table}
-- Maximum tokens: {max_tokens}
-
-BOUNDARY HINTS (for locating the section):
-- Section STARTS near: "{start_words}"
-- Section ENDS near: "{end_words}"
+# Static part of the merged instructions (identical for every section)
+MERGED_STATIC_PROLOGUE_V3 = """You are processing a document chunk for a RAG pipeline. Your task: extract the section text AND create a contextual prefix - both in one operation. The target section is described at the end of the user message.
 
-Note: These boundary hints are approximate guides, not exact quotes. Use them to locate the general boundaries, then extract the complete section content.
+Note: The boundary hints given for the section are approximate guides, not exact quotes. Use them to locate the general boundaries, then extract the complete section content.
 
 OUTPUT FORMAT: Tagged structure with exactly 2 fields:
 
@@ -204,35 +234,397 @@ IMPORTANT RULES:
 5. For non-tables: Exclude any table content
 6. Prefix should ideally start with "This chunk is from..." (but not required)
 7. Output ALL 2 fields in the order shown
-8. Output ONLY the tagged structure, no explanations or preambles
+8. Output ONLY the tagged structure, no explanations or preambles"""
+
+
+# Per-section part of the merged instructions (not cached)
+MERGED_DYNAMIC_TAIL_V3 = """CONTEXT:
+- Document: {document_id}
+- Chapter: {chapter_title}
+- Target Section: {section_title}
+- Section Summary: {section_summary}
+- Is Table: {is_table}
+- Maximum tokens: {max_tokens}
+
+BOUNDARY HINTS (for locating the section):
+- Section STARTS near: "{start_words}"
+- Section ENDS near: "{end_words}"
 
 OUTPUT (tagged extraction + prefix):"""
 
 
+MERGED_INSTRUCTIONS_V3 = f"{MERGED_STATIC_PROLOGUE_V3}\n\n{MERGED_DYNAMIC_TAIL_V3}"
+
+
+BATCH_EXTRACTION_INSTRUCTIONS_V3 = """You are extracting several sections of text from the above document for chunking purposes.
+
+Your task: For EACH target section listed below, extract and format its complete text. Output EXACTLY as it appears in the document, preserving all content but with clean formatting.
+
+TARGET SECTIONS:
+{section_list}
+
+Note: Boundary hints are approximate guides, not exact quotes. Use them to locate the general boundaries, then extract the complete section content.
+
+EXTRACTION RULES:
+1. Output the COMPLETE text for every section - do NOT summarize or paraphrase
+2. Respect the boundaries: do not include content from other sections
+3. If Is Table = true: extract ONLY the table as clean markdown. If false: EXCLUDE tables.
+4. You MAY clean up formatting (normalize whitespace, fix typos, add markdown structure)
+
+OUTPUT FORMAT: One tagged block per section, using the section number:
+
+[CHUNK_001]
+Extracted text for section 001
+[/CHUNK_001]
+[CHUNK_002]
+Extracted text for section 002
+[/CHUNK_002]
+
+Output ALL {section_count} blocks and ONLY the tagged blocks, no explanations or preamble.
+
+OUTPUT (tagged extracted sections):"""
+
+
+BATCH_SECTION_ENTRY_V3 = """[SECTION {number}]
+- Title: {section_title}
+- Summary: {section_summary}
+- Is Table: {is_table}
+- Maximum tokens: {max_tokens}
+- STARTS near: "{start_words}"
+- ENDS near: "{end_words}\""""
+
+
+BATCH_MERGED_INSTRUCTIONS_V3C = """You are processing document chunks for a RAG pipeline. Your task: for EACH target section listed below, extract the section text AND create a contextual prefix.
+
+CONTEXT:
+- Document: {document_id}
+- Chapter: {chapter_title}
+
+TARGET SECTIONS:
+{section_list}
+
+Note: Boundary hints are approximate guides, not exact quotes. Use them to locate the general boundaries, then extract the complete section content.
+
+OUTPUT FORMAT: Two tagged fields per section, numbered with the section number:
+
+[CHUNK_TEXT_1]
+The complete extracted text for section 1.
+Extract EXACTLY as it appears in the document, preserving all content.
+[/CHUNK_TEXT_1]
+[CONTEXTUAL_PREFIX_1]Concise sentence situating chunk 1 in document (ideally 20-50 words, typically starts with "This chunk is from...").[/CONTEXTUAL_PREFIX_1]
+[CHUNK_TEXT_2]
+...
+[/CHUNK_TEXT_2]
+[CONTEXTUAL_PREFIX_2]...[/CONTEXTUAL_PREFIX_2]
+
+IMPORTANT RULES:
+1. CHUNK_TEXT must be complete - do NOT summarize or truncate
+2. Respect the boundaries: do not include content from other sections
+3. If Is Table = true: extract ONLY the table as clean markdown and mention it in the prefix. If false: EXCLUDE tables.
+4. You MAY clean up formatting (normalize whitespace, fix typos, add markdown structure)
+5. Output both fields for ALL {section_count} sections, in section order
+6. Output ONLY the tagged fields, no explanations or preambles
+
+OUTPUT (tagged extraction + prefix for every section):"""
+
+
+# Matches one [CHUNK_nnn]...[/CHUNK_nnn] block of a batch extraction response
+_BATCH_CHUNK_RE = re.compile(r"\[CHUNK_(\d+)\](.*?)\[/CHUNK_\1\]", re.DOTALL)
+
+# Output tokens reserved for tags and slack when sizing extraction batches
+BATCH_OUTPUT_SAFETY_TOKENS = 1024
+
+# Output tokens budgeted per section for the V3C contextual prefix and tags
+BATCH_PREFIX_TOKENS = 128
+
+# Tag parsers for LLM responses (compiled once, shared by all sections)
+_CHUNK_TEXT_RE = re.compile(r"\[CHUNK_TEXT\]\s*(.*?)\s*\[/CHUNK_TEXT\]", re.DOTALL)
+_PREFIX_RE = re.compile(r"\[CONTEXTUAL_PREFIX\]\s*(.*?)\s*\[/CONTEXTUAL_PREFIX\]", re.DOTALL)
+
+# Both merged-output tags in the prompted order, captured in one scan
+_MERGED_TAG_RE = re.compile(
+    r"\[CHUNK_TEXT\]\s*(?P<chunk>.*?)\s*\[/CHUNK_TEXT\]"
+    r".*?\[CONTEXTUAL_PREFIX\]\s*(?P<prefix>.*?)\s*\[/CONTEXTUAL_PREFIX\]",
+    re.DOTALL
+)
+
+# Minimum seconds between progress bar redraws (~10 updates/sec)
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Completed sections whose token counts are computed in one tokenizer call
+TOKEN_COUNT_BATCH_SIZE = 32
+
+# Max parsed V3B responses kept in the extractor's memo
+PARSED_MEMO_SIZE = 256
+
+# V3A section strategies
+STRATEGY_MERGED = "merged"
+STRATEGY_SEPARATE = "separate"
+
+
+# ============================================================================
+# Pre-compiled Templates
+# ============================================================================
+
+def parse_merged_tags(response_text: str) -> tuple[str, str] | None:
+    """
+    Parse [CHUNK_TEXT] and [CONTEXTUAL_PREFIX] from a merged response.
+
+    One regex scan for the usual order; separate searches only when the model
+    swapped the tags. Returns (extracted_text, prefix), or None if either is missing.
+    """
+    match = _MERGED_TAG_RE.search(response_text)
+    if match:
+        return match.group("chunk"), match.group("prefix")
+    text_match = _CHUNK_TEXT_RE.search(response_text)
+    prefix_match = _PREFIX_RE.search(response_text)
+    if not text_match or not prefix_match:
+        return None
+    return text_match.group(1), prefix_match.group(1)
+
+
+def specialize_template(compiled: List[tuple], name: str = "render") -> Callable[..., str]:
+    """
+    Generate a renderer with the template inlined as a single f-string.
+
+    The output of compile_template() is turned into source code once and
+    compiled, so rendering is one string build with no per-segment loop or
+    kwargs lookups. Unknown keyword arguments are ignored, like fast_format().
+
+    Args:
+        compiled: Output of compile_template()
+        name: Name of the generated function (shows up in tracebacks)
+
+    Returns:
+        Keyword-only function producing the same string as fast_format(compiled, ...)
+    """
+    fields = list(dict.fromkeys(field for _, field in compiled if field is not None))
+    body = "".join(
+        literal.replace("{", "{{").replace("}", "}}") + (f"{{{field}}}" if field is not None else "")
+        for literal, field in compiled
+    )
+    params = ", ".join(fields + ["**_unused"])
+    source = f"def {name}(*, {params}):\n    return f{body!r}\n"
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<template {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_EXTRACTION_TAIL_COMPILED = compile_template(EXTRACTION_DYNAMIC_TAIL_V3)
+_PREFIX_COMPILED = compile_template(PREFIX_INSTRUCTIONS_V3)
+_MERGED_TAIL_COMPILED = compile_template(MERGED_DYNAMIC_TAIL_V3)
+_BATCH_EXTRACTION_COMPILED = compile_template(BATCH_EXTRACTION_INSTRUCTIONS_V3)
+_BATCH_SECTION_ENTRY_COMPILED = compile_template(BATCH_SECTION_ENTRY_V3)
+_BATCH_MERGED_COMPILED = compile_template(BATCH_MERGED_INSTRUCTIONS_V3C)
+
+# Generated renderers (fast path); fast_format() on the compiled segments is the fallback
+_RENDERERS = {
+    "extraction_tail": specialize_template(_EXTRACTION_TAIL_COMPILED, "render_extraction_tail"),
+    "prefix": specialize_template(_PREFIX_COMPILED, "render_prefix"),
+    "merged_tail": specialize_template(_MERGED_TAIL_COMPILED, "render_merged_tail"),
+    "batch_extraction": specialize_template(_BATCH_EXTRACTION_COMPILED, "render_batch_extraction"),
+    "batch_section_entry": specialize_template(_BATCH_SECTION_ENTRY_COMPILED, "render_batch_section_entry"),
+}
+_COMPILED_TEMPLATES = {
+    "extraction_tail": _EXTRACTION_TAIL_COMPILED,
+    "prefix": _PREFIX_COMPILED,
+    "merged_tail": _MERGED_TAIL_COMPILED,
+    "batch_extraction": _BATCH_EXTRACTION_COMPILED,
+    "batch_section_entry": _BATCH_SECTION_ENTRY_COMPILED,
+}
+
+
+# ============================================================================
+# Chunk Output
+# ============================================================================
+
+def write_chunk_json(chunk_file: Path, chunk: Chunk) -> None:
+    """
+    Write one chunk as indented JSON.
+
+    Uses Pydantic's native serializer, which encodes straight to JSON without
+    building an intermediate dict or going through the json module.
+    """
+    chunk_file.write_bytes(chunk.model_dump_json(indent=2).encode("utf-8"))
+
+
+# Progressive output modes
+OUTPUT_MODE_JSONL = "jsonl"          # one {document_id}_chunks.jsonl per document
+OUTPUT_MODE_PER_CHUNK = "per_chunk"  # one indented {chunk_id}.json per chunk (debugging)
+
+
+class ChunkOutputWriter:
+    """
+    Progressive chunk output on a single background writer thread.
+
+    The section loop only queues writes, so it never blocks on disk I/O; the
+    single thread keeps writes ordered without locks. In JSONL mode one file
+    handle is opened per document and each chunk is appended as one line
+    (chunk_id identifies it; lines follow completion order).
+    """
+
+    def __init__(self, output_dir: Path, document_id: str, output_mode: str = OUTPUT_MODE_JSONL):
+        if output_mode not in (OUTPUT_MODE_JSONL, OUTPUT_MODE_PER_CHUNK):
+            raise ValueError(
+                f"Unknown output mode '{output_mode}' "
+                f"(expected '{OUTPUT_MODE_JSONL}' or '{OUTPUT_MODE_PER_CHUNK}')"
+            )
+
+        self.output_dir = output_dir
+        self.output_mode = output_mode
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._futures: List[Future] = []
+        self._jsonl_fp = None
+        if output_mode == OUTPUT_MODE_JSONL:
+            # Rewritten on every run, like the per-chunk files
+            self._jsonl_fp = (output_dir / f"{document_id}_chunks.jsonl").open("wb")
+
+    def submit(self, chunk: Chunk) -> None:
+        """Queue one chunk for writing."""
+        if self._jsonl_fp is not None:
+            self._futures.append(self._executor.submit(self._append_line, chunk))
+        else:
+            chunk_file = self.output_dir / f"{chunk.chunk_id}.json"
+            self._futures.append(self._executor.submit(write_chunk_json, chunk_file, chunk))
+
+    def _append_line(self, chunk: Chunk) -> None:
+        """Append one chunk as a JSON line (runs on the writer thread)."""
+        self._jsonl_fp.write(chunk.model_dump_json().encode("utf-8") + b"\n")
+
+    def close(self) -> None:
+        """Wait for queued writes and close the JSONL file (does not raise write errors)."""
+        self._executor.shutdown(wait=True)
+        if self._jsonl_fp is not None:
+            self._jsonl_fp.close()
+
+    def raise_for_errors(self) -> None:
+        """Re-raise the first write failure, if any (call after close())."""
+        for write_future in self._futures:
+            write_future.result()
+
+
 # ============================================================================
-# Version V3A: Separate Calls (Conservative)
+# Provider Cache Metrics
+# ============================================================================
+
+# cache_status -> run counter name in extract_chunks()["cache_stats"]
+_CACHE_STATUS_COUNTERS = {"hit": "hits", "write": "writes", "miss": "misses"}
+
+
+def parse_cache_metrics(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read provider-side prompt cache metrics from a chat completion response.
+
+    Handles both Anthropic-style counters (cache_read_input_tokens /
+    cache_creation_input_tokens) and the OpenAI-style
+    usage.prompt_tokens_details.cached_tokens that OpenRouter reports for
+    Gemini and OpenAI models.
+
+    Returns:
+        Dict with cache_discount, cache_read_tokens, cache_write_tokens and
+        cache_status ("hit", "write" or "miss")
+    """
+    usage = response.get("usage") or {}
+    prompt_details = usage.get("prompt_tokens_details") or {}
+
+    cache_read_tokens = (
+        usage.get("cache_read_input_tokens") or prompt_details.get("cached_tokens") or 0
+    )
+    cache_write_tokens = usage.get("cache_creation_input_tokens") or 0
+
+    if cache_read_tokens > 0:
+        cache_status = "hit"
+    elif cache_write_tokens > 0:
+        cache_status = "write"
+    else:
+        cache_status = "miss"
+
+    return {
+        "cache_discount": response.get("cache_discount") or 0,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_write_tokens": cache_write_tokens,
+        "cache_status": cache_status
+    }
+
+
+# ============================================================================
+# Cache Key Inputs
+# ============================================================================
+
+# Characters of each boundary hint / chunk edge that go into cache keys
+CACHE_KEY_HINT_CHARS = 64
+CACHE_KEY_TEXT_CHARS = 256
+
+# Operation part of LLM response cache keys. The _pN suffix is the prompt
+# version: bump it in the same change as any edit to the messages sent for the
+# operation, so responses to an older prompt are not served for the new one.
+CACHE_OP_EXTRACT_V3A = "extract_text_v3a_p2"
+CACHE_OP_MERGED_V3A = "merged_v3_p3"
+CACHE_OP_PREFIX_V3A = "generate_prefix_v3a_p2"
+CACHE_OP_MERGED_V3B = "extract_prefix_v3b_p2"
+CACHE_OP_BATCH_V3C = "extract_batch_v3c"
+
+def section_cache_info(
+    section_title: str, start_words: str, end_words: str, is_table: bool
+) -> str:
+    """
+    Build the per-section part of an LLM response cache key from cheap inputs.
+
+    The summary is left out and boundary hints are truncated to
+    CACHE_KEY_HINT_CHARS; title plus hint prefixes already identify a section
+    within a document (whose full hash is part of the key).
+    """
+    return (
+        f"{section_title}_{start_words[:CACHE_KEY_HINT_CHARS]}_"
+        f"{end_words[:CACHE_KEY_HINT_CHARS]}_{is_table}"
+    )
+
+
+def chunk_cache_info(document_id: str, section_title: str, chunk_text: str) -> str:
+    """
+    Identify a chunk for prefix cache keys without hashing its full text.
+
+    Uses the length plus the first and last CACHE_KEY_TEXT_CHARS characters
+    of the chunk text.
+    """
+    return (
+        f"{document_id}_{section_title}_{len(chunk_text)}_"
+        f"{chunk_text[:CACHE_KEY_TEXT_CHARS]}_{chunk_text[-CACHE_KEY_TEXT_CHARS:]}"
+    )
+
+
+# ============================================================================
+# Version V3A: Merged or Separate Calls
 # ============================================================================
 
 class ChunkExtractorV3A:
     """
-    Version V3A: Separate calls (Conservative).
+    Version V3A: Merged call by default, separate calls on request.
 
     Architecture:
-        - 2 LLM calls per section: extract → prefix
-        - Both calls start with document text for cache efficiency
+        - strategy="merged" (default): 1 LLM call per section (extract + prefix),
+          tagged output, same single-call shape as V3B
+        - strategy="separate" (Conservative): 2 LLM calls per section:
+          extract (plain text) → prefix; optionally batched extraction
+        - Extraction calls start with document text for cache efficiency;
+          the prefix call sends only metadata + extracted chunk text
         - Metadata derived from Phase 1 structure (no LLM call)
-        - Plain text output for both operations
 
-    Cache Efficiency: ~50-60% (document cached, reused 2x per section)
+    Differs from V3B in prompt layout: the static instructions are a second
+    cached part of the user message rather than a system message, and cache
+    keys use V3A's own operation names.
+
+    Cache Efficiency ("separate"): 1 large cached call (extract) + 1 small
+    uncached call (prefix) per section
 
     Pros:
-        ✅ Clear separation of concerns
-        ✅ Easy to debug individual operations
+        ✅ Separate strategy keeps concerns apart = easy to debug
         ✅ No redundant metadata generation
         ✅ Perfect consistency with Phase 1
 
     Cons:
-        ❌ 2 LLM calls per section = moderate latency
+        ❌ Separate strategy: 2 LLM calls per section = moderate latency
     """
 
     def __init__(
@@ -243,9 +635,37 @@ class ChunkExtractorV3A:
         model: str = "google/gemini-2.5-flash",
         max_chunk_tokens: int = 1000,
         cache_store=None,
-        output_dir=None
+        output_dir=None,
+        show_progress: bool = True,
+        max_concurrency: int = 16,
+        batch_size: int = 1,
+        max_output_tokens: int = 8192,
+        strategy: str = STRATEGY_MERGED,
+        output_mode: str = OUTPUT_MODE_JSONL,
+        fast_path: bool = True
     ):
-        """Initialize V3A chunk extractor."""
+        """
+        Initialize V3A chunk extractor.
+
+        strategy="merged" (default) extracts text and prefix with one call per
+        section; strategy="separate" keeps the original extract → prefix calls.
+
+        tqdm is only imported when show_progress is set. max_concurrency bounds
+        how many sections are in flight against the LLM endpoint at once.
+        batch_size > 1 extracts up to that many sections per LLM call, capped so
+        the batch fits in max_output_tokens; failed batch parses fall back to
+        single-section extraction. Batching applies to the separate strategy only.
+        output_mode selects progressive output under output_dir: "jsonl" (one
+        file per document) or "per_chunk" (one JSON file per chunk).
+        fast_path renders prompts with generated f-string functions; set it to
+        False to use plain fast_format() when debugging templates.
+        """
+        if strategy not in (STRATEGY_MERGED, STRATEGY_SEPARATE):
+            raise ValueError(
+                f"Unknown V3A strategy '{strategy}' "
+                f"(expected '{STRATEGY_MERGED}' or '{STRATEGY_SEPARATE}')"
+            )
+
         self.llm_client = llm_client
         self.token_counter = token_counter
         self.metadata_validator = metadata_validator
@@ -253,14 +673,64 @@ class ChunkExtractorV3A:
         self.max_chunk_tokens = max_chunk_tokens
         self.cache_store = cache_store
         self.output_dir = output_dir
+        self.show_progress = show_progress
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.max_output_tokens = max_output_tokens
+        self.strategy = strategy
+        self.output_mode = output_mode
+        self.fast_path = fast_path
+
+        # Prompt renderers, resolved once instead of per section
+        if fast_path:
+            self._render = dict(_RENDERERS)
+        else:
+            self._render = {
+                key: functools.partial(fast_format, compiled)
+                for key, compiled in _COMPILED_TEMPLATES.items()
+            }
+
+        # Hash memo: the same document text is hashed once, not once per section.
+        # Keyed by id() and holding the string itself so a reused id cannot alias.
+        self._content_hash_cache: dict[int, tuple[str, str]] = {}
+        self._model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
+
+        # Provider prompt-cache counters for the current run
+        self._cache_stats: Dict[str, int] = {}
+        self._cache_stats_lock = threading.Lock()
+
+    def _record_cache_metrics(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse provider cache metrics from a response and add them to the run totals."""
+        metrics = parse_cache_metrics(response)
+        with self._cache_stats_lock:
+            status_key = _CACHE_STATUS_COUNTERS[metrics["cache_status"]]
+            self._cache_stats[status_key] = self._cache_stats.get(status_key, 0) + 1
+            self._cache_stats["cache_read_tokens"] = (
+                self._cache_stats.get("cache_read_tokens", 0) + metrics["cache_read_tokens"]
+            )
+            self._cache_stats["cache_write_tokens"] = (
+                self._cache_stats.get("cache_write_tokens", 0) + metrics["cache_write_tokens"]
+            )
+        return metrics
+
+    def _content_hash(self, content: str) -> str:
+        """Return SHA-256 of content, memoized per content object."""
+        cached = self._content_hash_cache.get(id(content))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        self._content_hash_cache[id(content)] = (content, content_hash)
+        return content_hash
 
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
     ) -> str:
         """Generate cache key for raw LLM response."""
-        import hashlib
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
+        content_hash = self._content_hash(content)
+        if model == self.model:
+            model_hash = self._model_hash
+        else:
+            model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
         section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
         if section_hash:
             return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
@@ -269,7 +739,8 @@ class ChunkExtractorV3A:
     def _build_cached_message(
         self,
         document_text: str,
-        instructions: str
+        instructions: str,
+        static_instructions: str | None = None
     ) -> list[dict[str, Any]]:
         """
         Build multipart message with cache_control for OpenRouter.
@@ -277,28 +748,36 @@ class ChunkExtractorV3A:
         Args:
             document_text: Full document content (STATIC - will be cached)
             instructions: Operation instructions with params (DYNAMIC - not cached)
+            static_instructions: Instruction boilerplate shared by every section
+                (STATIC - cached behind its own breakpoint)
 
         Returns:
-            Message list with cache_control breakpoint
+            Message list with cache_control breakpoints
 
         Structure:
-            Part 1: Document text with cache_control (CACHED after first call)
-            Part 2: Instructions (NOT CACHED, changes per section)
+            Part 1: Document text with cache_control (CACHED after first call,
+                shared by every operation on this document)
+            Part 2: Static instructions with cache_control (CACHED, per operation)
+            Part 3: Dynamic instructions (NOT CACHED, changes per section)
         """
-        return [{
-            "role": "user",
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"DOCUMENT TEXT:\n{document_text}",
-                    "cache_control": {"type": "ephemeral"}
-                },
-                {
-                    "type": "text",
-                    "text": f"\n---\n\n{instructions}"
-                }
-            ]
-        }]
+        content = [
+            {
+                "type": "text",
+                "text": f"DOCUMENT TEXT:\n{document_text}",
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
+        if static_instructions:
+            content.append({
+                "type": "text",
+                "text": f"\n---\n\n{static_instructions}",
+                "cache_control": {"type": "ephemeral"}
+            })
+        content.append({
+            "type": "text",
+            "text": f"\n---\n\n{instructions}"
+        })
+        return [{"role": "user", "content": content}]
 
     def extract_chunks(
         self,
@@ -306,7 +785,11 @@ class ChunkExtractorV3A:
         structure: Structure
     ) -> Dict[str, Any]:
         """
-        Extract chunks from document using V3A strategy (2 calls + derived metadata).
+        Extract chunks from document using V3A (1 merged or 2 separate calls + derived metadata).
+
+        The first section runs alone to warm the provider's prompt cache, then
+        the rest are processed concurrently (up to max_concurrency in flight);
+        output order matches section order.
 
         Returns dict with chunks, tokens_consumed, and llm_responses.
         """
@@ -316,116 +799,393 @@ class ChunkExtractorV3A:
 
         # Check for V2 format (word boundaries)
         first_section = structure.sections[0]
-        if not hasattr(first_section, 'start_words') or not hasattr(first_section, 'end_words'):
+        if not isinstance(first_section, SectionV2):
             raise ChunkExtractionError(
                 "Structure does not contain word boundaries (start_words/end_words). "
                 "Use StructureAnalyzerV2 to generate V2-compatible structures."
             )
 
-        chunks = []
-        total_tokens_consumed = 0
-
-        import logging
-        logger = logging.getLogger(__name__)
+        # Hash memo is scoped to one run so it does not pin old documents
+        self._content_hash_cache.clear()
+        self._cache_stats = {
+            "hits": 0, "writes": 0, "misses": 0,
+            "cache_read_tokens": 0, "cache_write_tokens": 0
+        }
 
         # Count total sections to process (skip title-only)
-        sections_to_process = [s for s in structure.sections if s.start_words or s.end_words]
+        sections_to_process = tuple(s for s in structure.sections if s.start_words or s.end_words)
+
+        # Progress bar (optional, tqdm imported lazily)
+        pbar = None
+        if self.show_progress:
+            from tqdm import tqdm
+            pbar = tqdm(
+                total=len(sections_to_process), desc="Extracting chunks (V3A)", unit="section",
+                mininterval=PROGRESS_MIN_INTERVAL
+            )
+        # Section-title postfix only on a terminal (no use in logs/pipes)
+        show_postfix = pbar is not None and sys.stderr.isatty()
+
+        # Pre-sized result slots preserve section order regardless of completion order
+        results: List[Any] = [None] * len(sections_to_process)
+
+        # Parent -> children lookup built once for metadata derivation
+        children_index = build_children_index(structure)
+
+        # Group section indices into extraction batches (size 1 = one call per section)
+        batch_size = self._effective_batch_size()
+        batches = [
+            list(range(start, min(start + batch_size, len(sections_to_process))))
+            for start in range(0, len(sections_to_process), batch_size)
+        ]
+
+        # Background writer: chunks are written progressively (every
+        # TOKEN_COUNT_BATCH_SIZE sections) without blocking result collection
+        writer = None
+        if self.output_dir:
+            writer = ChunkOutputWriter(self.output_dir, document.document_id, self.output_mode)
+
+        def finalize(pending_indices: List[int]) -> None:
+            # One tokenizer call for the whole group, then queue file writes
+            chunks = self._build_chunks([results[i][0] for i in pending_indices])
+            for i, chunk in zip(pending_indices, chunks):
+                results[i] = (chunk, results[i][1])
+                if writer is not None:
+                    writer.submit(chunk)
+
+        # Batches run concurrently after the first (see map_in_order), in section order
+        batch_results = map_in_order(
+            lambda indices: self._process_batch(
+                indices, sections_to_process, document, structure, children_index
+            ),
+            batches,
+            self.max_concurrency
+        )
+        pending: List[int] = []
+        try:
+            for indices, batch_result in zip(batches, batch_results):
+                for i, result in zip(indices, batch_result):
+                    results[i] = result
+                    pending.append(i)
+                if len(pending) >= TOKEN_COUNT_BATCH_SIZE:
+                    finalize(pending)
+                    pending = []
+                if pbar is not None:
+                    if show_postfix:
+                        # No forced redraw; shown on tqdm's next throttled refresh
+                        pbar.set_postfix_str(
+                            f"{sections_to_process[indices[-1]].title[:40]}...", refresh=False
+                        )
+                    pbar.update(len(indices))
+            if pending:
+                finalize(pending)
+        finally:
+            # Fail fast: drop batches that have not started yet
+            batch_results.close()
+            if pbar is not None:
+                pbar.close()
+            if writer is not None:
+                writer.close()
+
+        if writer is not None:
+            writer.raise_for_errors()
+
+        chunks = [chunk for chunk, _ in results]
+        total_tokens_consumed = sum(tokens for _, tokens in results)
+
+        cache_stats = dict(self._cache_stats)
+        logger.info(
+            f"V3A: {len(chunks)} chunks, {total_tokens_consumed:,} tokens "
+            f"(provider cache: {cache_stats['hits']} hits, {cache_stats['writes']} writes, "
+            f"{cache_stats['misses']} misses, {cache_stats['cache_read_tokens']:,} tokens read)"
+        )
 
-        # Progress bar
-        pbar = tqdm(sections_to_process, desc="Extracting chunks (V3A)", unit="section")
+        return {
+            "chunks": chunks,
+            "tokens_consumed": total_tokens_consumed,
+            "cache_stats": cache_stats
+        }
 
-        # Extract chunk for each section
-        for i, section in enumerate(pbar):
-            try:
-                # Update progress bar description
-                pbar.set_postfix_str(f"{section.title[:40]}...")
+    def _effective_batch_size(self) -> int:
+        """Sections per extraction call, capped so the batch output fits the model limit."""
+        if self.strategy != STRATEGY_SEPARATE or self.batch_size <= 1:
+            return 1
+        output_budget = self.max_output_tokens - BATCH_OUTPUT_SAFETY_TOKENS
+        return max(1, min(self.batch_size, output_budget // self.max_chunk_tokens))
 
-                # Get is_table flag (default to False for backward compatibility)
-                is_table = getattr(section, 'is_table', False)
+    def _process_batch(
+        self,
+        indices: List[int],
+        sections: Sequence[SectionV2],
+        document: Document,
+        structure: Structure,
+        children_index: Dict[tuple, List[str]] | None = None
+    ) -> List[tuple[Dict[str, Any], int]]:
+        """
+        Process a group of sections, extracting their text with one LLM call when batched.
 
-                # Extract text
-                extraction_result = self._extract_section_text(
-                    document,
-                    section.title,
-                    section.summary,
-                    section.start_words,
-                    section.end_words,
-                    self.max_chunk_tokens,
-                    is_table=is_table
+        Returns:
+            List of (chunk_fields, tokens_consumed) in the order of indices; the
+            batch call's tokens are added to the first section's count
+        """
+        batch = [sections[i] for i in indices]
+        batch_tokens = 0
+        if len(batch) > 1:
+            extraction_results, batch_tokens = self._extract_section_batch(document, batch)
+        else:
+            extraction_results = [None]
+
+        section_results = [
+            self._process_section(
+                i, sections[i], document, structure, children_index,
+                extraction_result=extraction_result
+            )
+            for i, extraction_result in zip(indices, extraction_results)
+        ]
+        if batch_tokens:
+            chunk_fields, tokens_consumed = section_results[0]
+            section_results[0] = (chunk_fields, tokens_consumed + batch_tokens)
+        return section_results
+
+    def _process_section(
+        self,
+        i: int,
+        section: SectionV2,
+        document: Document,
+        structure: Structure,
+        children_index: Dict[tuple, List[str]] | None = None,
+        extraction_result: Dict[str, Any] | None = None
+    ) -> tuple[Dict[str, Any], int]:
+        """
+        Extract and prefix a single section.
+
+        Token counting and Chunk construction are deferred to _build_chunks so
+        several sections share one tokenizer call.
+
+        Args:
+            extraction_result: Pre-extracted text from a batch call; extracted
+                with a single-section call when None
+
+        Returns:
+            Tuple of (chunk_fields, tokens_consumed); chunk_fields holds every
+            Chunk field except token_count
+        """
+        try:
+            total_tokens_consumed = 0
+
+            # Derive metadata from Phase 1 (no LLM call!)
+            metadata = derive_metadata_from_structure(structure, section, children_index)
+            self.metadata_validator.validate_metadata(metadata)
+
+            if self.strategy == STRATEGY_MERGED and extraction_result is None:
+                # Single call: extract + prefix together
+                merged_result = self._merged_extract_and_prefix(document, section, metadata)
+                extracted_text = merged_result["extracted_text"]
+                contextual_prefix = merged_result["prefix"]
+                total_tokens_consumed += merged_result.get("tokens_consumed", 0)
+            else:
+                extracted_text, contextual_prefix, tokens_consumed = self._separate_extract_and_prefix(
+                    document, section, metadata, extraction_result
                 )
-                extracted_text = extraction_result["extracted_text"]
-                total_tokens_consumed += extraction_result.get("tokens_consumed", 0)
-
-                # Derive metadata from Phase 1 (no LLM call!)
-                metadata = derive_metadata_from_structure(structure, section)
-                self.metadata_validator.validate_metadata(metadata)
-
-                # Generate contextual prefix
-                prefix_result = self._generate_contextual_prefix(
-                    document.document_id,
-                    metadata.chapter_title,
-                    metadata.section_title,
-                    metadata.subsection_title,
-                    extracted_text,
-                    document.content
+                total_tokens_consumed += tokens_consumed
+
+            # Combine prefix with extracted text (token count + Chunk built in _build_chunks)
+            chunk_fields = {
+                "chunk_id": f"{document.document_id}_chunk_{i+1:03d}",
+                "source_document": document.document_id,
+                "chunk_text": f"{contextual_prefix}\n\n{extracted_text}",
+                "original_text": extracted_text,
+                "contextual_prefix": contextual_prefix,
+                "metadata": metadata,
+                "processing_metadata": ProcessingMetadata.model_construct(
+                    phase_1_model=structure.analysis_model,
+                    phase_2_model=self.model,
+                    cache_hit=structure.metadata.get("cache_hit", False)
                 )
-                contextual_prefix = prefix_result["prefix"]
-                total_tokens_consumed += prefix_result.get("tokens_consumed", 0)
+            }
+
+            return chunk_fields, total_tokens_consumed
+
+        except Exception as e:
+            if isinstance(e, (ChunkExtractionError, ValueError)):
+                raise
+            raise ChunkExtractionError(
+                f"Failed to extract chunk for section '{section.title}': {str(e)}"
+            ) from e
+
+    def _build_chunks(self, chunk_fields_list: List[Dict[str, Any]]) -> List[Chunk]:
+        """
+        Count tokens for several drafted chunks in one batch, then build and validate them.
+
+        Args:
+            chunk_fields_list: Outputs of _process_section (all fields but token_count)
+
+        Returns:
+            Validated chunks, in input order
+        """
+        token_counts = self.token_counter.count_tokens_batch(
+            [fields["chunk_text"] for fields in chunk_fields_list], self.model
+        )
 
-                # Combine prefix with extracted text
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+        chunks = []
+        for fields, token_count in zip(chunk_fields_list, token_counts):
+            section_title = fields["metadata"].section_title
+            try:
+                # Warn if token limit exceeded
+                if token_count > self.max_chunk_tokens * 3:
+                    logger.debug("Chunk %r has %d tokens (>%d)", section_title, token_count, self.max_chunk_tokens * 3)
 
-                # Count tokens
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+                # Fields come from our own pipeline; MetadataValidator runs the
+                # domain checks, so Pydantic's per-field validation is skipped
+                chunk = Chunk.model_construct(**fields, token_count=token_count)
+
+                # Validate chunk
+                self.metadata_validator.validate_chunk(chunk)
+                chunks.append(chunk)
+
+            except Exception as e:
+                if isinstance(e, (ChunkExtractionError, ValueError)):
+                    raise
+                raise ChunkExtractionError(
+                    f"Failed to extract chunk for section '{section_title}': {str(e)}"
+                ) from e
+
+        return chunks
+
+    def _separate_extract_and_prefix(
+        self,
+        document: Document,
+        section: SectionV2,
+        metadata: ChunkMetadata,
+        extraction_result: Dict[str, Any] | None = None
+    ) -> tuple[str, str, int]:
+        """
+        Extract text, then generate its prefix (2 LLM calls, "separate" strategy).
+
+        Returns:
+            Tuple of (extracted_text, contextual_prefix, tokens_consumed)
+        """
+        # Get is_table flag (default to False for backward compatibility)
+        is_table = getattr(section, 'is_table', False)
+
+        # Extract text (unless already extracted by a batch call)
+        if extraction_result is None:
+            extraction_result = self._extract_section_text(
+                document,
+                section.title,
+                section.summary,
+                section.start_words,
+                section.end_words,
+                self.max_chunk_tokens,
+                is_table=is_table
+            )
+        extracted_text = extraction_result["extracted_text"]
+
+        # Generate contextual prefix
+        prefix_result = self._generate_contextual_prefix(
+            document.document_id,
+            metadata.chapter_title,
+            metadata.section_title,
+            metadata.subsection_title,
+            extracted_text,
+            document.content
+        )
+
+        tokens_consumed = (
+            extraction_result.get("tokens_consumed", 0) + prefix_result.get("tokens_consumed", 0)
+        )
+        return extracted_text, prefix_result["prefix"], tokens_consumed
+
+    def _merged_extract_and_prefix(
+        self,
+        document: Document,
+        section: SectionV2,
+        metadata: ChunkMetadata
+    ) -> Dict[str, Any]:
+        """Extract text + generate prefix in a single LLM call ("merged" strategy)."""
+        is_table = getattr(section, 'is_table', False)
+        section_info = section_cache_info(
+            section.title, section.start_words, section.end_words, is_table
+        )
+        cache_key = None
+        if self.cache_store:
+            cache_key = self.generate_llm_response_key(
+                document.content, self.model, CACHE_OP_MERGED_V3A, section_info
+            )
+            cached_response = self.cache_store.get_llm_response(cache_key)
+            if cached_response:
+                extracted_text, prefix = self._parse_merged_response(cached_response)
+                return {
+                    "extracted_text": extracted_text,
+                    "prefix": prefix,
+                    "tokens_consumed": 0,
+                    "llm_response": cached_response,
+                    "llm_response_cached": True,
+                    "cache_discount": 0,
+                    "cache_read_tokens": 0,
+                    "cache_write_tokens": 0,
+                    "cache_status": "local_hit"
+                }
 
-                # Warn if token limit exceeded
-                if token_count > self.max_chunk_tokens * 3:
-                    logger.debug(f"Chunk '{section.title}' has {token_count} tokens (>{self.max_chunk_tokens*3})")
+        # Build instructions
+        instructions = self._render["merged_tail"](
+            document_id=document.document_id,
+            chapter_title=metadata.chapter_title,
+            section_title=section.title,
+            section_summary=section.summary,
+            max_tokens=self.max_chunk_tokens,
+            start_words=section.start_words,
+            end_words=section.end_words,
+            is_table=is_table
+        )
 
-                # Create chunk
-                chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
-                cache_hit = structure.metadata.get("cache_hit", False)
+        # Build cached message (document + static rules cached, section params dynamic)
+        messages = self._build_cached_message(
+            document.content, instructions, MERGED_STATIC_PROLOGUE_V3
+        )
 
-                processing_metadata = ProcessingMetadata(
-                    phase_1_model=structure.analysis_model,
-                    phase_2_model=self.model,
-                    cache_hit=cache_hit
-                )
+        # Make LLM call with cache metrics enabled
+        try:
+            response = self.llm_client.chat_completion(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,
+                extra_body={"usage": {"include": True}}  # Enable cache metrics
+            )
 
-                chunk = Chunk(
-                    chunk_id=chunk_id,
-                    source_document=document.document_id,
-                    chunk_text=chunk_text,
-                    original_text=extracted_text,
-                    contextual_prefix=contextual_prefix,
-                    metadata=metadata,
-                    token_count=token_count,
-                    processing_metadata=processing_metadata
-                )
+            # Extract usage and response
+            tokens_consumed = response.get("usage", {}).get("total_tokens", 0)
+            cache_metrics = self._record_cache_metrics(response)
+            response_text = response["choices"][0]["message"]["content"]
 
-                # Validate chunk
-                self.metadata_validator.validate_chunk(chunk)
-                chunks.append(chunk)
+            # Parse both tags
+            extracted_text, prefix = self._parse_merged_response(response_text)
 
-                # Write chunk to file immediately (progressive output)
-                if self.output_dir:
-                    chunk_file = self.output_dir / f"{document.document_id}_chunk_{i+1:03d}.json"
-                    chunk_file.write_text(json.dumps(chunk.dict(), default=str, indent=2))
+            # Cache response
+            if self.cache_store and cache_key:
+                self.cache_store.set_llm_response(cache_key, response_text)
 
-            except Exception as e:
-                if isinstance(e, (ChunkExtractionError, ValueError)):
-                    raise
-                raise ChunkExtractionError(
-                    f"Failed to extract chunk for section '{section.title}': {str(e)}"
-                ) from e
+            return {
+                "extracted_text": extracted_text,
+                "prefix": prefix,
+                "tokens_consumed": tokens_consumed,
+                **cache_metrics
+            }
 
-        pbar.close()
-        logger.info(f"V3A: {len(chunks)} chunks, {total_tokens_consumed:,} tokens")
+        except Exception as e:
+            raise ChunkExtractionError(
+                f"Failed to extract and generate prefix for section '{section.title}': {str(e)}"
+            ) from e
 
-        return {
-            "chunks": chunks,
-            "tokens_consumed": total_tokens_consumed
-        }
+    def _parse_merged_response(self, response_text: str) -> tuple[str, str]:
+        """Parse [CHUNK_TEXT] and [CONTEXTUAL_PREFIX] tags from a merged response."""
+        parsed = parse_merged_tags(response_text)
+        if parsed is None:
+            raise ChunkExtractionError(
+                f"Failed to parse merged tags\n"
+                f"Response: {response_text[:200]}..."
+            )
+        return parsed
 
     def _extract_section_text(
         self,
@@ -438,11 +1198,11 @@ class ChunkExtractorV3A:
         is_table: bool = False
     ) -> Dict[str, Any]:
         """Extract text for section using LLM (plain text output)."""
-        section_info = f"{section_title}_{section_summary}_{start_words}_{end_words}_{is_table}"
+        section_info = section_cache_info(section_title, start_words, end_words, is_table)
         cache_key = None
         if self.cache_store:
             cache_key = self.generate_llm_response_key(
-                document.content, self.model, "extract_text_v3a", section_info
+                document.content, self.model, CACHE_OP_EXTRACT_V3A, section_info
             )
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -458,7 +1218,7 @@ class ChunkExtractorV3A:
                 }
 
         # Build instructions with dynamic params
-        instructions = EXTRACTION_INSTRUCTIONS_V3.format(
+        instructions = self._render["extraction_tail"](
             section_title=section_title,
             section_summary=section_summary,
             max_tokens=max_tokens,
@@ -467,8 +1227,10 @@ class ChunkExtractorV3A:
             is_table=is_table
         )
 
-        # Build cached message (document + instructions)
-        messages = self._build_cached_message(document.content, instructions)
+        # Build cached message (document + static rules cached, section params dynamic)
+        messages = self._build_cached_message(
+            document.content, instructions, EXTRACTION_STATIC_PROLOGUE_V3
+        )
 
         # Make LLM call with cache metrics enabled
         try:
@@ -481,6 +1243,7 @@ class ChunkExtractorV3A:
 
             # Extract usage and response
             tokens_consumed = response.get("usage", {}).get("total_tokens", 0)
+            cache_metrics = self._record_cache_metrics(response)
             extracted_text = response["choices"][0]["message"]["content"].strip()
 
             # Cache response
@@ -489,7 +1252,8 @@ class ChunkExtractorV3A:
 
             return {
                 "extracted_text": extracted_text,
-                "tokens_consumed": tokens_consumed
+                "tokens_consumed": tokens_consumed,
+                **cache_metrics
             }
 
         except Exception as e:
@@ -497,6 +1261,114 @@ class ChunkExtractorV3A:
                 f"Failed to extract text for section '{section_title}': {str(e)}"
             ) from e
 
+    def _extract_section_batch(
+        self,
+        document: Document,
+        sections: List[SectionV2]
+    ) -> tuple[List[Dict[str, Any] | None], int]:
+        """
+        Extract text for several sections with a single LLM call (tagged output).
+
+        Sections already in the response cache are served from it; only misses
+        are sent. Each parsed text is cached under the same key single-section
+        extraction uses, so both paths share cache entries.
+
+        Returns:
+            Tuple of (results, tokens_consumed): an extraction result per
+            section (same shape as _extract_section_text), or None for sections
+            the batch response did not yield, which callers extract with
+            single-section calls; and the batch call's tokens, counted even
+            when no section parsed
+        """
+        results: List[Dict[str, Any] | None] = [None] * len(sections)
+        cache_keys: List[str | None] = [None] * len(sections)
+
+        # Serve cached sections first
+        for j, section in enumerate(sections):
+            if not self.cache_store:
+                break
+            is_table = getattr(section, 'is_table', False)
+            section_info = section_cache_info(
+                section.title, section.start_words, section.end_words, is_table
+            )
+            cache_keys[j] = self.generate_llm_response_key(
+                document.content, self.model, CACHE_OP_EXTRACT_V3A, section_info
+            )
+            cached_response = self.cache_store.get_llm_response(cache_keys[j])
+            if cached_response:
+                results[j] = {
+                    "extracted_text": cached_response.strip(),
+                    "tokens_consumed": 0,
+                    "llm_response": cached_response,
+                    "llm_response_cached": True,
+                    "cache_status": "local_hit"
+                }
+
+        pending = [j for j in range(len(sections)) if results[j] is None]
+        if len(pending) <= 1:
+            # Nothing worth batching; remaining section goes through the single path
+            return results, 0
+
+        section_list = "\n\n".join(
+            self._render["batch_section_entry"](
+                number=f"{n:03d}",
+                section_title=sections[j].title,
+                section_summary=sections[j].summary,
+                is_table=getattr(sections[j], 'is_table', False),
+                max_tokens=self.max_chunk_tokens,
+                start_words=sections[j].start_words,
+                end_words=sections[j].end_words
+            )
+            for n, j in enumerate(pending, 1)
+        )
+        instructions = self._render["batch_extraction"](
+            section_list=section_list,
+            section_count=len(pending)
+        )
+        messages = self._build_cached_message(document.content, instructions)
+
+        tokens_consumed = 0
+        try:
+            response = self.llm_client.chat_completion(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,
+                extra_body={"usage": {"include": True}}  # Enable cache metrics
+            )
+            tokens_consumed = response.get("usage", {}).get("total_tokens", 0)
+            cache_metrics = self._record_cache_metrics(response)
+            response_text = response["choices"][0]["message"]["content"]
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, falling back to single calls: {e}")
+            return results, tokens_consumed
+
+        extracted = {
+            int(number): text.strip()
+            for number, text in _BATCH_CHUNK_RE.findall(response_text)
+        }
+
+        for n, j in enumerate(pending, 1):
+            extracted_text = extracted.get(n)
+            if not extracted_text:
+                continue
+
+            if self.cache_store and cache_keys[j]:
+                self.cache_store.set_llm_response(cache_keys[j], extracted_text)
+
+            results[j] = {
+                "extracted_text": extracted_text,
+                "tokens_consumed": 0,  # Counted once per batch by the caller
+            }
+
+        missing = sum(1 for j in pending if results[j] is None)
+        if missing:
+            logger.warning(
+                f"Batch extraction returned {len(pending) - missing}/{len(pending)} sections, "
+                f"falling back to single calls for the rest"
+            )
+
+        return results, tokens_consumed
+
     def _generate_contextual_prefix(
         self,
         document_id: str,
@@ -509,8 +1381,10 @@ class ChunkExtractorV3A:
         """Generate contextual prefix (plain text output)."""
         cache_key = None
         if self.cache_store:
+            # Document hash is memoized per run; the chunk contributes only a bounded slice
             cache_key = self.generate_llm_response_key(
-                chunk_text, self.model, "generate_prefix_v3a"
+                document_text, self.model, CACHE_OP_PREFIX_V3A,
+                chunk_cache_info(document_id, section_title, chunk_text)
             )
             cached_response = self.cache_store.get_llm_response(cache_key)
             if cached_response:
@@ -533,7 +1407,7 @@ class ChunkExtractorV3A:
             subsection_display = "no subsections"
 
         # Build instructions
-        instructions = PREFIX_INSTRUCTIONS_V3.format(
+        instructions = self._render["prefix"](
             document_id=document_id,
             chapter_title=chapter_title,
             section_title=section_title,
@@ -541,8 +1415,9 @@ class ChunkExtractorV3A:
             chunk_text=chunk_text
         )
 
-        # Build cached message
-        messages = self._build_cached_message(document_text, instructions)
+        # Prefix only needs metadata + chunk text (both in instructions), so the
+        # document is not re-sent; document_text is used for the cache key only
+        messages = [{"role": "user", "content": instructions}]
 
         # Make LLM call with cache metrics enabled
         try:
@@ -555,6 +1430,7 @@ class ChunkExtractorV3A:
 
             # Extract usage and response
             tokens_consumed = response.get("usage", {}).get("total_tokens", 0)
+            cache_metrics = self._record_cache_metrics(response)
             response_text = response["choices"][0]["message"]["content"]
 
             # Parse prefix
@@ -566,7 +1442,8 @@ class ChunkExtractorV3A:
 
             return {
                 "prefix": prefix,
-                "tokens_consumed": tokens_consumed
+                "tokens_consumed": tokens_consumed,
+                **cache_metrics
             }
 
         except Exception as e:
@@ -576,7 +1453,9 @@ class ChunkExtractorV3A:
 
     def _parse_contextual_prefix(self, response_text: str) -> str:
         """Parse contextual prefix from plain text response (no validation)."""
-        prefix = response_text.strip()
+        # Tolerate a tagged reply; otherwise the whole response is the prefix
+        match = _PREFIX_RE.search(response_text)
+        prefix = match.group(1) if match else response_text.strip()
         # No length or format validation - store as-is for analysis
         return prefix
 
@@ -598,7 +1477,7 @@ class ChunkExtractorV3B:
     Cache Efficiency: ~80-90% (first section misses, all subsequent sections hit)
 
     Pros:
-        ✅ 50% fewer LLM calls than V3A (2 → 1) = fastest + cheapest
+        ✅ 50% fewer LLM calls than separate-call V3A (2 → 1) = fastest + cheapest
         ✅ All extraction context in one place = most coherent output
         ✅ Maximum cache hit potential for subsequent sections
         ✅ Tagged format handles dirty text robustly
@@ -609,6 +1488,8 @@ class ChunkExtractorV3B:
         ⚠️ If one part fails, entire call fails
     """
 
+    version = "V3B"
+
     def __init__(
         self,
         llm_client: LLMProvider,
@@ -617,9 +1498,20 @@ class ChunkExtractorV3B:
         model: str = "google/gemini-2.5-flash",
         max_chunk_tokens: int = 1000,
         cache_store=None,
-        output_dir=None
+        output_dir=None,
+        show_progress: bool = True,
+        output_mode: str = OUTPUT_MODE_JSONL,
+        max_concurrency: int = 8
     ):
-        """Initialize V3B chunk extractor."""
+        """
+        Initialize V3B chunk extractor (tqdm is only imported when show_progress is set).
+
+        max_concurrency bounds how many sections are in flight against the LLM
+        endpoint at once.
+
+        output_mode selects progressive output under output_dir: "jsonl" (one
+        file per document) or "per_chunk" (one JSON file per chunk).
+        """
         self.llm_client = llm_client
         self.token_counter = token_counter
         self.metadata_validator = metadata_validator
@@ -627,23 +1519,135 @@ class ChunkExtractorV3B:
         self.max_chunk_tokens = max_chunk_tokens
         self.cache_store = cache_store
         self.output_dir = output_dir
+        self.show_progress = show_progress
+        self.output_mode = output_mode
+        self.max_concurrency = max_concurrency
+
+        # Hash memo: the same document text is hashed once, not once per section.
+        # Keyed by id() and holding the string itself so a reused id cannot alias.
+        self._content_hash_cache: dict[int, tuple[str, str]] = {}
+        self._model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
+
+        # Message parts with cache_control, shared by every section's message:
+        # the document part and one system message per static preamble
+        self._document_part: tuple[str, dict[str, Any]] | None = None
+        self._system_messages: Dict[str, dict[str, Any]] = {}
+
+        # Per-run dedup table: identical sections share one merged call
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # LRU of parsed responses: key -> (response_text, extracted_text, prefix).
+        # Kept across runs so retries and re-processing skip the store read and
+        # re-parse; the raw text is kept so memo hits return the same dict.
+        self._response_memcache: "OrderedDict[str, tuple[str, str, str]]" = OrderedDict()
+        self._response_memcache_lock = threading.Lock()
+
+    def _dedup_call(self, key: tuple, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run call once per key within a run; duplicates wait for and reuse its result.
+
+        Reused results report 0 tokens_consumed so usage is counted once.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return {**future.result(), "tokens_consumed": 0}
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+    def _memcache_get(self, key: str) -> tuple[str, str, str] | None:
+        """Return a memoized (response_text, extracted_text, prefix), or None."""
+        with self._response_memcache_lock:
+            parsed = self._response_memcache.get(key)
+            if parsed is not None:
+                self._response_memcache.move_to_end(key)
+            return parsed
+
+    def _memcache_set(self, key: str, parsed: tuple[str, str, str]) -> None:
+        """Memoize a parsed response, evicting the oldest entry if full."""
+        with self._response_memcache_lock:
+            self._response_memcache[key] = parsed
+            self._response_memcache.move_to_end(key)
+            if len(self._response_memcache) > PARSED_MEMO_SIZE:
+                self._response_memcache.popitem(last=False)
+
+    def _content_hash(self, content: str) -> str:
+        """Return SHA-256 of content, memoized per content object."""
+        cached = self._content_hash_cache.get(id(content))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        self._content_hash_cache[id(content)] = (content, content_hash)
+        return content_hash
 
     def generate_llm_response_key(
         self, content: str, model: str, operation: str, section_info: str = ""
     ) -> str:
         """Generate cache key for raw LLM response."""
-        import hashlib
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
+        content_hash = self._content_hash(content)
+        if model == self.model:
+            model_hash = self._model_hash
+        else:
+            model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
         section_hash = hashlib.sha256(section_info.encode()).hexdigest()[:8] if section_info else ""
         if section_hash:
             return f"llm_{operation}_{content_hash}_{section_hash}_{model_hash}"
         return f"llm_{operation}_{content_hash}_{model_hash}"
 
+    def _document_part_for(self, document_text: str) -> dict[str, Any]:
+        """
+        Return the cached document message part, built once per document.
+
+        The part is shared by reference across every section's message, so the
+        "DOCUMENT TEXT" copy of the document is made once rather than per call.
+        """
+        cached = self._document_part
+        if cached is not None and cached[0] is document_text:
+            return cached[1]
+        part = {
+            "type": "text",
+            "text": f"DOCUMENT TEXT:\n{document_text}",
+            "cache_control": {"type": "ephemeral"}
+        }
+        self._document_part = (document_text, part)
+        return part
+
+    def _system_message_for(self, static_instructions: str) -> dict[str, Any]:
+        """
+        Return the cached system message for a static preamble (built once).
+
+        The preamble does not depend on the document, so its breakpoint is
+        also hit across documents, not just across sections of one document.
+        """
+        message = self._system_messages.get(static_instructions)
+        if message is None:
+            message = {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": static_instructions,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+            self._system_messages[static_instructions] = message
+        return message
+
     def _build_cached_message(
         self,
         document_text: str,
-        instructions: str
+        instructions: str,
+        static_instructions: str | None = None
     ) -> list[dict[str, Any]]:
         """
         Build multipart message with cache_control for OpenRouter.
@@ -651,28 +1655,31 @@ class ChunkExtractorV3B:
         Args:
             document_text: Full document content (STATIC - will be cached)
             instructions: Operation instructions with params (DYNAMIC - not cached)
+            static_instructions: Instruction boilerplate shared by every section
+                (STATIC - sent as a cached system message)
 
         Returns:
-            Message list with cache_control breakpoint
+            Message list with cache_control breakpoints
 
         Structure:
-            Part 1: Document text with cache_control (CACHED after first call)
-            Part 2: Instructions (NOT CACHED, changes per section)
+            System: Static instructions with cache_control (CACHED, optional)
+            User part 1: Document text with cache_control (CACHED after first call)
+            User part 2: Dynamic instructions (NOT CACHED, changes per section)
+
+        Static content strictly precedes the document, which precedes the
+        per-section parameters, so every call shares the longest possible prefix.
         """
-        return [{
-            "role": "user",
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"DOCUMENT TEXT:\n{document_text}",
-                    "cache_control": {"type": "ephemeral"}
-                },
-                {
-                    "type": "text",
-                    "text": f"\n---\n\n{instructions}"
-                }
-            ]
-        }]
+        content = [
+            self._document_part_for(document_text),
+            {
+                "type": "text",
+                "text": f"\n---\n\n{instructions}"
+            }
+        ]
+        user_message = {"role": "user", "content": content}
+        if static_instructions:
+            return [self._system_message_for(static_instructions), user_message]
+        return [user_message]
 
     def extract_chunks(
         self,
@@ -682,6 +1689,10 @@ class ChunkExtractorV3B:
         """
         Extract chunks from document using V3B strategy (1 call + derived metadata).
 
+        The first section runs alone to warm the provider's prompt cache, then
+        the rest are processed concurrently (up to max_concurrency in flight);
+        output order matches section order.
+
         Returns dict with chunks, tokens_consumed, and llm_responses.
         """
         # Validate inputs
@@ -690,102 +1701,194 @@ class ChunkExtractorV3B:
 
         # Check for V2 format
         first_section = structure.sections[0]
-        if not hasattr(first_section, 'start_words') or not hasattr(first_section, 'end_words'):
+        if not isinstance(first_section, SectionV2):
             raise ChunkExtractionError(
                 "Structure does not contain word boundaries (start_words/end_words). "
                 "Use StructureAnalyzerV2 to generate V2-compatible structures."
             )
 
-        chunks = []
-        total_tokens_consumed = 0
+        # Count total sections to process (skip title-only)
+        sections_to_process = tuple(s for s in structure.sections if s.start_words or s.end_words)
 
-        import logging
-        logger = logging.getLogger(__name__)
+        # Parent -> children lookup built once for metadata derivation
+        children_index = build_children_index(structure)
 
-        # Count total sections to process (skip title-only)
-        sections_to_process = [s for s in structure.sections if s.start_words or s.end_words]
+        # Hash the document once up front; every section's cache key reuses it.
+        # Memo is scoped to one run so it does not pin old documents.
+        self._content_hash_cache.clear()
+        self._content_hash(document.content)
 
-        # Progress bar
-        pbar = tqdm(sections_to_process, desc="Extracting chunks (V3B)", unit="section")
+        # Build the document message part once; every section's message shares it
+        self._document_part = None
+        self._document_part_for(document.content)
 
-        for i, section in enumerate(pbar):
-            try:
-                # Update progress bar description
-                pbar.set_postfix_str(f"{section.title[:40]}...")
+        # Dedup table is scoped to one document
+        self._inflight = {}
 
-                # Get is_table flag (default to False for backward compatibility)
-                is_table = getattr(section, 'is_table', False)
+        # Merged results obtained ahead of the per-section calls (none for V3B)
+        prefetched, prefetch_tokens = self._prefetch_sections(document, structure, sections_to_process)
 
-                # Single call: extract + prefix together
-                merged_result = self._extract_and_generate_prefix(
-                    document,
-                    structure.chapter_title,
-                    section.title,
-                    section.summary,
-                    section.start_words,
-                    section.end_words,
-                    self.max_chunk_tokens,
-                    is_table=is_table
-                )
+        # Progress bar (optional, tqdm imported lazily)
+        pbar = None
+        if self.show_progress:
+            from tqdm import tqdm
+            pbar = tqdm(
+                total=len(sections_to_process), desc=f"Extracting chunks ({self.version})", unit="section",
+                mininterval=PROGRESS_MIN_INTERVAL
+            )
+        # Section-title postfix only on a terminal (no use in logs/pipes)
+        show_postfix = pbar is not None and sys.stderr.isatty()
+
+        # Pre-sized result slots preserve section order regardless of completion order
+        results: List[Any] = [None] * len(sections_to_process)
+
+        # Background writer so result collection does not block on disk I/O
+        writer = None
+        if self.output_dir:
+            writer = ChunkOutputWriter(self.output_dir, document.document_id, self.output_mode)
+
+        # Sections run concurrently after the first (see map_in_order), in section order
+        section_results = map_in_order(
+            lambda i: self._process_section(
+                i, sections_to_process[i], document, structure, children_index, prefetched[i]
+            ),
+            range(len(sections_to_process)),
+            self.max_concurrency
+        )
+        try:
+            for i, result in enumerate(section_results):
+                results[i] = result
+
+                # Queue chunk write (progressive output)
+                if writer is not None:
+                    writer.submit(results[i][0])
+
+                if pbar is not None:
+                    if show_postfix:
+                        # No forced redraw; shown on tqdm's next throttled refresh
+                        pbar.set_postfix_str(f"{sections_to_process[i].title[:40]}...", refresh=False)
+                    pbar.update(1)
+        finally:
+            # Fail fast: drop sections that have not started yet
+            section_results.close()
+            if pbar is not None:
+                pbar.close()
+            if writer is not None:
+                writer.close()
+
+        if writer is not None:
+            writer.raise_for_errors()
+
+        chunks = [chunk for chunk, _ in results]
+        total_tokens_consumed = prefetch_tokens + sum(tokens for _, tokens in results)
+
+        logger.info(f"{self.version}: {len(chunks)} chunks, {total_tokens_consumed:,} tokens")
 
-                extracted_text = merged_result["extracted_text"]
-                contextual_prefix = merged_result["prefix"]
-                total_tokens_consumed += merged_result.get("tokens_consumed", 0)
+        return {
+            "chunks": chunks,
+            "tokens_consumed": total_tokens_consumed
+        }
+
+    def _prefetch_sections(
+        self,
+        document: Document,
+        structure: Structure,
+        sections: Sequence[SectionV2]
+    ) -> tuple[List[Dict[str, Any] | None], int]:
+        """
+        Hook for obtaining merged results before the per-section calls.
 
-                # Derive metadata from Phase 1 (no LLM call!)
-                metadata = derive_metadata_from_structure(structure, section)
-                self.metadata_validator.validate_metadata(metadata)
+        V3B makes every call per section, so nothing is prefetched.
 
-                # Combine and create chunk
-                chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
-                token_count = self.token_counter.count_tokens(chunk_text, self.model)
+        Returns:
+            Tuple of (merged result or None per section, tokens_consumed)
+        """
+        return [None] * len(sections), 0
 
-                # Warn if token limit exceeded
-                if token_count > self.max_chunk_tokens * 3:
-                    logger.debug(f"Chunk '{section.title}' has {token_count} tokens (>{self.max_chunk_tokens*3})")
+    def _process_section(
+        self,
+        i: int,
+        section: SectionV2,
+        document: Document,
+        structure: Structure,
+        children_index: Dict[tuple, List[str]] | None = None,
+        merged_result: Dict[str, Any] | None = None
+    ) -> tuple[Chunk, int]:
+        """
+        Extract text + prefix with one LLM call and build the chunk for a single section.
 
-                chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
-                cache_hit = structure.metadata.get("cache_hit", False)
+        A prefetched merged_result skips the LLM call.
 
-                processing_metadata = ProcessingMetadata(
-                    phase_1_model=structure.analysis_model,
-                    phase_2_model=self.model,
-                    cache_hit=cache_hit
-                )
+        Returns:
+            Tuple of (chunk, tokens_consumed)
+        """
+        try:
+            if merged_result is None:
+                # Get is_table flag (default to False for backward compatibility)
+                is_table = getattr(section, 'is_table', False)
 
-                chunk = Chunk(
-                    chunk_id=chunk_id,
-                    source_document=document.document_id,
-                    chunk_text=chunk_text,
-                    original_text=extracted_text,
-                    contextual_prefix=contextual_prefix,
-                    metadata=metadata,
-                    token_count=token_count,
-                    processing_metadata=processing_metadata
+                # Single call: extract + prefix together (shared by identical sections)
+                merged_result = self._dedup_call(
+                    (section.title, section.summary, section.start_words, section.end_words, is_table),
+                    lambda: self._extract_and_generate_prefix(
+                        document,
+                        structure.chapter_title,
+                        section.title,
+                        section.summary,
+                        section.start_words,
+                        section.end_words,
+                        self.max_chunk_tokens,
+                        is_table=is_table
+                    )
                 )
 
-                self.metadata_validator.validate_chunk(chunk)
-                chunks.append(chunk)
+            extracted_text = merged_result["extracted_text"]
+            contextual_prefix = merged_result["prefix"]
+            tokens_consumed = merged_result.get("tokens_consumed", 0)
 
-                # Write chunk to file immediately (progressive output)
-                if self.output_dir:
-                    chunk_file = self.output_dir / f"{document.document_id}_chunk_{i+1:03d}.json"
-                    chunk_file.write_text(json.dumps(chunk.dict(), default=str, indent=2))
+            # Derive metadata from Phase 1 (no LLM call!)
+            metadata = derive_metadata_from_structure(structure, section, children_index)
+            self.metadata_validator.validate_metadata(metadata)
 
-            except Exception as e:
-                if isinstance(e, (ChunkExtractionError, ValueError)):
-                    raise
-                raise ChunkExtractionError(
-                    f"Failed to extract chunk for section '{section.title}': {str(e)}"
-                ) from e
+            # Combine and create chunk
+            chunk_text = f"{contextual_prefix}\n\n{extracted_text}"
+            token_count = self.token_counter.count_tokens(chunk_text, self.model)
 
-        pbar.close()
-        logger.info(f"V3B: {len(chunks)} chunks, {total_tokens_consumed:,} tokens")
+            # Warn if token limit exceeded
+            if token_count > self.max_chunk_tokens * 3:
+                logger.debug("Chunk %r has %d tokens (>%d)", section.title, token_count, self.max_chunk_tokens * 3)
 
-        return {
-            "chunks": chunks,
-            "tokens_consumed": total_tokens_consumed
-        }
+            chunk_id = f"{document.document_id}_chunk_{i+1:03d}"
+            cache_hit = structure.metadata.get("cache_hit", False)
+
+            processing_metadata = ProcessingMetadata.model_construct(
+                phase_1_model=structure.analysis_model,
+                phase_2_model=self.model,
+                cache_hit=cache_hit
+            )
+
+            # Validated by MetadataValidator below, not by Pydantic
+            chunk = Chunk.model_construct(
+                chunk_id=chunk_id,
+                source_document=document.document_id,
+                chunk_text=chunk_text,
+                original_text=extracted_text,
+                contextual_prefix=contextual_prefix,
+                metadata=metadata,
+                token_count=token_count,
+                processing_metadata=processing_metadata
+            )
+
+            self.metadata_validator.validate_chunk(chunk)
+
+            return chunk, tokens_consumed
+
+        except Exception as e:
+            if isinstance(e, (ChunkExtractionError, ValueError)):
+                raise
+            raise ChunkExtractionError(
+                f"Failed to extract chunk for section '{section.title}': {str(e)}"
+            ) from e
 
     def _extract_and_generate_prefix(
         self,
@@ -803,11 +1906,16 @@ class ChunkExtractorV3B:
         cache_key = None
         if self.cache_store:
             cache_key = self.generate_llm_response_key(
-                document.content, self.model, "extract_prefix_v3b", section_info
+                document.content, self.model, CACHE_OP_MERGED_V3B, section_info
             )
-            cached_response = self.cache_store.get_llm_response(cache_key)
-            if cached_response:
-                extracted_text, prefix = self._parse_merged_tags(cached_response)
+            parsed = self._memcache_get(cache_key)
+            if parsed is None:
+                cached_response = self.cache_store.get_llm_response(cache_key)
+                if cached_response:
+                    parsed = (cached_response, *self._parse_merged_tags(cached_response))
+                    self._memcache_set(cache_key, parsed)
+            if parsed is not None:
+                cached_response, extracted_text, prefix = parsed
                 return {
                     "extracted_text": extracted_text,
                     "prefix": prefix,
@@ -820,8 +1928,8 @@ class ChunkExtractorV3B:
                     "cache_status": "local_hit"
                 }
 
-        # Build instructions
-        instructions = MERGED_INSTRUCTIONS_V3.format(
+        # Build per-section instructions (static prologue is a separate cached part)
+        instructions = _RENDERERS["merged_tail"](
             document_id=document.document_id,
             chapter_title=chapter_title,
             section_title=section_title,
@@ -833,7 +1941,9 @@ class ChunkExtractorV3B:
         )
 
         # Build cached message
-        messages = self._build_cached_message(document.content, instructions)
+        messages = self._build_cached_message(
+            document.content, instructions, static_instructions=MERGED_STATIC_PROLOGUE_V3
+        )
 
         # Make LLM call with cache metrics enabled
         try:
@@ -860,6 +1970,7 @@ class ChunkExtractorV3B:
             # Cache response
             if self.cache_store and cache_key:
                 self.cache_store.set_llm_response(cache_key, response_text)
+                self._memcache_set(cache_key, (response_text, extracted_text, prefix))
 
             return {
                 "extracted_text": extracted_text,
@@ -874,24 +1985,174 @@ class ChunkExtractorV3B:
 
     def _parse_merged_tags(self, response_text: str) -> tuple[str, str]:
         """Parse merged output (2 tags) into extracted_text and prefix (no validation)."""
-        try:
-            expected_tags = ["CHUNK_TEXT", "CONTEXTUAL_PREFIX"]
-            validate_tagged_format(response_text, expected_tags)
+        parsed = parse_merged_tags(response_text)
+        if parsed is None:
+            raise ChunkExtractionError(
+                f"Failed to parse merged tags: missing [CHUNK_TEXT] or [CONTEXTUAL_PREFIX]\n"
+                f"Response: {response_text[:200]}..."
+            )
+        # No validation - store as-is for analysis
+        return parsed
+
+
+# ============================================================================
+# Version V3C: Mega-Batch (Experimental)
+# ============================================================================
 
-            parsed = parse_tagged_output(response_text, expected_tags)
+class ChunkExtractorV3C(ChunkExtractorV3B):
+    """
+    Version V3C: V3B with many sections per LLM call (Experimental).
 
-            # Extract text and prefix
-            extracted_text = parsed["CHUNK_TEXT"]
-            prefix = parsed["CONTEXTUAL_PREFIX"]
+    Architecture:
+        - 1 LLM call per batch of sections: extract + prefix for all of them
+        - Numbered tags (CHUNK_TEXT_n / CONTEXTUAL_PREFIX_n) in one response
+        - Batches sized so the expected output fits max_output_tokens
+        - Sections missing from the response, or every section of a failed
+          batch call, fall back to the V3B per-section call
 
-            # No validation - store as-is for analysis
-            return extracted_text, prefix
+    Pros:
+        ✅ Document input sent once per batch instead of once per section
+        ✅ Far fewer requests against the endpoint (usually one per document)
 
-        except TagParsingError as e:
-            raise ChunkExtractionError(
-                f"Failed to parse merged tags: {str(e)}\n"
-                f"Response: {response_text[:200]}..."
-            ) from e
+    Cons:
+        ⚠️ Long outputs are more prone to truncation (covered by the fallback)
+        ⚠️ A failed batch call costs its latency before the per-section retries
+        ⚠️ One slow call gates every section in the batch
+    """
+
+    version = "V3C"
+
+    def __init__(self, *args, max_output_tokens: int = 65536, **kwargs):
+        """
+        Initialize V3C chunk extractor (same arguments as V3B).
+
+        max_output_tokens is the model's output limit; it bounds how many
+        sections share one call.
+        """
+        super().__init__(*args, **kwargs)
+        self.max_output_tokens = max_output_tokens
+
+    def _prefetch_sections(
+        self,
+        document: Document,
+        structure: Structure,
+        sections: Sequence[SectionV2]
+    ) -> tuple[List[Dict[str, Any] | None], int]:
+        """Extract all sections with batched calls; sections left as None use the V3B path."""
+        per_section_tokens = self.max_chunk_tokens + BATCH_PREFIX_TOKENS
+        batch_size = max(1, (self.max_output_tokens - BATCH_OUTPUT_SAFETY_TOKENS) // per_section_tokens)
+        batches = [sections[i:i + batch_size] for i in range(0, len(sections), batch_size)]
+
+        batch_results = list(map_in_order(
+            lambda batch: self._extract_all_sections_batched(document, batch, structure.chapter_title),
+            batches,
+            min(self.max_concurrency, len(batches))
+        ))
+
+        results: List[Dict[str, Any] | None] = []
+        total_tokens = 0
+        for merged_results, tokens in batch_results:
+            results.extend(merged_results)
+            total_tokens += tokens
+
+        missing = results.count(None)
+        if missing:
+            logger.warning(f"V3C: {missing}/{len(sections)} sections missing from batch output, retrying per section")
+
+        return results, total_tokens
+
+    def _extract_all_sections_batched(
+        self,
+        document: Document,
+        sections: Sequence[SectionV2],
+        chapter_title: str
+    ) -> tuple[List[Dict[str, Any] | None], int]:
+        """
+        Extract text + prefix for several sections in a single LLM call.
+
+        Returns:
+            Tuple of (merged result or None per section, tokens_consumed).
+            None marks a section that was missing or too short in the response;
+            a failed call returns None for every section.
+        """
+        entries = []
+        section_infos = []
+        for number, section in enumerate(sections, start=1):
+            is_table = getattr(section, 'is_table', False)
+            entries.append(fast_format(
+                _BATCH_SECTION_ENTRY_COMPILED,
+                number=number,
+                section_title=section.title,
+                section_summary=section.summary,
+                is_table=is_table,
+                max_tokens=self.max_chunk_tokens,
+                start_words=section.start_words,
+                end_words=section.end_words
+            ))
+            section_infos.append(
+                f"{section.title}_{section.summary}_{section.start_words}_{section.end_words}_{is_table}"
+            )
+
+        cache_key = None
+        response_text = None
+        tokens_consumed = 0
+        if self.cache_store:
+            cache_key = self.generate_llm_response_key(
+                document.content, self.model, CACHE_OP_BATCH_V3C, "\n".join(section_infos)
+            )
+            response_text = self.cache_store.get_llm_response(cache_key)
+
+        cached = response_text is not None
+        if not cached:
+            instructions = fast_format(
+                _BATCH_MERGED_COMPILED,
+                document_id=document.document_id,
+                chapter_title=chapter_title,
+                section_list="\n\n".join(entries),
+                section_count=len(sections)
+            )
+            messages = self._build_cached_message(document.content, instructions)
+
+            try:
+                response = self.llm_client.chat_completion(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.3,
+                    extra_body={"usage": {"include": True}}  # Enable cache metrics
+                )
+                tokens_consumed = response.get("usage", {}).get("total_tokens", 0)
+                response_text = response["choices"][0]["message"]["content"]
+            except Exception as e:
+                # Same as a response missing every section: the V3B path retries each one
+                logger.warning(
+                    "V3C: batched extraction of %d sections failed, falling back to per-section calls: %s",
+                    len(sections), e
+                )
+                return [None] * len(sections), tokens_consumed
+
+        parsed = parse_tag_families(response_text, ["CHUNK_TEXT", "CONTEXTUAL_PREFIX"])
+
+        results: List[Dict[str, Any] | None] = []
+        for number in range(1, len(sections) + 1):
+            fields = parsed.get(number, {})
+            extracted_text = fields.get("CHUNK_TEXT", "")
+            prefix = fields.get("CONTEXTUAL_PREFIX")
+            if prefix is None or len(extracted_text) < 10:
+                results.append(None)
+                continue
+            results.append({
+                "extracted_text": extracted_text,
+                "prefix": prefix,
+                "tokens_consumed": 0,  # Counted once per batch by the caller
+                "llm_response_cached": cached,
+                "cache_status": "local_hit" if cached else "miss"
+            })
+
+        # Only cache responses that produced something usable
+        if self.cache_store and cache_key and not cached and any(results):
+            self.cache_store.set_llm_response(cache_key, response_text)
+
+        return results, tokens_consumed
 
 
 # ============================================================================
@@ -908,7 +2169,13 @@ def _create_cli():
     from dotenv import load_dotenv
     from rich.console import Console
 
+    from .cache_store import CACHE_BACKEND_HELP
+
     console = Console()
+    CacheBackendOption = Annotated[
+        str,
+        typer.Option("--cache-backend", help=CACHE_BACKEND_HELP, envvar="CHUNKING_CACHE_BACKEND")
+    ]
     app = typer.Typer(
         name="v3-experimental",
         help="V3 Experimental chunk extractors with prompt caching (80-90% cost savings)",
@@ -924,14 +2191,21 @@ def _create_cli():
             raise typer.Exit(2)
         return api_key
 
-    def _setup_components(api_key: str, log_level: str):
+    def _setup_components(api_key: str, log_level: str, cache_backend: str = "disk"):
         """Initialize logger, cache store, and LLM provider."""
         from .logger import setup_logging
         from .llm_provider import OpenRouterProvider
-        from .cache_store import FileCacheStore
+        from .cache_store import create_cache_store
 
         logger = setup_logging(log_level, use_context=False)
-        cache_store = FileCacheStore()
+        try:
+            cache_store = create_cache_store(cache_backend)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(2)
+        except ImportError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
         llm_provider = OpenRouterProvider(api_key=api_key)
         return logger, cache_store, llm_provider
 
@@ -965,17 +2239,26 @@ def _create_cli():
         log_level: Annotated[
             str,
             typer.Option("--log-level", help="Logging level")
-        ] = "INFO"
+        ] = "INFO",
+        cache_backend: CacheBackendOption = "disk",
+        output_mode: Annotated[
+            str,
+            typer.Option("--output-mode", help="'jsonl' (one file per document) or 'per_chunk' (one JSON per chunk)")
+        ] = OUTPUT_MODE_JSONL,
+        strategy: Annotated[
+            str,
+            typer.Option("--strategy", help="'merged' (1 call per section) or 'separate' (2 calls)")
+        ] = STRATEGY_MERGED
     ):
         """
-        Extract chunks using V3A (Conservative: 2 calls per section).
+        Extract chunks using V3A.
 
-        V3A makes 2 LLM calls per section (extract + prefix) with document caching.
-        Expected cache efficiency: ~50-60% for multi-section documents.
+        Default "merged" strategy makes 1 LLM call per section (extract + prefix);
+        "separate" makes 2 calls (extract, then prefix). Both use document caching.
         """
         # Setup
         api_key = _setup_environment()
-        logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+        logger, cache_store, llm_provider = _setup_components(api_key, log_level, cache_backend)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Clear local cache if redo flag is set
@@ -1009,12 +2292,14 @@ def _create_cli():
             model=model,
             max_chunk_tokens=max_tokens,
             cache_store=cache_store,
-            output_dir=output_dir
+            output_dir=output_dir,
+            output_mode=output_mode,
+            strategy=strategy
         )
 
         # Extract chunks (files written progressively)
         console.print(f"[cyan]Extracting chunks with V3A from {input_path.name}...[/cyan]")
-        console.print(f"[dim]Model: {model}, Max tokens: {max_tokens}[/dim]")
+        console.print(f"[dim]Model: {model}, Max tokens: {max_tokens}, Strategy: {strategy}[/dim]")
         console.print(f"[dim]Output: {output_dir}[/dim]\n")
 
         result = extractor.extract_chunks(document, structure)
@@ -1056,17 +2341,27 @@ def _create_cli():
         log_level: Annotated[
             str,
             typer.Option("--log-level", help="Logging level")
-        ] = "INFO"
+        ] = "INFO",
+        cache_backend: CacheBackendOption = "disk",
+        output_mode: Annotated[
+            str,
+            typer.Option("--output-mode", help="'jsonl' (one file per document) or 'per_chunk' (one JSON per chunk)")
+        ] = OUTPUT_MODE_JSONL,
+        batched: Annotated[
+            bool,
+            typer.Option("--batched", help="Use V3C: many sections per LLM call, per-section fallback")
+        ] = False
     ):
         """
         Extract chunks using V3B (Aggressive: 1 call per section).
 
         V3B makes 1 LLM call per section (extract + prefix merged) with document caching.
         Expected cache efficiency: ~80-90% for multi-section documents.
+        With --batched, V3C extracts many sections per call instead.
         """
         # Setup
         api_key = _setup_environment()
-        logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+        logger, cache_store, llm_provider = _setup_components(api_key, log_level, cache_backend)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Clear local cache if redo flag is set
@@ -1093,18 +2388,20 @@ def _create_cli():
         # Initialize extractor with output directory for progressive writing
         token_counter = TokenCounter()
         metadata_validator = MetadataValidator()
-        extractor = ChunkExtractorV3B(
+        extractor_cls = ChunkExtractorV3C if batched else ChunkExtractorV3B
+        extractor = extractor_cls(
             llm_client=llm_provider,
             token_counter=token_counter,
             metadata_validator=metadata_validator,
             model=model,
             max_chunk_tokens=max_tokens,
             cache_store=cache_store,
-            output_dir=output_dir
+            output_dir=output_dir,
+            output_mode=output_mode
         )
 
         # Extract chunks (files written progressively)
-        console.print(f"[cyan]Extracting chunks with V3B from {input_path.name}...[/cyan]")
+        console.print(f"[cyan]Extracting chunks with {extractor.version} from {input_path.name}...[/cyan]")
         console.print(f"[dim]Model: {model}, Max tokens: {max_tokens}[/dim]")
         console.print(f"[dim]Output: {output_dir}[/dim]\n")
 
@@ -1116,7 +2413,7 @@ def _create_cli():
         console.print(f"[cyan]Tokens consumed:[/cyan] {tokens_consumed:,}")
         console.print(f"[cyan]Output directory:[/cyan] {output_dir}")
 
-        logger.info(f"V3B extraction: {len(chunks)} chunks, {tokens_consumed} tokens")
+        logger.info(f"{extractor.version} extraction: {len(chunks)} chunks, {tokens_consumed} tokens")
 
     return app
 
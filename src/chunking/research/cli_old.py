@@ -5,26 +5,42 @@ This module provides a Typer-based CLI for processing documents with the
 contextual chunking pipeline and managing cache operations.
 """
 
+import hashlib
 import json
+import logging
 import os
 import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Annotated
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Annotated
 
 import typer
-import yaml
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from .cache_store import FileCacheStore
+from .cache_store import CACHE_BACKEND_HELP, CacheStore, create_cache_store
 from .structure_analyzer import StructureAnalyzer
-from .models import Document
+from .metadata_validator import MetadataValidator
+from .models import Chunk, Document, Structure, TokenCounter
 
 # Initialize Rich console for colored output
 console = Console()
 
+# Structure output serializer, built once (pydantic-core encodes in one pass)
+_STRUCTURE_OUTPUT_ADAPTER = TypeAdapter(Dict[str, Any])
+
+# --cache-backend option shared by every command that touches the cache
+CacheBackendOption = Annotated[
+    str,
+    typer.Option(
+        "--cache-backend",
+        help=CACHE_BACKEND_HELP,
+        envvar="CHUNKING_CACHE_BACKEND"
+    )
+]
+
 # Initialize Typer app
 app = typer.Typer(
     name="chunking",
@@ -57,13 +73,41 @@ def _setup_environment() -> str:
     return api_key
 
 
-def _setup_components(api_key: str, log_level: str) -> Tuple[Any, Any, Any]:
+def _make_cache_store(cache_backend: str) -> CacheStore:
+    """
+    Build the cache store selected with --cache-backend.
+
+    Args:
+        cache_backend: --cache-backend value (see create_cache_store)
+
+    Raises:
+        typer.Exit: If the backend is unknown or its dependency is missing
+    """
+    try:
+        return create_cache_store(cache_backend)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(2)
+    except ImportError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _setup_components(
+    api_key: str,
+    log_level: str,
+    concurrency: int = 1,
+    cache_backend: str = "disk"
+) -> Tuple[Any, Any, Any]:
     """
     Initialize logger, cache store, and LLM provider.
 
     Args:
         api_key: OpenRouter API key
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        concurrency: Files processed in parallel; the provider's connection
+            pool is sized so each worker keeps its connection alive
+        cache_backend: --cache-backend value (see create_cache_store)
 
     Returns:
         Tuple of (logger, cache_store, llm_provider)
@@ -75,11 +119,15 @@ def _setup_components(api_key: str, log_level: str) -> Tuple[Any, Any, Any]:
     from .logger import setup_logging
     logger = setup_logging(log_level, use_context=False)
 
+    cache_store = _make_cache_store(cache_backend)
+
     # Import and initialize components
     try:
         from .llm_provider import OpenRouterProvider
-        cache_store = FileCacheStore()
-        llm_provider = OpenRouterProvider(api_key=api_key)
+        llm_provider = OpenRouterProvider(
+            api_key=api_key, max_connections=max(32, concurrency)
+        )
+        llm_provider.warm_up()
         return logger, cache_store, llm_provider
     except ImportError as e:
         console.print(f"[red]Error:[/red] Failed to import required modules: {e}")
@@ -103,10 +151,21 @@ def _discover_files(input_path: Path) -> List[Path]:
         console.print(f"[cyan]Processing single file:[/cyan] {input_path.name}")
         return [input_path]
     elif input_path.is_dir():
-        files = list(input_path.glob("*.txt")) + list(input_path.glob("*.md"))
-        if not files:
+        # One scandir pass; entries carry their stat, so sizes cost no extra syscall
+        entries = []
+        with os.scandir(input_path) as it:
+            for entry in it:
+                if entry.name.endswith(DOCUMENT_SUFFIXES) and entry.is_file():
+                    entries.append((Path(entry.path), entry.stat().st_size))
+        if not entries:
             console.print(f"[yellow]Warning:[/yellow] No .txt or .md files found in {input_path}")
             raise typer.Exit(0)
+
+        files, duplicates = _dedupe_files(sorted(entries))
+        if duplicates:
+            console.print(f"[yellow]Warning:[/yellow] Skipping {len(duplicates)} duplicate file(s):")
+            for duplicate, original in duplicates:
+                console.print(f"  - {duplicate.name} (same content as {original.name})")
         console.print(f"[cyan]Processing folder:[/cyan] {len(files)} files found")
         return files
     else:
@@ -114,6 +173,65 @@ def _discover_files(input_path: Path) -> List[Path]:
         raise typer.Exit(2)
 
 
+DOCUMENT_SUFFIXES = (".txt", ".md")
+
+# Bytes hashed to tell same-size files apart before hashing them in full
+DEDUPE_PREFIX_BYTES = 4096
+
+
+def _file_digest(path: Path, limit: Optional[int] = None) -> bytes:
+    """blake2b digest of a file's first `limit` bytes (whole file when None)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        if limit is not None:
+            digest.update(f.read(limit))
+        else:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.digest()
+
+
+def _dedupe_files(entries: List[Tuple[Path, int]]) -> Tuple[List[Path], List[Tuple[Path, Path]]]:
+    """
+    Drop files whose content duplicates an earlier file.
+
+    Files are only read when another file has the same size; a hash of the
+    first DEDUPE_PREFIX_BYTES narrows candidates further, and full-content
+    hashes decide.
+
+    Args:
+        entries: (path, size) pairs in processing order
+
+    Returns:
+        Tuple of (unique paths in order, [(duplicate, original), ...])
+    """
+    by_size: Dict[int, List[Path]] = {}
+    for path, size in entries:
+        by_size.setdefault(size, []).append(path)
+
+    duplicate_of: Dict[Path, Path] = {}
+    for size, paths in by_size.items():
+        if len(paths) < 2:
+            continue
+        by_prefix: Dict[bytes, List[Path]] = {}
+        for path in paths:
+            by_prefix.setdefault(_file_digest(path, DEDUPE_PREFIX_BYTES), []).append(path)
+        for prefix, candidates in by_prefix.items():
+            if len(candidates) < 2:
+                continue
+            first_seen: Dict[bytes, Path] = {}
+            for path in candidates:
+                # Small files were hashed whole by the prefix pass
+                digest = prefix if size <= DEDUPE_PREFIX_BYTES else _file_digest(path)
+                original = first_seen.setdefault(digest, path)
+                if original is not path:
+                    duplicate_of[path] = original
+
+    unique = [path for path, _ in entries if path not in duplicate_of]
+    duplicates = [(path, duplicate_of[path]) for path, _ in entries if path in duplicate_of]
+    return unique, duplicates
+
+
 def _write_structure_output(
     structure_data: Dict[str, Any],
     output_path: Path,
@@ -133,15 +251,419 @@ def _write_structure_output(
         del structure_data["stats"]
 
     if format == "json":
-        output_path.write_text(json.dumps(structure_data, indent=2, default=str))
+        output_path.write_bytes(_STRUCTURE_OUTPUT_ADAPTER.dump_json(structure_data, indent=2))
     elif format == "jsonl":
-        output_path.write_text(json.dumps(structure_data, default=str) + "\n")
+        output_path.write_bytes(_STRUCTURE_OUTPUT_ADAPTER.dump_json(structure_data) + b"\n")
     elif format == "yaml":
+        import yaml  # Only needed for YAML output
         output_path.write_text(yaml.dump(structure_data, default_flow_style=False))
     else:
         raise ValueError(f"Unsupported format: {format}")
 
 
+def _write_chunks_jsonl(output_file: Path, chunks: List[Any]) -> None:
+    """
+    Write chunks as JSONL (one chunk per line) with a single write call.
+
+    Each chunk is encoded by Pydantic's compiled serializer (model_dump_json)
+    rather than model_dump() + json.dumps, and the joined lines are written
+    as bytes in one call. Datetimes come out as ISO 8601.
+    """
+    payload = "\n".join(chunk.model_dump_json() for chunk in chunks)
+    output_file.write_bytes((payload + "\n").encode() if chunks else b"")
+
+
+# Word-boundary fields every section of an analyze-v2 structure must carry
+V2_BOUNDARY_FIELDS = frozenset(("start_words", "end_words"))
+
+
+def _load_structure(structure_data: Dict[str, Any]) -> Structure:
+    """
+    Build a Structure from an analyze / analyze-v2 JSON output.
+
+    The whole structure, sections included, is validated in one
+    Structure.model_validate call, so pydantic-core builds every Section in
+    a single pass instead of one Python-level constructor call per section.
+    """
+    structure = structure_data["structure"]
+    return Structure.model_validate({
+        "document_id": structure_data["document_id"],
+        "chapter_title": structure["chapter_title"],
+        "chapter_number": structure.get("chapter_number"),
+        "sections": structure["sections"],
+        "metadata": structure.get("metadata", {}),
+        "analysis_model": structure["analysis_model"]
+    })
+
+
+class _SafeFilenameTable(dict):
+    """
+    str.translate table mapping characters that are not alphanumeric, space,
+    '_' or '-' to '_'. Entries are filled on first sight, so any Unicode
+    character is handled (same rule as str.isalnum) while repeat lookups stay
+    in C.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        self[code] = char if char.isalnum() or char in " _-" else "_"
+        return self[code]
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+# Concurrent file writes when saving per-section LLM responses as text files
+RESPONSE_WRITE_WORKERS = 16
+
+# Layouts for saved LLM responses (--responses-format)
+RESPONSE_FORMATS = ("dir", "jsonl", "zip")
+
+
+def _check_responses_format(responses_format: str) -> None:
+    """Exit before any LLM work if --responses-format is not one of RESPONSE_FORMATS"""
+    if responses_format not in RESPONSE_FORMATS:
+        console.print(
+            f"[red]Error:[/red] Unknown responses format '{responses_format}' "
+            f"(use {', '.join(RESPONSE_FORMATS)})"
+        )
+        raise typer.Exit(2)
+
+
+class _LLMResponseWriter:
+    """
+    Write raw extraction/metadata/prefix responses section by section.
+
+    "dir" (default) writes one text file per section and kind under
+    llm_responses_dir, on a thread pool since the files are independent.
+    "jsonl" appends to a single <llm_responses_dir>.jsonl instead (one
+    {"section", "kind", "response"} record per line). "zip" writes the same
+    per-section text files as entries of an uncompressed
+    <llm_responses_dir>.zip, so slow filesystems see one file instead of
+    three per section. Nothing is created until the first response arrives.
+    """
+
+    def __init__(self, llm_responses_dir: Path, responses_format: str = "dir"):
+        self.responses_format = responses_format
+        self.records_written = 0
+        if responses_format == "jsonl":
+            self.path = llm_responses_dir.with_name(f"{llm_responses_dir.name}.jsonl")
+        elif responses_format == "zip":
+            self.path = llm_responses_dir.with_name(f"{llm_responses_dir.name}.zip")
+        else:
+            self.path = llm_responses_dir
+        self._output: Any = None
+        self._write_futures: List[Any] = []
+
+    def _open(self) -> None:
+        """Create the output on the first record"""
+        if self.responses_format == "jsonl":
+            self._output = self.path.open("w", encoding="utf-8")
+        elif self.responses_format == "zip":
+            self._output = zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED)
+        else:
+            self.path.mkdir(exist_ok=True)
+            self._output = ThreadPoolExecutor(max_workers=RESPONSE_WRITE_WORKERS)
+
+    def write(self, section_title: str, responses: Dict[str, Any]) -> None:
+        """Write one section's non-empty responses"""
+        for kind in ("extraction", "metadata", "prefix"):
+            response = responses[kind]["response"]
+            if not response:
+                continue
+            if self._output is None:
+                self._open()
+            self.records_written += 1
+
+            if self.responses_format == "jsonl":
+                self._output.write(
+                    json.dumps({"section": section_title, "kind": kind, "response": response}) + "\n"
+                )
+                continue
+
+            # Sanitize section title for filename
+            safe_title = section_title.translate(_SAFE_FILENAME_TABLE).replace(' ', '_')[:100]  # Limit length
+            name = f"{safe_title}_{kind}.txt"
+            if self.responses_format == "zip":
+                self._output.writestr(name, response)
+            else:
+                self._write_futures.append(self._output.submit(
+                    (self.path / name).write_text, response, encoding="utf-8"
+                ))
+
+    def close(self) -> None:
+        """Finish writing; raises the first failed file write, if any"""
+        if self._output is None:
+            return
+        output, self._output = self._output, None
+        if isinstance(output, ThreadPoolExecutor):
+            output.shutdown(wait=True)
+            for future in self._write_futures:
+                future.result()
+        else:
+            output.close()
+
+
+def _save_llm_responses(
+    llm_responses: Dict[str, Any],
+    llm_responses_dir: Path,
+    responses_format: str = "dir"
+) -> Path:
+    """
+    Save raw extraction/metadata/prefix responses (see _LLMResponseWriter).
+
+    Returns:
+        The directory, JSONL or zip file written
+    """
+    writer = _LLMResponseWriter(llm_responses_dir, responses_format)
+    try:
+        for section_title, responses in llm_responses.items():
+            writer.write(section_title, responses)
+    finally:
+        writer.close()
+    return writer.path
+
+
+# Progress display: redraws per second on a terminal, and how often (in files)
+# a plain log line is emitted instead when output is not a terminal
+PROGRESS_REFRESH_PER_SECOND = 4
+PROGRESS_LOG_EVERY = 25
+
+
+def _make_progress(show_progress: bool = True) -> Any:
+    """
+    Build the per-file progress display.
+
+    Redraws are capped at PROGRESS_REFRESH_PER_SECOND. Off a terminal, or with
+    show_progress=False (--no-progress), the display is disabled and
+    _run_per_file logs periodic progress lines instead.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+        disable=not (show_progress and console.is_terminal)
+    )
+
+
+def _run_per_file(
+    files: List[Path],
+    work: Callable[[Path], Any],
+    concurrency: int,
+    progress: Any,
+    task: Any
+) -> Iterator[Tuple[Path, Any, Optional[Exception]]]:
+    """
+    Run work(file_path) for every file on a thread pool.
+
+    Per-file work is dominated by LLM round-trips, so files are processed
+    concurrently (up to the provider rate limit) instead of one at a time.
+
+    Args:
+        files: Files to process
+        work: Per-file function; its return value is yielded back
+        concurrency: Maximum number of files in flight
+        progress: Rich Progress instance (advanced once per finished file)
+        task: Progress task ID
+
+    Yields:
+        (file_path, result, error) in completion order; exactly one of
+        result / error is set
+    """
+    log_progress = progress.disable
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(work, file_path): file_path for file_path in files}
+        for done, future in enumerate(as_completed(futures), 1):
+            file_path = futures[future]
+            try:
+                yield file_path, future.result(), None
+            except Exception as e:
+                yield file_path, None, e
+            progress.advance(task)
+            if log_progress and (done % PROGRESS_LOG_EVERY == 0 or done == len(files)):
+                logging.getLogger(__name__).info("Progress: %d/%d files", done, len(files))
+
+
+def _chunks_output_path(file_path: Path, output_dir: Path) -> Path:
+    """JSONL chunk file written by process for file_path."""
+    return output_dir / f"{file_path.stem}_chunks.jsonl"
+
+
+def _structure_output_path(file_path: Path, output_dir: Path, format: str, v2: bool = False) -> Path:
+    """Structure file written by analyze / analyze_v2 for file_path."""
+    suffix = "_structure_v2" if v2 else "_structure"
+    ext = {"json": ".json", "jsonl": ".jsonl", "yaml": ".yaml"}[format]
+    return output_dir / f"{file_path.stem}{suffix}{ext}"
+
+
+def _skip_up_to_date(
+    files: List[Path],
+    output_for: Callable[[Path], Path],
+    redo: bool
+) -> Tuple[List[Path], int]:
+    """
+    Drop files whose output already exists and is newer than the input.
+
+    A stat per file replaces loading, hashing and cache lookups for documents
+    finished by an earlier run. Nothing is skipped when redo is set.
+
+    Args:
+        files: Files to process
+        output_for: Maps an input file to the output file it produces
+        redo: Force reprocessing
+
+    Returns:
+        (files still to process, number of files skipped)
+    """
+    if redo:
+        return files, 0
+
+    pending = []
+    for file_path in files:
+        try:
+            up_to_date = output_for(file_path).stat().st_mtime > file_path.stat().st_mtime
+        except OSError:
+            up_to_date = False
+        if up_to_date:
+            logging.getLogger(__name__).info("Skipping %s (up-to-date output)", file_path.name)
+        else:
+            pending.append(file_path)
+    return pending, len(files) - len(pending)
+
+
+def _process_one(
+    file_path: Path,
+    pipeline: Any,
+    output_dir: Path,
+    redo: bool,
+    on_chunk: Optional[Callable[[Path, int], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run the full pipeline on one file, streaming its chunks to JSONL.
+
+    Chunks are written as the pipeline yields them, so only one section's
+    chunk is held in memory at a time. They go to a temporary file that
+    replaces the output only on success, so a failed run never leaves a
+    partial file that _skip_up_to_date would take as finished.
+
+    Args:
+        file_path: Document to process
+        pipeline: ChunkingPipeline
+        output_dir: Output directory
+        redo: Bypass cache
+        on_chunk: Called with (file_path, chunks written so far) after each chunk
+
+    Returns:
+        Report dict from pipeline.iter_chunks (total_chunks, text_coverage_ratio, ...)
+    """
+    document = Document.from_file(file_path)
+    report: Dict[str, Any] = {}
+
+    # Write output as JSONL (one chunk per line)
+    output_file = _chunks_output_path(file_path, output_dir)
+    partial_file = output_file.with_name(output_file.name + ".partial")
+    try:
+        with partial_file.open("wb") as f:
+            for written, chunk in enumerate(pipeline.iter_chunks(document, redo=redo, report=report), 1):
+                f.write(chunk.model_dump_json().encode() + b"\n")
+                if on_chunk is not None:
+                    on_chunk(file_path, written)
+        os.replace(partial_file, output_file)
+    finally:
+        partial_file.unlink(missing_ok=True)
+    return report
+
+
+def _analyze_one(
+    file_path: Path,
+    analyzer: Any,
+    output_dir: Path,
+    redo: bool,
+    format: str,
+    include_stats: bool,
+    max_tokens: int,
+    v2: bool = False
+) -> Dict[str, Any]:
+    """
+    Analyze one file and write its structure (and raw LLM response) to disk.
+
+    Args:
+        file_path: Document to analyze
+        analyzer: StructureAnalyzer or StructureAnalyzerV2
+        output_dir: Output directory
+        redo: Bypass cache
+        format: Output format (json, jsonl, yaml)
+        include_stats: Include processing statistics in output
+        max_tokens: Maximum tokens per chunk (recorded in stats)
+        v2: Write V2 fields (word boundaries, is_table) and file names
+
+    Returns:
+        Analyzer result dict, plus "llm_response_path" when a response was saved
+    """
+    # Load document
+    document = Document.from_file(file_path)
+
+    # Analyze structure
+    result = analyzer.analyze(document, redo=redo)
+
+    # Prepare output data
+    structure = result["structure"]
+    sections = []
+    for s in structure.sections:
+        section_data = {
+            "title": s.title,
+            "level": s.level,
+            "parent_section": s.parent_section,
+            "summary": s.summary
+        }
+        if v2:
+            section_data["start_words"] = s.start_words
+            section_data["end_words"] = s.end_words
+            section_data["is_table"] = s.is_table
+        sections.append(section_data)
+
+    structure_data = {
+        "document_id": structure.document_id,
+        "file_path": str(file_path),
+        "file_hash": document.file_hash,
+        "structure": {
+            "chapter_title": structure.chapter_title,
+            "chapter_number": structure.chapter_number,
+            "sections": sections,
+            "metadata": structure.metadata,
+            "analysis_model": structure.analysis_model,
+            "analyzed_at": structure.analyzed_at.isoformat()
+        }
+    }
+
+    # Add stats if requested
+    if include_stats:
+        structure_data["stats"] = {
+            "tokens_consumed": result["tokens_consumed"],
+            "cache_hit": result["cache_hit"],
+            "section_count": len(structure.sections),
+            "max_chunk_tokens": max_tokens
+        }
+        if v2:
+            structure_data["stats"]["version"] = "v2"
+
+    # Write output
+    suffix = "_structure_v2" if v2 else "_structure"
+    output_path = _structure_output_path(file_path, output_dir, format, v2)
+    _write_structure_output(structure_data, output_path, format, include_stats)
+
+    # Save raw LLM response if available
+    llm_response = result.get("llm_response")
+    if llm_response:
+        llm_response_path = output_dir / f"{file_path.stem}{suffix}_llm_response.txt"
+        llm_response_path.write_text(llm_response, encoding="utf-8")
+        result["llm_response_path"] = llm_response_path
+
+    return result
+
+
 # ============================================================================
 # Process Command
 # ============================================================================
@@ -198,6 +720,23 @@ def process(
             help="Bypass cache and force reprocessing"
         )
     ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            "-c",
+            help="Number of files processed in parallel",
+            min=1
+        )
+    ] = 8,
+    show_progress: Annotated[
+        bool,
+        typer.Option(
+            "--progress/--no-progress",
+            help="Show the live progress display (off: log a line every few files)"
+        )
+    ] = True,
+    cache_backend: CacheBackendOption = "disk",
     log_level: Annotated[
         str,
         typer.Option(
@@ -214,7 +753,9 @@ def process(
     """
     # Setup environment and components
     api_key = _setup_environment()
-    logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+    logger, cache_store, llm_provider = _setup_components(
+        api_key, log_level, concurrency, cache_backend=cache_backend
+    )
 
     # Validate and create output directory
     try:
@@ -226,7 +767,6 @@ def process(
     # Import pipeline components
     try:
         from .chunking_pipeline import ChunkingPipeline
-        from .models import Document
     except ImportError as e:
         console.print(f"[red]Error:[/red] Failed to import required modules: {e}")
         raise typer.Exit(1)
@@ -247,47 +787,45 @@ def process(
     total_chunks = 0
     total_errors = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    pending_files, skipped = _skip_up_to_date(
+        files_to_process, lambda file_path: _chunks_output_path(file_path, output_dir), redo
+    )
+
+    with _make_progress(show_progress) as progress:
         task = progress.add_task(
             f"Processing {len(files_to_process)} file(s)...",
-            total=len(files_to_process)
+            total=len(files_to_process),
+            completed=skipped
         )
 
-        for file_path in files_to_process:
-            try:
-                progress.update(task, description=f"Processing {file_path.name}...")
-
-                # Load and process document
-                document = Document.from_file(file_path)
-                result = pipeline.process_document(document, redo=redo)
-
-                # Write output as JSONL (one chunk per line)
-                output_file = output_dir / f"{file_path.stem}_chunks.jsonl"
-                with output_file.open("w") as f:
-                    for chunk in result.chunks:
-                        # Convert chunk to dict and write as JSON line
-                        f.write(json.dumps(chunk.dict(), default=str) + "\n")
-
-                total_chunks += len(result.chunks)
-                logger.info(
-                    f"Processed {file_path.name}: {len(result.chunks)} chunks, "
-                    f"coverage: {result.text_coverage_ratio:.2%}"
-                )
+        on_chunk = None
+        if not progress.disable:
+            def on_chunk(file_path: Path, written: int) -> None:
+                progress.update(task, description=f"Processing {file_path.name} (chunk {written})...")
 
-            except Exception as e:
+        results = _run_per_file(
+            pending_files,
+            lambda file_path: _process_one(file_path, pipeline, output_dir, redo, on_chunk),
+            concurrency, progress, task
+        )
+        for file_path, result, error in results:
+            if error is not None:
                 total_errors += 1
-                console.print(f"[red]Error processing {file_path.name}:[/red] {e}")
-                logger.error(f"Failed to process {file_path.name}: {e}", exc_info=True)
-
-            progress.advance(task)
+                console.print(f"[red]Error processing {file_path.name}:[/red] {error}")
+                logger.error("Failed to process %s: %s", file_path.name, error, exc_info=error)
+                continue
+
+            total_chunks += result["total_chunks"]
+            logger.info(
+                "Processed %s: %d chunks, coverage: %.2f%%",
+                file_path.name, result["total_chunks"], result["text_coverage_ratio"] * 100
+            )
 
     # Summary
     console.print("\n[bold green]Processing complete![/bold green]")
     console.print(f"Files processed: {len(files_to_process) - total_errors}/{len(files_to_process)}")
+    if skipped > 0:
+        console.print(f"Skipped (up-to-date output): {skipped}")
     if total_errors > 0:
         console.print(f"[yellow]Errors:[/yellow] {total_errors}")
     if total_chunks > 0:
@@ -365,6 +903,23 @@ def analyze(
             help="Include processing statistics in output"
         )
     ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            "-c",
+            help="Number of files processed in parallel",
+            min=1
+        )
+    ] = 8,
+    show_progress: Annotated[
+        bool,
+        typer.Option(
+            "--progress/--no-progress",
+            help="Show the live progress display (off: log a line every few files)"
+        )
+    ] = True,
+    cache_backend: CacheBackendOption = "disk",
     log_level: Annotated[
         str,
         typer.Option(
@@ -381,7 +936,9 @@ def analyze(
     """
     # Setup environment and components
     api_key = _setup_environment()
-    logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+    logger, cache_store, llm_provider = _setup_components(
+        api_key, log_level, concurrency, cache_backend=cache_backend
+    )
 
     # Validate and create output directory
     try:
@@ -407,89 +964,51 @@ def analyze(
     total_errors = 0
     total_tokens = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    pending_files, skipped = _skip_up_to_date(
+        files_to_process,
+        lambda file_path: _structure_output_path(file_path, output_dir, format),
+        redo
+    )
+
+    with _make_progress(show_progress) as progress:
         task = progress.add_task(
             f"Analyzing {len(files_to_process)} file(s)...",
-            total=len(files_to_process)
+            total=len(files_to_process),
+            completed=skipped
         )
 
-        for file_path in files_to_process:
-            try:
-                progress.update(task, description=f"Analyzing {file_path.name}...")
-
-                # Load document
-                document = Document.from_file(file_path)
-
-                # Analyze structure
-                result = analyzer.analyze(document, redo=redo)
-
-                # Prepare output data
-                structure = result["structure"]
-                structure_data = {
-                    "document_id": structure.document_id,
-                    "file_path": str(file_path),
-                    "file_hash": document.file_hash,
-                    "structure": {
-                        "chapter_title": structure.chapter_title,
-                        "chapter_number": structure.chapter_number,
-                        "sections": [
-                            {
-                                "title": s.title,
-                                "level": s.level,
-                                "parent_section": s.parent_section,
-                                "summary": s.summary
-                            }
-                            for s in structure.sections
-                        ],
-                        "metadata": structure.metadata,
-                        "analysis_model": structure.analysis_model,
-                        "analyzed_at": structure.analyzed_at.isoformat()
-                    }
-                }
-
-                # Add stats if requested
-                if include_stats:
-                    structure_data["stats"] = {
-                        "tokens_consumed": result["tokens_consumed"],
-                        "cache_hit": result["cache_hit"],
-                        "section_count": len(structure.sections),
-                        "max_chunk_tokens": max_tokens
-                    }
-
-                # Write output
-                ext = {"json": ".json", "jsonl": ".jsonl", "yaml": ".yaml"}[format]
-                output_path = output_dir / f"{file_path.stem}_structure{ext}"
-                _write_structure_output(structure_data, output_path, format, include_stats)
-
-                # Save raw LLM response if available
-                llm_response = result.get("llm_response")
-                if llm_response:
-                    llm_response_path = output_dir / f"{file_path.stem}_structure_llm_response.txt"
-                    llm_response_path.write_text(llm_response, encoding="utf-8")
-                    cached_label = " (cached)" if result.get("llm_response_cached") else ""
-                    logger.info(f"Saved LLM response{cached_label}: {llm_response_path.name}")
-
-                total_analyzed += 1
-                total_tokens += result["tokens_consumed"]
-                logger.info(
-                    f"Analyzed {file_path.name}: {len(structure.sections)} sections, "
-                    f"tokens: {result['tokens_consumed']}, cache_hit: {result['cache_hit']}"
-                )
-
-            except Exception as e:
+        results = _run_per_file(
+            pending_files,
+            lambda file_path: _analyze_one(
+                file_path, analyzer, output_dir, redo, format, include_stats, max_tokens
+            ),
+            concurrency, progress, task
+        )
+        for file_path, result, error in results:
+            if error is not None:
                 total_errors += 1
-                console.print(f"[red]Error analyzing {file_path.name}:[/red] {e}")
-                logger.error(f"Failed to analyze {file_path.name}: {e}", exc_info=True)
-
-            progress.advance(task)
+                console.print(f"[red]Error analyzing {file_path.name}:[/red] {error}")
+                logger.error("Failed to analyze %s: %s", file_path.name, error, exc_info=error)
+                continue
+
+            llm_response_path = result.get("llm_response_path")
+            if llm_response_path:
+                cached_label = " (cached)" if result.get("llm_response_cached") else ""
+                logger.info("Saved LLM response%s: %s", cached_label, llm_response_path.name)
+
+            structure = result["structure"]
+            total_analyzed += 1
+            total_tokens += result["tokens_consumed"]
+            logger.info(
+                "Analyzed %s: %d sections, tokens: %s, cache_hit: %s",
+                file_path.name, len(structure.sections), result["tokens_consumed"], result["cache_hit"]
+            )
 
     # Summary
     console.print("\n[bold green]Analysis complete![/bold green]")
     console.print(f"Files analyzed: {total_analyzed}/{len(files_to_process)}")
+    if skipped > 0:
+        console.print(f"Skipped (up-to-date output): {skipped}")
     if total_errors > 0:
         console.print(f"[yellow]Errors:[/yellow] {total_errors}")
     console.print(f"Total tokens consumed: {total_tokens:,}")
@@ -566,6 +1085,23 @@ def analyze_v2(
             help="Include processing statistics in output"
         )
     ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            "-c",
+            help="Number of files processed in parallel",
+            min=1
+        )
+    ] = 8,
+    show_progress: Annotated[
+        bool,
+        typer.Option(
+            "--progress/--no-progress",
+            help="Show the live progress display (off: log a line every few files)"
+        )
+    ] = True,
+    cache_backend: CacheBackendOption = "disk",
     log_level: Annotated[
         str,
         typer.Option(
@@ -583,7 +1119,9 @@ def analyze_v2(
     """
     # Setup environment and components
     api_key = _setup_environment()
-    logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+    logger, cache_store, llm_provider = _setup_components(
+        api_key, log_level, concurrency, cache_backend=cache_backend
+    )
 
     # Validate and create output directory
     try:
@@ -610,93 +1148,51 @@ def analyze_v2(
     total_errors = 0
     total_tokens = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    pending_files, skipped = _skip_up_to_date(
+        files_to_process,
+        lambda file_path: _structure_output_path(file_path, output_dir, format, v2=True),
+        redo
+    )
+
+    with _make_progress(show_progress) as progress:
         task = progress.add_task(
             f"Analyzing {len(files_to_process)} file(s) with V2...",
-            total=len(files_to_process)
+            total=len(files_to_process),
+            completed=skipped
         )
 
-        for file_path in files_to_process:
-            try:
-                progress.update(task, description=f"Analyzing {file_path.name} (V2)...")
-
-                # Load document
-                document = Document.from_file(file_path)
-
-                # Analyze structure with V2
-                result = analyzer.analyze(document, redo=redo)
-
-                # Prepare output data
-                structure = result["structure"]
-                structure_data = {
-                    "document_id": structure.document_id,
-                    "file_path": str(file_path),
-                    "file_hash": document.file_hash,
-                    "structure": {
-                        "chapter_title": structure.chapter_title,
-                        "chapter_number": structure.chapter_number,
-                        "sections": [
-                            {
-                                "title": s.title,
-                                "level": s.level,
-                                "parent_section": s.parent_section,
-                                "summary": s.summary,
-                                "start_words": s.start_words,
-                                "end_words": s.end_words,
-                                "is_table": s.is_table
-                            }
-                            for s in structure.sections
-                        ],
-                        "metadata": structure.metadata,
-                        "analysis_model": structure.analysis_model,
-                        "analyzed_at": structure.analyzed_at.isoformat()
-                    }
-                }
-
-                # Add stats if requested
-                if include_stats:
-                    structure_data["stats"] = {
-                        "tokens_consumed": result["tokens_consumed"],
-                        "cache_hit": result["cache_hit"],
-                        "section_count": len(structure.sections),
-                        "max_chunk_tokens": max_tokens,
-                        "version": "v2"
-                    }
-
-                # Write output
-                ext = {"json": ".json", "jsonl": ".jsonl", "yaml": ".yaml"}[format]
-                output_path = output_dir / f"{file_path.stem}_structure_v2{ext}"
-                _write_structure_output(structure_data, output_path, format, include_stats)
-
-                # Save raw LLM response if available
-                llm_response = result.get("llm_response")
-                if llm_response:
-                    llm_response_path = output_dir / f"{file_path.stem}_structure_v2_llm_response.txt"
-                    llm_response_path.write_text(llm_response, encoding="utf-8")
-                    cached_label = " (cached)" if result.get("llm_response_cached") else ""
-                    logger.info(f"Saved V2 LLM response{cached_label}: {llm_response_path.name}")
-
-                total_analyzed += 1
-                total_tokens += result["tokens_consumed"]
-                logger.info(
-                    f"Analyzed (V2) {file_path.name}: {len(structure.sections)} sections, "
-                    f"tokens: {result['tokens_consumed']}, cache_hit: {result['cache_hit']}"
-                )
-
-            except Exception as e:
+        results = _run_per_file(
+            pending_files,
+            lambda file_path: _analyze_one(
+                file_path, analyzer, output_dir, redo, format, include_stats, max_tokens, v2=True
+            ),
+            concurrency, progress, task
+        )
+        for file_path, result, error in results:
+            if error is not None:
                 total_errors += 1
-                console.print(f"[red]Error analyzing {file_path.name} (V2):[/red] {e}")
-                logger.error(f"Failed to analyze {file_path.name} (V2): {e}", exc_info=True)
-
-            progress.advance(task)
+                console.print(f"[red]Error analyzing {file_path.name} (V2):[/red] {error}")
+                logger.error("Failed to analyze %s (V2): %s", file_path.name, error, exc_info=error)
+                continue
+
+            llm_response_path = result.get("llm_response_path")
+            if llm_response_path:
+                cached_label = " (cached)" if result.get("llm_response_cached") else ""
+                logger.info("Saved V2 LLM response%s: %s", cached_label, llm_response_path.name)
+
+            structure = result["structure"]
+            total_analyzed += 1
+            total_tokens += result["tokens_consumed"]
+            logger.info(
+                "Analyzed (V2) %s: %d sections, tokens: %s, cache_hit: %s",
+                file_path.name, len(structure.sections), result["tokens_consumed"], result["cache_hit"]
+            )
 
     # Summary
     console.print("\n[bold green]V2 Analysis complete![/bold green]")
     console.print(f"Files analyzed: {total_analyzed}/{len(files_to_process)}")
+    if skipped > 0:
+        console.print(f"Skipped (up-to-date output): {skipped}")
     if total_errors > 0:
         console.print(f"[yellow]Errors:[/yellow] {total_errors}")
     console.print(f"Total tokens consumed: {total_tokens:,}")
@@ -777,6 +1273,29 @@ def extract(
             max=1.0
         )
     ] = 0.99,
+    responses_format: Annotated[
+        str,
+        typer.Option(
+            "--responses-format",
+            help="Raw LLM responses layout: dir (text file per section), jsonl (one file) or zip (one uncompressed archive)"
+        )
+    ] = "dir",
+    responses_jsonl: Annotated[
+        bool,
+        typer.Option(
+            "--responses-jsonl",
+            help="Same as --responses-format jsonl"
+        )
+    ] = False,
+    section_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--section-concurrency",
+            help="Sections extracted in parallel",
+            min=1
+        )
+    ] = 8,
+    cache_backend: CacheBackendOption = "disk",
     log_level: Annotated[
         str,
         typer.Option(
@@ -793,7 +1312,12 @@ def extract(
     """
     # Setup environment and components
     api_key = _setup_environment()
-    logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+    if responses_jsonl:
+        responses_format = "jsonl"
+    _check_responses_format(responses_format)
+    logger, cache_store, llm_provider = _setup_components(
+        api_key, log_level, cache_backend=cache_backend
+    )
 
     # Validate and create output directory
     try:
@@ -806,25 +1330,15 @@ def extract(
     try:
         from .chunk_extractor import ChunkExtractor
         from .text_aligner import TextAligner
-        from .metadata_validator import MetadataValidator
-        from .models import Document, Structure, Section, TokenCounter
     except ImportError as e:
         console.print(f"[red]Error:[/red] Failed to import required modules: {e}")
         raise typer.Exit(1)
 
     # Load structure from JSON
     try:
-        structure_data = json.loads(structure_path.read_text())
-        sections = [Section(**s) for s in structure_data["structure"]["sections"]]
-        structure = Structure(
-            document_id=structure_data["document_id"],
-            chapter_title=structure_data["structure"]["chapter_title"],
-            chapter_number=structure_data["structure"].get("chapter_number"),
-            sections=sections,
-            metadata=structure_data["structure"].get("metadata", {}),
-            analysis_model=structure_data["structure"]["analysis_model"]
-        )
-        console.print(f"[cyan]Loaded structure:[/cyan] {len(sections)} sections")
+        structure_data = json.loads(structure_path.read_bytes())
+        structure = _load_structure(structure_data)
+        console.print(f"[cyan]Loaded structure:[/cyan] {len(structure.sections)} sections")
     except Exception as e:
         console.print(f"[red]Error:[/red] Failed to load structure from {structure_path}: {e}")
         raise typer.Exit(2)
@@ -845,7 +1359,8 @@ def extract(
         metadata_validator=metadata_validator,
         model=model,
         max_chunk_tokens=max_tokens,
-        cache_store=cache_store
+        cache_store=cache_store,
+        max_concurrency=section_concurrency
     )
 
     # Extract chunks
@@ -877,47 +1392,27 @@ def extract(
 
         # Write chunks as JSONL
         output_file = output_dir / f"{input_path.stem}_chunks.jsonl"
-        with output_file.open("w") as f:
-            for chunk in chunks:
-                f.write(json.dumps(chunk.dict(), default=str) + "\n")
+        _write_chunks_jsonl(output_file, chunks)
 
         # Save raw LLM responses if available
         llm_responses = result.get("llm_responses", {})
         if llm_responses:
-            llm_responses_dir = output_dir / f"{input_path.stem}_llm_responses"
-            llm_responses_dir.mkdir(exist_ok=True)
-
-            for section_title, responses in llm_responses.items():
-                # Sanitize section title for filename
-                safe_title = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in section_title)
-                safe_title = safe_title.replace(' ', '_')[:100]  # Limit length
-
-                # Save extraction response
-                if responses["extraction"]["response"]:
-                    extraction_file = llm_responses_dir / f"{safe_title}_extraction.txt"
-                    extraction_file.write_text(responses["extraction"]["response"], encoding="utf-8")
-
-                # Save metadata response
-                if responses["metadata"]["response"]:
-                    metadata_file = llm_responses_dir / f"{safe_title}_metadata.txt"
-                    metadata_file.write_text(responses["metadata"]["response"], encoding="utf-8")
-
-                # Save prefix response
-                if responses["prefix"]["response"]:
-                    prefix_file = llm_responses_dir / f"{safe_title}_prefix.txt"
-                    prefix_file.write_text(responses["prefix"]["response"], encoding="utf-8")
-
-            logger.info(f"Saved LLM responses to: {llm_responses_dir}")
+            llm_responses_path = _save_llm_responses(
+                llm_responses,
+                output_dir / f"{input_path.stem}_llm_responses",
+                responses_format=responses_format
+            )
+            logger.info(f"Saved LLM responses to: {llm_responses_path}")
 
         console.print("\n[bold green]Extraction complete![/bold green]")
         console.print(f"Chunks: {len(chunks)}")
         console.print(f"Output file: {output_file}")
         if llm_responses:
-            console.print(f"LLM responses saved to: {llm_responses_dir.name}/")
+            console.print(f"LLM responses saved to: {llm_responses_path.name}")
 
         logger.info(
-            f"Extracted {len(chunks)} chunks from {input_path.name}, "
-            f"tokens: {tokens_consumed}, coverage: {coverage_ratio:.2%}"
+            "Extracted %d chunks from %s, tokens: %s, coverage: %.2f%%",
+            len(chunks), input_path.name, tokens_consumed, coverage_ratio * 100
         )
 
         raise typer.Exit(0)
@@ -997,6 +1492,46 @@ def extract_v2(
             max=1.0
         )
     ] = 0.99,
+    responses_format: Annotated[
+        str,
+        typer.Option(
+            "--responses-format",
+            help="Raw LLM responses layout: dir (text file per section), jsonl (one file) or zip (one uncompressed archive)"
+        )
+    ] = "dir",
+    responses_jsonl: Annotated[
+        bool,
+        typer.Option(
+            "--responses-jsonl",
+            help="Same as --responses-format jsonl"
+        )
+    ] = False,
+    section_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--section-concurrency",
+            "--max-concurrency",
+            help="Sections extracted in parallel",
+            min=1
+        )
+    ] = 8,
+    batch_api: Annotated[
+        bool,
+        typer.Option(
+            "--batch-api",
+            help="Run each LLM step for all sections as one OpenAI Batch API job "
+                 "(about half price, completes within 24h; needs OPENAI_API_KEY and an openai/ model)"
+        )
+    ] = False,
+    fused: Annotated[
+        bool,
+        typer.Option(
+            "--fused",
+            help="Extract, describe and prefix each section in one structured-output (JSON schema) "
+                 "call instead of three; falls back to three calls where unsupported"
+        )
+    ] = False,
+    cache_backend: CacheBackendOption = "disk",
     log_level: Annotated[
         str,
         typer.Option(
@@ -1013,7 +1548,24 @@ def extract_v2(
     """
     # Setup environment and components
     api_key = _setup_environment()
-    logger, cache_store, llm_provider = _setup_components(api_key, log_level)
+    if responses_jsonl:
+        responses_format = "jsonl"
+    _check_responses_format(responses_format)
+    logger, cache_store, llm_provider = _setup_components(
+        api_key, log_level, cache_backend=cache_backend
+    )
+
+    batch_provider = None
+    if batch_api:
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            console.print("[red]Error:[/red] --batch-api requires OPENAI_API_KEY")
+            raise typer.Exit(2)
+        if not model.startswith("openai/"):
+            console.print("[red]Error:[/red] --batch-api requires an openai/ model")
+            raise typer.Exit(2)
+        from .llm_provider import OpenAIBatchProvider
+        batch_provider = OpenAIBatchProvider(api_key=openai_api_key)
 
     # Validate and create output directory
     try:
@@ -1026,35 +1578,24 @@ def extract_v2(
     try:
         from .chunk_extractor_v2 import ChunkExtractorV2
         from .text_aligner import TextAligner
-        from .metadata_validator import MetadataValidator
-        from .models import Document, Structure, SectionV2, TokenCounter
     except ImportError as e:
         console.print(f"[red]Error:[/red] Failed to import required modules: {e}")
         raise typer.Exit(1)
 
     # Load structure from JSON (V2 format with word boundaries)
     try:
-        structure_data = json.loads(structure_path.read_text())
+        structure_data = json.loads(structure_path.read_bytes())
 
-        # Check if this is V2 structure (has start_words/end_words)
-        first_section = structure_data["structure"]["sections"][0]
-        if "start_words" not in first_section or "end_words" not in first_section:
+        # Check if this is V2 structure (every section has start_words/end_words)
+        if not all(map(V2_BOUNDARY_FIELDS.issubset, structure_data["structure"]["sections"])):
             console.print(
                 f"[red]Error:[/red] Structure file does not contain word boundaries (start_words/end_words).\n"
                 f"This command requires V2 structure. Please use 'analyze-v2' command to generate V2 structure."
             )
             raise typer.Exit(2)
 
-        sections = [SectionV2(**s) for s in structure_data["structure"]["sections"]]
-        structure = Structure(
-            document_id=structure_data["document_id"],
-            chapter_title=structure_data["structure"]["chapter_title"],
-            chapter_number=structure_data["structure"].get("chapter_number"),
-            sections=sections,
-            metadata=structure_data["structure"].get("metadata", {}),
-            analysis_model=structure_data["structure"]["analysis_model"]
-        )
-        console.print(f"[cyan]Loaded V2 structure:[/cyan] {len(sections)} sections with word boundaries")
+        structure = _load_structure(structure_data)
+        console.print(f"[cyan]Loaded V2 structure:[/cyan] {len(structure.sections)} sections with word boundaries")
     except KeyError as e:
         console.print(f"[red]Error:[/red] Invalid structure format: missing field {e}")
         raise typer.Exit(2)
@@ -1078,79 +1619,78 @@ def extract_v2(
         metadata_validator=metadata_validator,
         model=model,
         max_chunk_tokens=max_tokens,
-        cache_store=cache_store
+        cache_store=cache_store,
+        max_concurrency=section_concurrency,
+        batch_provider=batch_provider,
+        batch_dir=output_dir / "_batches",
+        fused_calls=fused
     )
 
-    # Extract chunks
+    # Extract chunks, writing each to the JSONL (and its raw LLM responses to
+    # the responses output) as soon as it is produced; only the chunks' text
+    # is kept in memory, and only when coverage is validated. The chunk file
+    # appears under its final name only once extraction (and coverage) passed.
     console.print(f"[cyan]Extracting chunks from {input_path.name} using V2...[/cyan]")
+    output_file = output_dir / f"{input_path.stem}_chunks_v2.jsonl"
+    partial_file = output_file.with_name(output_file.name + ".partial")
+    responses_writer = _LLMResponseWriter(
+        output_dir / f"{input_path.stem}_llm_responses_v2", responses_format
+    )
     try:
-        result = extractor.extract_chunks(document, structure)
-        chunks = result["chunks"]
-        tokens_consumed = result["tokens_consumed"]
-
-        console.print(f"[green]✓[/green] Extracted {len(chunks)} chunks (V2)")
-        console.print(f"[cyan]Tokens consumed:[/cyan] {tokens_consumed:,}")
-
-        # Validate coverage if requested
-        if validate:
-            console.print("[cyan]Validating text coverage...[/cyan]")
-            coverage_ratio, missing_segments = TextAligner.verify_coverage(
-                original_text=document.content,
-                chunks=chunks,
-                min_coverage=min_coverage
+        totals: Dict[str, Any] = {}
+        chunk_texts = []
+        try:
+            with partial_file.open("wb") as f:
+                for chunk in extractor.iter_chunks(
+                    document, structure, totals, on_responses=responses_writer.write
+                ):
+                    f.write(chunk.model_dump_json().encode() + b"\n")
+                    if validate:
+                        chunk_texts.append(chunk.original_text)
+            chunk_count = totals["total_chunks"]
+            tokens_consumed = totals["tokens_consumed"]
+
+            console.print(f"[green]✓[/green] Extracted {chunk_count} chunks (V2)")
+            console.print(f"[cyan]Tokens consumed:[/cyan] {tokens_consumed:,}")
+            console.print(
+                f"[cyan]LLM response cache:[/cyan] {totals['cache_hits']} hits, "
+                f"{totals['cache_misses']} misses"
             )
-            console.print(f"[green]✓[/green] Coverage: {coverage_ratio:.2%}")
-
-            if coverage_ratio < min_coverage:
-                console.print(f"[red]Error:[/red] Coverage {coverage_ratio:.2%} below minimum {min_coverage:.2%}")
-                console.print(f"[yellow]Missing segments:[/yellow] {len(missing_segments)}")
-                for segment in missing_segments[:5]:  # Show first 5
-                    console.print(f"  - {segment[:100]}...")
-                raise typer.Exit(3)
-
-        # Write chunks as JSONL
-        output_file = output_dir / f"{input_path.stem}_chunks_v2.jsonl"
-        with output_file.open("w") as f:
-            for chunk in chunks:
-                f.write(json.dumps(chunk.dict(), default=str) + "\n")
-
-        # Save raw LLM responses if available
-        llm_responses = result.get("llm_responses", {})
-        if llm_responses:
-            llm_responses_dir = output_dir / f"{input_path.stem}_llm_responses_v2"
-            llm_responses_dir.mkdir(exist_ok=True)
 
-            for section_title, responses in llm_responses.items():
-                # Sanitize section title for filename
-                safe_title = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in section_title)
-                safe_title = safe_title.replace(' ', '_')[:100]  # Limit length
-
-                # Save extraction response
-                if responses["extraction"]["response"]:
-                    extraction_file = llm_responses_dir / f"{safe_title}_extraction.txt"
-                    extraction_file.write_text(responses["extraction"]["response"], encoding="utf-8")
+            # Validate coverage if requested
+            if validate:
+                console.print("[cyan]Validating text coverage...[/cyan]")
+                coverage_ratio, missing_segments = TextAligner.verify_text_coverage(
+                    original_text=document.content,
+                    texts=chunk_texts,
+                    min_coverage=min_coverage
+                )
+                console.print(f"[green]✓[/green] Coverage: {coverage_ratio:.2%}")
 
-                # Save metadata response
-                if responses["metadata"]["response"]:
-                    metadata_file = llm_responses_dir / f"{safe_title}_metadata.txt"
-                    metadata_file.write_text(responses["metadata"]["response"], encoding="utf-8")
+                if coverage_ratio < min_coverage:
+                    console.print(f"[red]Error:[/red] Coverage {coverage_ratio:.2%} below minimum {min_coverage:.2%}")
+                    console.print(f"[yellow]Missing segments:[/yellow] {len(missing_segments)}")
+                    for segment in missing_segments[:5]:  # Show first 5
+                        console.print(f"  - {segment[:100]}...")
+                    raise typer.Exit(3)
 
-                # Save prefix response
-                if responses["prefix"]["response"]:
-                    prefix_file = llm_responses_dir / f"{safe_title}_prefix.txt"
-                    prefix_file.write_text(responses["prefix"]["response"], encoding="utf-8")
+            os.replace(partial_file, output_file)
+        finally:
+            responses_writer.close()
+            partial_file.unlink(missing_ok=True)
 
-            logger.info(f"Saved V2 LLM responses to: {llm_responses_dir}")
+        if responses_writer.records_written:
+            logger.info(f"Saved V2 LLM responses to: {responses_writer.path}")
 
         console.print("\n[bold green]V2 Extraction complete![/bold green]")
-        console.print(f"Chunks: {len(chunks)}")
+        console.print(f"Chunks: {chunk_count}")
         console.print(f"Output file: {output_file}")
-        if llm_responses:
-            console.print(f"LLM responses saved to: {llm_responses_dir.name}/")
+        if responses_writer.records_written:
+            console.print(f"LLM responses saved to: {responses_writer.path.name}")
 
         logger.info(
-            f"Extracted (V2) {len(chunks)} chunks from {input_path.name}, "
-            f"tokens: {tokens_consumed}, coverage: {coverage_ratio:.2%}"
+            "Extracted (V2) %d chunks from %s, tokens: %s, coverage: %.2f%%",
+            chunk_count, input_path.name, tokens_consumed, coverage_ratio * 100
         )
 
         raise typer.Exit(0)
@@ -1166,6 +1706,19 @@ def extract_v2(
 # ============================================================================
 
 
+def _issue_text(issue: Any) -> str:
+    """
+    Message for a validate warning/error.
+
+    Per-chunk and per-section issues are kept as (template, *args) tuples and
+    only formatted when displayed, since at most 10 of each are shown.
+    """
+    if isinstance(issue, str):
+        return issue
+    template, *args = issue
+    return template.format(*args)
+
+
 @app.command()
 def validate(
     input_path: Annotated[
@@ -1222,17 +1775,14 @@ def validate(
             structure_data = json.loads(input_path.read_text())
             sections = structure_data["structure"]["sections"]
 
-            # Check hierarchy
-            section_titles = {s["title"] for s in sections}
+            # Check hierarchy and summaries in one pass
+            section_titles = frozenset(s["title"] for s in sections)
             for section in sections:
                 parent = section.get("parent_section")
                 if parent and parent != "ROOT" and parent not in section_titles:
-                    errors.append(f"Section '{section['title']}' references non-existent parent '{parent}'")
-
-            # Check summaries
-            for section in sections:
+                    errors.append(("Section '{}' references non-existent parent '{}'", section["title"], parent))
                 if len(section.get("summary", "")) < 10:
-                    warnings.append(f"Section '{section['title']}' has short summary")
+                    warnings.append(("Section '{}' has short summary", section["title"]))
 
             console.print(f"[green]✓[/green] Structure has {len(sections)} sections")
 
@@ -1242,40 +1792,60 @@ def validate(
     elif type == "chunks":
         # Validate chunks
         try:
-            chunks = []
-            with input_path.open("r") as f:
-                for line in f:
-                    chunks.append(json.loads(line))
-
-            # Check metadata completeness
-            for i, chunk in enumerate(chunks):
-                metadata = chunk.get("metadata", {})
-                if not metadata.get("chapter_title"):
-                    errors.append(f"Chunk {i+1} missing chapter_title")
-                if not metadata.get("section_title"):
-                    errors.append(f"Chunk {i+1} missing section_title")
-                if not metadata.get("summary"):
-                    warnings.append(f"Chunk {i+1} missing summary")
-
-                # Check token count
-                token_count = chunk.get("token_count", 0)
-                if token_count > 1000:
-                    errors.append(f"Chunk {i+1} exceeds token limit: {token_count}")
-
-            console.print(f"[green]✓[/green] Found {len(chunks)} chunks")
+            # Stream, parse and check each line in one pass; only the chunks'
+            # original text is kept, and only when coverage needs it, so memory
+            # stays flat otherwise. A bad line is recorded and skipped so every
+            # line is still checked.
+            chunk_texts = []
+            chunk_count = 0
+            with input_path.open("rb") as f:
+                lines = (line for line in f if line.strip())
+                for chunk_count, line in enumerate(lines, 1):
+                    try:
+                        chunk = json.loads(line)
+                    except ValueError as e:
+                        errors.append(("Chunk {} is not valid JSON: {}", chunk_count, e))
+                        continue
+                    if not isinstance(chunk, dict):
+                        errors.append(("Chunk {} is not a JSON object", chunk_count))
+                        continue
+
+                    # Check metadata completeness
+                    metadata = chunk.get("metadata") or {}
+                    if not metadata.get("chapter_title"):
+                        errors.append(("Chunk {} missing chapter_title", chunk_count))
+                    if not metadata.get("section_title"):
+                        errors.append(("Chunk {} missing section_title", chunk_count))
+                    if not metadata.get("summary"):
+                        warnings.append(("Chunk {} missing summary", chunk_count))
+
+                    # Check token count
+                    token_count = chunk.get("token_count", 0)
+                    if token_count > 1000:
+                        errors.append(("Chunk {} exceeds token limit: {}", chunk_count, token_count))
+
+                    if document_path:
+                        try:
+                            chunk_texts.append(Chunk.model_validate(chunk).original_text)
+                        except ValidationError as e:
+                            first_error = e.errors()[0]
+                            errors.append((
+                                "Chunk {} is not a valid chunk: {} ({})", chunk_count,
+                                ".".join(map(str, first_error["loc"])), first_error["msg"]
+                            ))
+
+            console.print(f"[green]✓[/green] Found {chunk_count} chunks")
 
             # Validate coverage if document provided
             if document_path:
                 console.print("[cyan]Validating text coverage...[/cyan]")
-                from .models import Document, Chunk
                 from .text_aligner import TextAligner
 
                 document = Document.from_file(document_path)
-                chunk_objects = [Chunk(**c) for c in chunks]
 
-                coverage_ratio, missing_segments = TextAligner.verify_coverage(
+                coverage_ratio, missing_segments = TextAligner.verify_text_coverage(
                     original_text=document.content,
-                    chunks=chunk_objects,
+                    texts=chunk_texts,
                     min_coverage=0.99
                 )
 
@@ -1288,19 +1858,19 @@ def validate(
         except Exception as e:
             errors.append(f"Failed to load chunks: {e}")
 
-    # Display results
+    # Display results (only the shown issues are formatted)
     console.print()
     if warnings:
         console.print(f"[yellow]Warnings:[/yellow] {len(warnings)}")
         for warning in warnings[:10]:
-            console.print(f"  - {warning}")
+            console.print(f"  - {_issue_text(warning)}")
         if len(warnings) > 10:
             console.print(f"  ... and {len(warnings)-10} more")
 
     if errors:
         console.print(f"[red]Errors:[/red] {len(errors)}")
         for error in errors[:10]:
-            console.print(f"  - {error}")
+            console.print(f"  - {_issue_text(error)}")
         if len(errors) > 10:
             console.print(f"  ... and {len(errors)-10} more")
 
@@ -1339,14 +1909,15 @@ def cache(
             "--clear",
             help="Clear all cached data"
         )
-    ] = False
+    ] = False,
+    cache_backend: CacheBackendOption = "disk"
 ) -> None:
     """
     Manage cache operations for structure analysis.
 
     Use --stats to view cache statistics or --clear to remove all cached data.
     """
-    cache_store = FileCacheStore()
+    cache_store = _make_cache_store(cache_backend)
 
     if not stats and not clear:
         console.print("[yellow]Please specify either --stats or --clear[/yellow]")
@@ -1358,6 +1929,8 @@ def cache(
         stats_data = cache_store.get_stats()
 
         console.print("\n[bold cyan]Cache Statistics[/bold cyan]")
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
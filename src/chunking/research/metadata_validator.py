@@ -4,11 +4,18 @@ Metadata validation utilities for chunking system.
 This module validates chunk metadata for completeness and correctness.
 """
 
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 from .models import Chunk, ChunkMetadata, MetadataValidationError
 
 
+# Placeholder values rejected in metadata fields (built once at import)
+PLACEHOLDERS = frozenset({'todo', 'n/a', 'none', 'tbd', '...', 'summary', 'tba'})
+
+# Longer values cannot be placeholders, so they skip the lower() copy
+PLACEHOLDER_MAX_LENGTH = max(map(len, PLACEHOLDERS))
+
+
 class MetadataValidator:
     """Validator for chunk metadata completeness"""
 
@@ -32,26 +39,36 @@ class MetadataValidator:
         # Pydantic already validates field presence and basic constraints
         # This method provides additional semantic validation
 
-        # Check for placeholder values
-        placeholders = {'todo', 'n/a', 'none', 'tbd', '...', 'summary', 'tba'}
+        # Each field is stripped once and reused by the checks below
+        chapter_title = metadata.chapter_title.strip()
+        section_title = metadata.section_title.strip()
+        summary = metadata.summary.strip()
+
+        # Check for empty titles (also covers models built with model_construct())
+        if not chapter_title:
+            raise MetadataValidationError("chapter_title cannot be empty")
 
-        if metadata.chapter_title.strip().lower() in placeholders:
+        if not section_title:
+            raise MetadataValidationError("section_title cannot be empty")
+
+        # Check for placeholder values
+        if len(chapter_title) <= PLACEHOLDER_MAX_LENGTH and chapter_title.lower() in PLACEHOLDERS:
             raise MetadataValidationError(
                 f"chapter_title contains placeholder value: {metadata.chapter_title}"
             )
 
-        if metadata.section_title.strip().lower() in placeholders:
+        if len(section_title) <= PLACEHOLDER_MAX_LENGTH and section_title.lower() in PLACEHOLDERS:
             raise MetadataValidationError(
                 f"section_title contains placeholder value: {metadata.section_title}"
             )
 
-        if metadata.summary.strip().lower() in placeholders:
+        if len(summary) <= PLACEHOLDER_MAX_LENGTH and summary.lower() in PLACEHOLDERS:
             raise MetadataValidationError(
                 f"summary contains placeholder value: {metadata.summary}"
             )
 
         # Check summary length (10-500 chars)
-        summary_length = len(metadata.summary.strip())
+        summary_length = len(summary)
         if summary_length < 10:
             raise MetadataValidationError(
                 f"summary too short ({summary_length} chars, minimum 10)"
@@ -77,6 +94,11 @@ class MetadataValidator:
         MetadataValidator.validate_metadata(chunk.metadata)
 
         # Additional chunk-level validations
+        if not chunk.chunk_text.strip() or not chunk.original_text.strip():
+            raise MetadataValidationError(
+                f"chunk {chunk.chunk_id} has empty text"
+            )
+
         if chunk.token_count <= 0:
             raise MetadataValidationError(
                 f"chunk {chunk.chunk_id} has invalid token_count: {chunk.token_count}"
@@ -84,10 +106,33 @@ class MetadataValidator:
 
         # Note: No upper limit on token_count - allow any value for analysis
 
+    @staticmethod
+    def iter_invalid_chunks(
+        chunks: Iterable[Chunk]
+    ) -> Iterator[Tuple[int, MetadataValidationError]]:
+        """
+        Lazily validate chunks, yielding each failure instead of raising.
+
+        Validation stops as soon as the caller stops iterating, so asking for
+        the first few errors (e.g. with itertools.islice) skips the rest of
+        the list.
+
+        Args:
+            chunks: Chunks to validate
+
+        Yields:
+            (index, error) for every invalid chunk, in order
+        """
+        for index, chunk in enumerate(chunks):
+            try:
+                MetadataValidator.validate_chunk(chunk)
+            except MetadataValidationError as e:
+                yield index, e
+
     @staticmethod
     def validate_chunks(chunks: List[Chunk]) -> None:
         """
-        Validate all chunks in a list.
+        Validate all chunks in a list (stops at the first invalid chunk).
 
         Args:
             chunks: List of chunks to validate
@@ -98,8 +143,9 @@ class MetadataValidator:
         if not chunks:
             raise MetadataValidationError("chunk list is empty")
 
-        for chunk in chunks:
-            MetadataValidator.validate_chunk(chunk)
+        first_invalid = next(MetadataValidator.iter_invalid_chunks(chunks), None)
+        if first_invalid is not None:
+            raise first_invalid[1]
 
     @staticmethod
     def calculate_completeness_score(chunks: List[Chunk]) -> float:
@@ -115,26 +161,34 @@ class MetadataValidator:
         if not chunks:
             return 0.0
 
-        total_fields = 0
+        # Required fields (always counted): chapter_title, section_title, summary
+        total_fields = 3 * len(chunks)
         complete_fields = 0
 
+        # Each metadata attribute is read once; for a non-empty string,
+        # not isspace() is the same test as strip() being non-empty, without
+        # building the stripped copy
         for chunk in chunks:
-            # Required fields (always counted)
-            total_fields += 3  # chapter_title, section_title, summary
+            metadata = chunk.metadata
+            chapter_title = metadata.chapter_title
+            section_title = metadata.section_title
+            summary = metadata.summary
+            subsection_title = metadata.subsection_title
 
-            if chunk.metadata.chapter_title and chunk.metadata.chapter_title.strip():
+            if chapter_title and not chapter_title.isspace():
                 complete_fields += 1
 
-            if chunk.metadata.section_title and chunk.metadata.section_title.strip():
+            if section_title and not section_title.isspace():
                 complete_fields += 1
 
-            if chunk.metadata.summary and len(chunk.metadata.summary.strip()) >= 10:
+            # Short summaries cannot reach 10 characters once stripped
+            if summary and len(summary) >= 10 and len(summary.strip()) >= 10:
                 complete_fields += 1
 
             # Optional field (subsection_title) - only count if present
-            if chunk.metadata.subsection_title:
+            if subsection_title:
                 total_fields += 1
-                if chunk.metadata.subsection_title.strip():
+                if not subsection_title.isspace():
                     complete_fields += 1
 
-        return complete_fields / total_fields if total_fields > 0 else 0.0
+        return complete_fields / total_fields
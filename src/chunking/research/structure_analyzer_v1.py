@@ -5,12 +5,20 @@ This module analyzes document hierarchy using LLM to identify chapters,
 sections, and subsections with character-level boundaries.
 """
 
+import codecs
 import hashlib
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 from .cache_store import CacheStore
 from .llm_provider import LLMProvider
 from .models import Document, Structure, Section, StructureAnalysisError
+from .response_format import PREAMBLE_CHECK_LENGTH, HEADER_MIN_LENGTH
+
+
+# Characters encoded per step when hashing document content; bounds the
+# transient UTF-8 copy instead of encoding the whole document at once
+HASH_CHUNK_CHARS = 64 * 1024
 
 
 # ============================================================================
@@ -66,6 +74,22 @@ OUTPUT (TSV format):"""
 # ============================================================================
 
 
+@lru_cache(maxsize=32)
+def _model_hash(model: str) -> str:
+    """Short model digest used in LLM response cache keys (same model, same hash)"""
+    return hashlib.sha256(model.encode()).hexdigest()[:8]
+
+
+def _hash_content(content: str) -> str:
+    """sha256 hex digest of content's UTF-8 bytes, encoded incrementally"""
+    hasher = hashlib.sha256()
+    encoder = codecs.getincrementalencoder("utf-8")()
+    for start in range(0, len(content), HASH_CHUNK_CHARS):
+        hasher.update(encoder.encode(content[start:start + HASH_CHUNK_CHARS]))
+    hasher.update(encoder.encode("", final=True))
+    return hasher.hexdigest()
+
+
 class StructureAnalyzer:
     """Phase 1: Analyze document structure using LLM"""
 
@@ -91,21 +115,27 @@ class StructureAnalyzer:
         self.max_chunk_tokens = max_chunk_tokens
 
     @staticmethod
-    def generate_cache_key(content: str, prefix: str = "structure") -> str:
+    def generate_cache_key(
+        content: str, prefix: str = "structure", content_hash: Optional[str] = None
+    ) -> str:
         """
         Generate cache key from content hash.
 
         Args:
             content: Content to hash
             prefix: Cache key prefix (default: "structure")
+            content_hash: sha256 hex digest of content, if already computed
 
         Returns:
             Cache key string (e.g., "structure_abc123...")
         """
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        if content_hash is None:
+            content_hash = _hash_content(content)
         return f"{prefix}_{content_hash}"
 
-    def generate_llm_response_key(self, content: str, model: str, operation: str) -> str:
+    def generate_llm_response_key(
+        self, content: str, model: str, operation: str, content_hash: Optional[str] = None
+    ) -> str:
         """
         Generate cache key for raw LLM response.
 
@@ -113,13 +143,14 @@ class StructureAnalyzer:
             content: Document content
             model: Model identifier
             operation: Operation type (e.g., "structure_analysis")
+            content_hash: sha256 hex digest of content, if already computed
 
         Returns:
             Cache key for LLM response
         """
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        model_hash = hashlib.sha256(model.encode()).hexdigest()[:8]
-        return f"llm_{operation}_{content_hash}_{model_hash}"
+        if content_hash is None:
+            content_hash = _hash_content(content)
+        return f"llm_{operation}_{content_hash}_{_model_hash(model)}"
 
     def analyze(self, document: Document, redo: bool = False) -> Dict[str, Any]:
         """
@@ -140,8 +171,14 @@ class StructureAnalyzer:
         Raises:
             StructureAnalysisError: If LLM fails or returns invalid structure
         """
-        # Generate cache key from document content
-        cache_key = self.generate_cache_key(document.content, prefix="structure")
+        # Hash the document once; both cache keys are built from this digest
+        content_hash = _hash_content(document.content)
+        cache_key = self.generate_cache_key(
+            document.content, prefix="structure", content_hash=content_hash
+        )
+        llm_cache_key = self.generate_llm_response_key(
+            document.content, self.model, "structure_analysis", content_hash=content_hash
+        )
 
         # Check cache first (unless redo flag is set)
         cached_result = None if redo else self.cache_store.get(cache_key)
@@ -158,11 +195,12 @@ class StructureAnalyzer:
                     analysis_model=cached_result["analysis_model"]
                 )
 
-                # Try to get cached LLM response
-                llm_cache_key = self.generate_llm_response_key(
-                    document.content, self.model, "structure_analysis"
-                )
-                cached_llm_response = self.cache_store.get_llm_response(llm_cache_key)
+                # Entries written alongside the structure skip a second lookup;
+                # older entries fall back to the separate LLM response cache
+                if "llm_response" in cached_result:
+                    cached_llm_response = cached_result["llm_response"]
+                else:
+                    cached_llm_response = self.cache_store.get_llm_response(llm_cache_key)
 
                 # Return cached result with zero tokens consumed
                 return {
@@ -176,11 +214,6 @@ class StructureAnalyzer:
                 # Cache data corrupted, proceed with fresh analysis
                 pass
 
-        # Generate LLM response cache key
-        llm_cache_key = self.generate_llm_response_key(
-            document.content, self.model, "structure_analysis"
-        )
-
         # Check for cached LLM response (unless redo flag is set)
         content = None
         tokens_consumed = 0
@@ -250,7 +283,7 @@ class StructureAnalyzer:
         )
 
         # Cache result using content-based cache key
-        self._cache_structure(cache_key, structure)
+        self._cache_structure(cache_key, structure, content)
 
         # Return result with token consumption and raw LLM response
         return {
@@ -271,18 +304,19 @@ class StructureAnalyzer:
         Raises:
             StructureAnalysisError: If response format is invalid
         """
-        if not response or not response.strip():
+        stripped = response.strip() if response else ""
+        if not stripped:
             raise StructureAnalysisError("LLM returned empty response")
 
         # Check for common LLM mistakes
-        if response.strip().startswith("```"):
+        if stripped.startswith("```"):
             raise StructureAnalysisError(
                 "LLM returned markdown code block. "
                 "Expected plain TSV output without formatting."
             )
 
-        if response.strip().lower().startswith("here is") or \
-           response.strip().lower().startswith("here are"):
+        # Only the start can hold a preamble, so only that is lowercased
+        if stripped[:PREAMBLE_CHECK_LENGTH].lower().startswith(("here is", "here are")):
             raise StructureAnalysisError(
                 "LLM added preamble. Expected direct TSV output only."
             )
@@ -301,7 +335,7 @@ class StructureAnalyzer:
             StructureAnalysisError: If parsing fails
         """
         sections = []
-        lines = response_text.strip().split('\n')
+        lines = response_text.split('\n')
 
         # Clean up common LLM formatting issues
         cleaned_lines = []
@@ -316,12 +350,14 @@ class StructureAnalyzer:
             if line.startswith('```'):
                 continue
 
-            # Skip TSV header lines (case-insensitive check for header keywords)
-            line_lower = line.lower()
-            if ('title' in line_lower and 'level' in line_lower and
-                'parent' in line_lower and 'summary' in line_lower):
-                # This looks like a header line, skip it
-                continue
+            # Skip TSV header lines (case-insensitive check for header keywords;
+            # lines too short to hold all four are not lowercased)
+            if len(line) >= HEADER_MIN_LENGTH:
+                line_lower = line.lower()
+                if ('title' in line_lower and 'level' in line_lower and
+                    'parent' in line_lower and 'summary' in line_lower):
+                    # This looks like a header line, skip it
+                    continue
 
             cleaned_lines.append(line)
 
@@ -376,13 +412,19 @@ class StructureAnalyzer:
 
         return "Unknown Chapter"
 
-    def _cache_structure(self, cache_key: str, structure: Structure) -> None:
+    def _cache_structure(
+        self,
+        cache_key: str,
+        structure: Structure,
+        llm_response: Optional[str] = None
+    ) -> None:
         """
         Cache structure analysis result.
 
         Args:
             cache_key: Cache key (generated from content hash)
             structure: Structure to cache
+            llm_response: Raw LLM response, stored so cache hits need one lookup
         """
         cache_data = {
             "document_id": structure.document_id,
@@ -400,6 +442,8 @@ class StructureAnalyzer:
             "metadata": structure.metadata,
             "analysis_model": structure.analysis_model
         }
+        if llm_response is not None:
+            cache_data["llm_response"] = llm_response
 
         try:
             self.cache_store.set(cache_key, cache_data)
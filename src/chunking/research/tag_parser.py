@@ -16,14 +16,34 @@ Format Example:
     [SUMMARY]Brief summary...[/SUMMARY]
 
 Parsing Strategy:
-    - Uses regex with self-closing tags: [TAG]content[/TAG]
-    - Handles multi-line content with re.DOTALL flag
+    - Finds all [TAG] / [/TAG] markers in one regex pass and pairs them up:
+      [TAG]content[/TAG]
+    - Handles multi-line content (content is sliced between markers)
     - Validates all expected tags are present
     - Provides clear error messages for malformed output
 """
 
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Pattern, Tuple
+
+
+# Any opening or closing tag, in document order (group 1 is "/" for closing tags)
+_ANY_TAG_RE = re.compile(r'\[(/?)(\w+)\]')
+
+
+@lru_cache(maxsize=64)
+def _tag_pattern(tag_name: str) -> Pattern[str]:
+    """Compiled [tag_name](content)[/tag_name] pattern (tag name matched literally)"""
+    tag = re.escape(tag_name)
+    return re.compile(rf'\[{tag}\](.*?)\[/{tag}\]', re.DOTALL)
+
+
+@lru_cache(maxsize=16)
+def _family_pattern(families: Tuple[str, ...]) -> Pattern[str]:
+    """Compiled [FAMILY_n](content)[/FAMILY_n] pattern for a set of tag families"""
+    family_pattern = "|".join(re.escape(family) for family in families)
+    return re.compile(rf'\[({family_pattern})_(\d+)\](.*?)\[/\1_\2\]', re.DOTALL)
 
 
 class TagParsingError(Exception):
@@ -31,10 +51,105 @@ class TagParsingError(Exception):
     pass
 
 
+def _scan_tags(text: str) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
+    """
+    Find tag pairs, opening tags and closing tags in one regex pass.
+
+    Pairs are the ones re.findall(r'\\[(\\w+)\\](.*?)\\[/\\1\\]', text, re.DOTALL)
+    would return: each opening tag takes the first matching closing tag after
+    it, and scanning resumes after that closing tag. Walking the tag list is
+    much cheaper than that lazy pattern on long chunk texts, which tries the
+    closing-tag match at every character.
+
+    Returns:
+        ((tag, content) pairs, opening tag names, closing tag names)
+    """
+    tokens = [
+        (match.group(1) == "/", match.group(2), match.start(), match.end())
+        for match in _ANY_TAG_RE.finditer(text)
+    ]
+    opening_tags = [name for is_closing, name, _, _ in tokens if not is_closing]
+    closing_tags = [name for is_closing, name, _, _ in tokens if is_closing]
+
+    pairs = []
+    i = 0
+    while i < len(tokens):
+        is_closing, name, _, content_start = tokens[i]
+        i += 1
+        if is_closing:
+            continue
+        for j in range(i, len(tokens)):
+            if tokens[j][0] and tokens[j][1] == name:
+                pairs.append((name, text[content_start:tokens[j][2]]))
+                i = j + 1
+                break
+    return pairs, opening_tags, closing_tags
+
+
+def _check_tag_format(
+    text: str,
+    opening_tags: List[str],
+    closing_tags: List[str],
+    expected_tags: List[str],
+    strict: bool
+) -> None:
+    """Checks behind validate_tagged_format, on already-scanned tag lists"""
+    if not text or not text.strip():
+        raise TagParsingError("Cannot validate empty text")
+
+    # Check for common LLM mistakes
+    if text.strip().startswith("```"):
+        raise TagParsingError(
+            "LLM returned markdown code block. "
+            "Expected tagged output without code block formatting."
+        )
+
+    if text.strip().lower().startswith(("here is", "here are", "output:")):
+        raise TagParsingError(
+            "LLM added preamble. Expected direct tagged output only."
+        )
+
+    # Check for mismatched tags
+    for i, (open_tag, close_tag) in enumerate(zip(opening_tags, closing_tags)):
+        if open_tag != close_tag:
+            raise TagParsingError(
+                f"Mismatched tag pair at position {i}: "
+                f"[{open_tag}] closed with [/{close_tag}]"
+            )
+
+    # Check for unclosed tags
+    if len(opening_tags) != len(closing_tags):
+        raise TagParsingError(
+            f"Unclosed tags detected. "
+            f"Opening tags: {len(opening_tags)}, "
+            f"Closing tags: {len(closing_tags)}"
+        )
+
+    # Validate all expected tags are present
+    found_tags = set(opening_tags)
+    missing_tags = set(expected_tags) - found_tags
+
+    if missing_tags:
+        raise TagParsingError(
+            f"Missing expected tags: {sorted(missing_tags)}. "
+            f"Found: {sorted(found_tags)}"
+        )
+
+    # Strict mode: check for extra tags
+    if strict:
+        extra_tags = found_tags - set(expected_tags)
+        if extra_tags:
+            raise TagParsingError(
+                f"Unexpected tags found: {sorted(extra_tags)}. "
+                f"Expected only: {sorted(expected_tags)}"
+            )
+
+
 def parse_tagged_output(
     text: str,
     expected_tags: List[str],
-    required_tags: List[str] | None = None
+    required_tags: List[str] | None = None,
+    validate: bool = False
 ) -> Dict[str, str]:
     """
     Parse XML-style tagged output into dictionary.
@@ -43,6 +158,8 @@ def parse_tagged_output(
         text: Raw LLM output with XML-style tags
         expected_tags: List of tag names to extract
         required_tags: Optional list of tags that must be present (defaults to all)
+        validate: If True, also run validate_tagged_format's checks, from the
+            same single scan of text (instead of validating, then parsing)
 
     Returns:
         Dictionary mapping tag names to their content (whitespace stripped)
@@ -66,10 +183,10 @@ def parse_tagged_output(
     if not text or not text.strip():
         raise TagParsingError("Cannot parse empty text")
 
-    # Parse all tags using regex with backreference
     # Pattern: [TAG]content[/TAG] where closing tag must match opening tag
-    pattern = r'\[(\w+)\](.*?)\[/\1\]'
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches, opening_tags, closing_tags = _scan_tags(text)
+    if validate:
+        _check_tag_format(text, opening_tags, closing_tags, expected_tags, strict=False)
 
     # Build result dictionary
     result = {}
@@ -122,62 +239,37 @@ def validate_tagged_format(
         >>> validate_tagged_format(text, ["NAME"])  # Passes
         >>> validate_tagged_format(text, ["NAME", "AGE"])  # Raises error (missing AGE)
     """
-    if not text or not text.strip():
-        raise TagParsingError("Cannot validate empty text")
+    _, opening_tags, closing_tags = _scan_tags(text)
+    _check_tag_format(text, opening_tags, closing_tags, expected_tags, strict)
 
-    # Check for common LLM mistakes
-    if text.strip().startswith("```"):
-        raise TagParsingError(
-            "LLM returned markdown code block. "
-            "Expected tagged output without code block formatting."
-        )
 
-    if text.strip().lower().startswith(("here is", "here are", "output:")):
-        raise TagParsingError(
-            "LLM added preamble. Expected direct tagged output only."
-        )
-
-    # Find all opening and closing tags
-    opening_pattern = r'\[(\w+)\]'
-    closing_pattern = r'\[/(\w+)\]'
-
-    opening_tags = re.findall(opening_pattern, text)
-    closing_tags = re.findall(closing_pattern, text)
-
-    # Check for mismatched tags
-    for i, (open_tag, close_tag) in enumerate(zip(opening_tags, closing_tags)):
-        if open_tag != close_tag:
-            raise TagParsingError(
-                f"Mismatched tag pair at position {i}: "
-                f"[{open_tag}] closed with [/{close_tag}]"
-            )
+def parse_tag_families(
+    text: str,
+    families: List[str]
+) -> Dict[int, Dict[str, str]]:
+    """
+    Parse numbered tag families such as [CHUNK_TEXT_1]...[/CHUNK_TEXT_1].
 
-    # Check for unclosed tags
-    if len(opening_tags) != len(closing_tags):
-        raise TagParsingError(
-            f"Unclosed tags detected. "
-            f"Opening tags: {len(opening_tags)}, "
-            f"Closing tags: {len(closing_tags)}"
-        )
+    Used for batched output where one response carries the same set of tags
+    for several items. No completeness check is made; callers decide what
+    to do with items that are missing a tag.
 
-    # Validate all expected tags are present
-    found_tags = set(opening_tags)
-    missing_tags = set(expected_tags) - found_tags
+    Args:
+        text: Raw LLM output with numbered XML-style tags
+        families: Tag name prefixes (the part before _<number>)
 
-    if missing_tags:
-        raise TagParsingError(
-            f"Missing expected tags: {sorted(missing_tags)}. "
-            f"Found: {sorted(found_tags)}"
-        )
+    Returns:
+        Mapping of item number -> {family: content (whitespace stripped)}
 
-    # Strict mode: check for extra tags
-    if strict:
-        extra_tags = found_tags - set(expected_tags)
-        if extra_tags:
-            raise TagParsingError(
-                f"Unexpected tags found: {sorted(extra_tags)}. "
-                f"Expected only: {sorted(expected_tags)}"
-            )
+    Example:
+        >>> text = "[A_1]x[/A_1][B_1]y[/B_1][A_2]z[/A_2]"
+        >>> parse_tag_families(text, ["A", "B"])
+        {1: {'A': 'x', 'B': 'y'}, 2: {'A': 'z'}}
+    """
+    result: Dict[int, Dict[str, str]] = {}
+    for family, number, content in _family_pattern(tuple(families)).findall(text):
+        result.setdefault(int(number), {})[family] = content.strip()
+    return result
 
 
 def extract_tag_content(text: str, tag_name: str) -> str | None:
@@ -198,8 +290,7 @@ def extract_tag_content(text: str, tag_name: str) -> str | None:
         >>> extract_tag_content(text, "MISSING")
         None
     """
-    pattern = rf'\[{tag_name}\](.*?)\[/{tag_name}\]'
-    match = re.search(pattern, text, re.DOTALL)
+    match = _tag_pattern(tag_name).search(text)
     return match.group(1).strip() if match else None
 
 
@@ -221,5 +312,4 @@ def has_tag(text: str, tag_name: str) -> bool:
         >>> has_tag(text, "AGE")
         False
     """
-    pattern = rf'\[{tag_name}\].*?\[/{tag_name}\]'
-    return bool(re.search(pattern, text, re.DOTALL))
+    return _tag_pattern(tag_name).search(text) is not None
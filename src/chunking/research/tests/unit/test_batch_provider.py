@@ -0,0 +1,258 @@
+"""
+Unit tests for the OpenAI Batch API path.
+
+Tests OpenAIBatchProvider against a fake HTTP session, and the pipeline's
+analyze_with_batch_api against a fake batch provider.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.chunking import llm_provider as llm_provider_module
+from src.chunking.chunking_pipeline import ChunkingPipeline
+from src.chunking.llm_provider import MockLLMProvider, OpenAIBatchProvider
+from src.chunking.models import LLMProviderError
+
+
+# ============================================================================
+# Fakes
+# ============================================================================
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, payload=None, text=None):
+        self._payload = payload
+        self.text = text if text is not None else json.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        # Like requests < 2.27, a non-JSON body raises a bare ValueError
+        return json.loads(self.text)
+
+
+class FakeSession:
+    """
+    Fake requests.Session for the Batch API endpoints.
+
+    statuses are returned by successive GET /batches/{id} calls (the last one
+    repeats); output_lines become the batch output file.
+    """
+
+    def __init__(self, statuses, output_lines=(), output_text=None):
+        self.statuses = list(statuses)
+        self.output_text = output_text if output_text is not None else "\n".join(
+            json.dumps(line) for line in output_lines
+        )
+        self.calls = []
+        self.uploaded = None
+
+    def request(self, method, url, timeout=None, **kwargs):
+        path = url.split("/v1", 1)[1]
+        self.calls.append((method, path))
+
+        if method == "post" and path == "/files":
+            self.uploaded = kwargs["files"]["file"][1].read().decode("utf-8")
+            return FakeResponse({"id": "file-in"})
+        if method == "post" and path == "/batches":
+            return FakeResponse({"id": "batch-1"})
+        if method == "get" and path.startswith("/batches/"):
+            status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+            return FakeResponse({"id": "batch-1", "status": status, "output_file_id": "file-out"})
+        if method == "get" and path == "/files/file-out/content":
+            return FakeResponse(text=self.output_text)
+        raise AssertionError(f"Unexpected request: {method} {path}")
+
+    def close(self):
+        pass
+
+
+class FakeClock:
+    """Replaces time.monotonic/time.sleep so polling tests run instantly"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(llm_provider_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(llm_provider_module.time, "sleep", clock.sleep)
+    return clock
+
+
+def create_provider(session: FakeSession, **kwargs) -> OpenAIBatchProvider:
+    provider = OpenAIBatchProvider(api_key="test-key", **kwargs)
+    provider._session = session
+    return provider
+
+
+def completion(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}], "usage": {"total_tokens": 42}}
+
+
+# ============================================================================
+# OpenAIBatchProvider Tests
+# ============================================================================
+
+
+class TestOpenAIBatchProvider:
+    """Test OpenAIBatchProvider with a fake session"""
+
+    def test_run_batch_round_trip(self, tmp_path: Path, fake_clock: FakeClock):
+        """Requests are written with native model ids and results keyed by custom_id"""
+        # Arrange
+        session = FakeSession(
+            statuses=["validating", "in_progress", "completed"],
+            output_lines=[
+                {"custom_id": "doc_a", "response": {"status_code": 200, "body": completion("A")}},
+                {"custom_id": "doc_b", "response": {"status_code": 500}, "error": "boom"},
+            ]
+        )
+        provider = create_provider(session, poll_interval=1.0)
+        requests_by_id = {
+            "doc_a": {"model": "openai/gpt-4o", "messages": [{"role": "user", "content": "a"}]},
+            "doc_b": {"model": "openai/gpt-4o", "messages": [{"role": "user", "content": "b"}]},
+        }
+
+        # Act
+        results = provider.run_batch(requests_by_id, tmp_path / "batch.jsonl")
+
+        # Assert
+        uploaded = [json.loads(line) for line in session.uploaded.splitlines()]
+        assert [line["custom_id"] for line in uploaded] == ["doc_a", "doc_b"]
+        assert uploaded[0]["body"]["model"] == "gpt-4o"
+        assert results == {"doc_a": completion("A")}
+        assert fake_clock.sleeps == [1.0, 2.0]
+
+    def test_write_requests_rejects_other_vendors(self, tmp_path: Path):
+        """Only openai/ models can be sent to the Batch API"""
+        provider = create_provider(FakeSession(statuses=["completed"]))
+
+        with pytest.raises(LLMProviderError):
+            provider.write_requests(
+                {"doc": {"model": "anthropic/claude-haiku-4.5", "messages": []}},
+                tmp_path / "batch.jsonl"
+            )
+
+    def test_wait_for_batch_raises_on_failed_status(self, fake_clock: FakeClock):
+        """A terminal status other than completed raises"""
+        provider = create_provider(FakeSession(statuses=["failed"]))
+
+        with pytest.raises(LLMProviderError, match="failed"):
+            provider.wait_for_batch("batch-1")
+
+    def test_wait_for_batch_gives_up_after_max_wait(self, fake_clock: FakeClock):
+        """A missing or unknown status stops polling at the deadline"""
+        # Arrange
+        provider = create_provider(
+            FakeSession(statuses=[None]), poll_interval=10.0, max_poll_interval=40.0, max_wait=100.0
+        )
+
+        # Act / Assert
+        with pytest.raises(LLMProviderError, match="after 100s"):
+            provider.wait_for_batch("batch-1")
+        assert sum(fake_clock.sleeps) == pytest.approx(100.0)
+
+    def test_download_results_wraps_invalid_output(self):
+        """A non-JSON output line raises LLMProviderError, not ValueError"""
+        provider = create_provider(FakeSession(statuses=["completed"], output_text="not json"))
+
+        with pytest.raises(LLMProviderError, match="invalid output"):
+            provider.download_results({"id": "batch-1", "output_file_id": "file-out"})
+
+    def test_request_wraps_invalid_json(self):
+        """A non-JSON API body raises LLMProviderError, not ValueError"""
+        session = FakeSession(statuses=["completed"])
+        session.request = lambda method, url, timeout=None, **kwargs: FakeResponse(text="<html>")
+        provider = create_provider(session)
+
+        with pytest.raises(LLMProviderError, match="invalid JSON"):
+            provider.wait_for_batch("batch-1")
+
+
+# ============================================================================
+# Pipeline Batch Path Tests
+# ============================================================================
+
+
+STRUCTURE_TSV = (
+    "Chapter 1\t1\tROOT\tChapter about testing\t[EMPTY]\t[EMPTY]\tfalse\n"
+    "Intro\t2\tChapter 1\tIntroduction to the test\tIntro starts here\tintro ends here\tfalse"
+)
+
+
+class FakeBatchProvider:
+    """Fake batch provider: answers every request, or raises when fail is set"""
+
+    def __init__(self, content: str = STRUCTURE_TSV, fail: bool = False):
+        self.content = content
+        self.fail = fail
+        self.requests_by_id = None
+
+    def run_batch(self, requests_by_id, jsonl_path):
+        self.requests_by_id = requests_by_id
+        if self.fail:
+            raise LLMProviderError("Batch batch-1 ended with status: expired")
+        return {custom_id: completion(self.content) for custom_id in requests_by_id}
+
+
+class TestAnalyzeWithBatchApi:
+    """Test ChunkingPipeline.analyze_with_batch_api with a fake batch provider"""
+
+    @pytest.fixture
+    def document_files(self, tmp_path: Path):
+        files = []
+        for name in ("doc_a.txt", "doc_b.txt"):
+            path = tmp_path / "input" / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("Intro starts here. Some body text. intro ends here.")
+            files.append(path)
+        return files
+
+    def test_structures_parsed_from_batch(self, tmp_path: Path, document_files):
+        """Every pending document is submitted once and parsed from its response"""
+        # Arrange
+        pipeline = ChunkingPipeline(MockLLMProvider(), tmp_path / "output")
+        batch_provider = FakeBatchProvider()
+
+        # Act
+        results = pipeline.analyze_with_batch_api(document_files, batch_provider)
+
+        # Assert
+        assert sorted(batch_provider.requests_by_id) == ["doc_a", "doc_b"]
+        assert sorted(results) == ["doc_a", "doc_b"]
+        assert results["doc_a"]["structure"].chapter_title == "Chapter 1"
+        assert results["doc_a"]["tokens_consumed"] == 42
+
+    def test_batch_failure_falls_back_to_per_document(self, tmp_path: Path, document_files):
+        """A failed batch returns no results, leaving Phase 1 to process_document"""
+        pipeline = ChunkingPipeline(MockLLMProvider(), tmp_path / "output")
+
+        results = pipeline.analyze_with_batch_api(document_files, FakeBatchProvider(fail=True))
+
+        assert results == {}
+
+    def test_unparseable_response_is_skipped(self, tmp_path: Path, document_files):
+        """Documents whose batch response fails to parse are left out"""
+        pipeline = ChunkingPipeline(MockLLMProvider(), tmp_path / "output")
+
+        results = pipeline.analyze_with_batch_api(
+            document_files, FakeBatchProvider(content="Here is the structure: nothing")
+        )
+
+        assert results == {}
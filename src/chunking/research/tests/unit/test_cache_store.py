@@ -0,0 +1,386 @@
+"""
+Unit tests for the research cache stores.
+
+Tests SQLiteCacheStore against a temporary database file, RedisCacheStore
+against an in-memory fake of the redis package, the MemoizedCacheStore memo
+layer, and create_cache_store.
+"""
+
+import fnmatch
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from src.chunking.research.cache_store import (
+    CacheStore,
+    FileCacheStore,
+    MemoizedCacheStore,
+    RedisCacheStore,
+    SQLiteCacheStore,
+    create_cache_store,
+)
+
+
+# ============================================================================
+# SQLiteCacheStore Tests
+# ============================================================================
+
+
+@pytest.fixture
+def sqlite_store(tmp_path: Path):
+    store = SQLiteCacheStore(tmp_path / "cache" / "cache.sqlite3")
+    yield store
+    store.close()
+
+
+class TestSQLiteCacheStore:
+    """Test SQLiteCacheStore"""
+
+    def test_structure_round_trip(self, sqlite_store: SQLiteCacheStore):
+        """Structures are stored as JSON and read back as dicts"""
+        # Arrange
+        value = {"chapter_title": "Chapter 1", "sections": [{"title": "Intro"}]}
+
+        # Act
+        sqlite_store.set("doc_hash", value)
+
+        # Assert
+        assert sqlite_store.get("doc_hash") == value
+        assert sqlite_store.get("missing") is None
+
+    def test_llm_response_round_trip(self, sqlite_store: SQLiteCacheStore):
+        """LLM responses are stored verbatim and overwritten on set"""
+        sqlite_store.set_llm_response("llm_key", "first")
+        sqlite_store.set_llm_response("llm_key", "second ✓")
+
+        assert sqlite_store.get_llm_response("llm_key") == "second ✓"
+        assert sqlite_store.get_llm_response("missing") is None
+
+    def test_structures_and_responses_are_separate(self, sqlite_store: SQLiteCacheStore):
+        """The same key in both tables does not collide"""
+        sqlite_store.set("key", {"kind": "structure"})
+        sqlite_store.set_llm_response("key", "response")
+
+        assert sqlite_store.get("key") == {"kind": "structure"}
+        assert sqlite_store.get_llm_response("key") == "response"
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        """A reopened database sees entries written before close"""
+        # Arrange
+        db_path = tmp_path / "cache.sqlite3"
+        store = SQLiteCacheStore(db_path)
+        store.set_llm_response("llm_key", "cached")
+        store.close()
+
+        # Act
+        reopened = SQLiteCacheStore(db_path)
+
+        # Assert
+        assert reopened.get_llm_response("llm_key") == "cached"
+        reopened.close()
+
+    def test_invalid_structure_json_is_a_miss(self, sqlite_store: SQLiteCacheStore):
+        """A corrupt structure entry reads as None instead of raising"""
+        sqlite_store._set_value("structures", "bad", "{not json")
+
+        assert sqlite_store.get("bad") is None
+
+    def test_unserializable_structure_is_ignored(self, sqlite_store: SQLiteCacheStore):
+        """Values json.dumps cannot handle are skipped, not raised"""
+        sqlite_store.set("key", {("tuple", "key"): 1})
+
+        assert sqlite_store.get("key") is None
+
+    def test_stats_and_clear(self, sqlite_store: SQLiteCacheStore):
+        """get_stats counts entries per table and clear removes them all"""
+        # Arrange
+        sqlite_store.set("doc", {"a": 1})
+        sqlite_store.set_llm_response("r1", "abc")
+        sqlite_store.set_llm_response("r2", "de")
+
+        # Act
+        stats = sqlite_store.get_stats()
+        deleted_count = sqlite_store.clear()
+
+        # Assert
+        assert stats["structure_files"] == 1
+        assert stats["llm_response_files"] == 2
+        assert stats["llm_response_size_bytes"] == 5
+        assert stats["total_size_bytes"] == stats["structure_size_bytes"] + 5
+        assert deleted_count == 3
+        assert sqlite_store.get_stats()["total_size_bytes"] == 0
+
+    def test_shared_across_threads(self, sqlite_store: SQLiteCacheStore):
+        """Worker threads can read and write through one instance"""
+        # Arrange
+        def worker(n: int):
+            for i in range(20):
+                sqlite_store.set_llm_response(f"key_{n}_{i}", f"value_{n}_{i}")
+                assert sqlite_store.get_llm_response(f"key_{n}_{i}") == f"value_{n}_{i}"
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert sqlite_store.get_stats()["llm_response_files"] == 160
+
+
+# ============================================================================
+# RedisCacheStore Tests
+# ============================================================================
+
+
+class FakeRedisError(Exception):
+    """Stand-in for redis.RedisError"""
+
+
+class FakeRedisClient:
+    """In-memory fake of the redis.Redis calls RedisCacheStore makes"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise FakeRedisError("Connection refused")
+
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self._check()
+        self.data[key] = value
+        self.ttls[key] = ex
+
+    def scan_iter(self, match, count=None):
+        self._check()
+        return iter([key for key in self.data if fnmatch.fnmatchcase(key, match)])
+
+    def delete(self, *keys):
+        self._check()
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class FakeRedisPipeline:
+    """Queues strlen calls until execute()"""
+
+    def __init__(self, client: FakeRedisClient):
+        self.client = client
+        self.keys = []
+
+    def strlen(self, key):
+        self.keys.append(key)
+
+    def execute(self):
+        self.client._check()
+        return [len(self.client.data.get(key, "")) for key in self.keys]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedisClient:
+    """Install a fake redis module whose Redis.from_url returns one shared client"""
+    client = FakeRedisClient()
+    module = types.ModuleType("redis")
+    module.RedisError = FakeRedisError
+    module.Redis = types.SimpleNamespace(from_url=lambda url, decode_responses: client)
+    monkeypatch.setitem(sys.modules, "redis", module)
+    return client
+
+
+class TestRedisCacheStore:
+    """Test RedisCacheStore with a fake client"""
+
+    def test_round_trip_with_prefix_and_ttl(self, fake_redis: FakeRedisClient):
+        """Entries are namespaced by kind and written with the TTL"""
+        # Arrange
+        store = RedisCacheStore("redis://cache:6379/0", ttl_seconds=60, key_prefix="test:")
+
+        # Act
+        store.set("doc", {"chapter_title": "Chapter 1"})
+        store.set_llm_response("llm_key", "response")
+
+        # Assert
+        assert store.get("doc") == {"chapter_title": "Chapter 1"}
+        assert store.get_llm_response("llm_key") == "response"
+        assert fake_redis.ttls == {"test:structures:doc": 60, "test:llm_responses:llm_key": 60}
+
+    def test_stats_and_clear_stay_in_prefix(self, fake_redis: FakeRedisClient):
+        """get_stats and clear only see this store's keys"""
+        # Arrange
+        fake_redis.data["other:llm_responses:key"] = "untouched"
+        store = RedisCacheStore(key_prefix="test:")
+        store.set_llm_response("r1", "abc")
+        store.set_llm_response("r2", "de")
+
+        # Act
+        stats = store.get_stats()
+        deleted_count = store.clear()
+
+        # Assert
+        assert stats["llm_response_files"] == 2
+        assert stats["llm_response_size_bytes"] == 5
+        assert deleted_count == 2
+        assert fake_redis.data == {"other:llm_responses:key": "untouched"}
+
+    def test_unreachable_server_degrades_to_misses(self, fake_redis: FakeRedisClient):
+        """Redis errors never escape: reads miss, writes, stats and clear are no-ops"""
+        # Arrange
+        store = RedisCacheStore()
+        store.set_llm_response("llm_key", "response")
+        fake_redis.down = True
+
+        # Act / Assert
+        assert store.get_llm_response("llm_key") is None
+        assert store.get("doc") is None
+        store.set_llm_response("other", "response")
+        assert store.clear() == 0
+        assert store.get_stats()["total_size_bytes"] == 0
+
+    def test_missing_package_raises_import_error(self, monkeypatch):
+        """Without the redis extra the store fails with an install hint"""
+        monkeypatch.setitem(sys.modules, "redis", None)
+
+        with pytest.raises(ImportError, match="redis"):
+            RedisCacheStore()
+
+
+# ============================================================================
+# MemoizedCacheStore Tests
+# ============================================================================
+
+
+class CountingCacheStore(CacheStore):
+    """In-memory store that counts LLM response lookups"""
+
+    def __init__(self):
+        self.responses = {}
+        self.lookups = 0
+        self.cache_dir = "memory"
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def get_llm_response(self, key):
+        self.lookups += 1
+        return self.responses.get(key)
+
+    def set_llm_response(self, key, response):
+        self.responses[key] = response
+
+    def clear(self):
+        deleted_count = len(self.responses)
+        self.responses.clear()
+        return deleted_count
+
+
+class TestMemoizedCacheStore:
+    """Test the in-process memo layer"""
+
+    def test_hits_and_misses_are_memoized(self):
+        """Repeated lookups reach the backend once, whether hit or miss"""
+        # Arrange
+        backend = CountingCacheStore()
+        backend.responses["hit"] = "response"
+        store = MemoizedCacheStore(backend)
+
+        # Act
+        results = [store.get_llm_response(key) for key in ("hit", "miss", "hit", "miss")]
+
+        # Assert
+        assert results == ["response", None, "response", None]
+        assert backend.lookups == 2
+
+    def test_set_replaces_memoized_miss(self):
+        """A write after a miss is returned without another backend lookup"""
+        # Arrange
+        backend = CountingCacheStore()
+        store = MemoizedCacheStore(backend)
+        store.get_llm_response("key")
+
+        # Act
+        store.set_llm_response("key", "response")
+
+        # Assert
+        assert store.get_llm_response("key") == "response"
+        assert backend.responses == {"key": "response"}
+        assert backend.lookups == 1
+
+    def test_oldest_entry_is_evicted(self):
+        """Only memo_size lookups are remembered"""
+        # Arrange
+        backend = CountingCacheStore()
+        store = MemoizedCacheStore(backend, memo_size=2)
+
+        # Act
+        for key in ("a", "b", "c", "a"):
+            store.get_llm_response(key)
+
+        # Assert
+        assert backend.lookups == 4
+
+    def test_clear_drops_memo_and_delegates(self):
+        """clear empties the backend and forgets memoized responses"""
+        # Arrange
+        backend = CountingCacheStore()
+        store = MemoizedCacheStore(backend)
+        store.set_llm_response("key", "response")
+
+        # Act
+        deleted_count = store.clear()
+
+        # Assert
+        assert deleted_count == 1
+        assert store.get_llm_response("key") is None
+        assert store.cache_dir == "memory"
+
+
+# ============================================================================
+# create_cache_store Tests
+# ============================================================================
+
+
+class TestCreateCacheStore:
+    """Test --cache-backend parsing"""
+
+    def test_disk(self, tmp_path: Path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        store = create_cache_store("disk")
+
+        assert isinstance(store, MemoizedCacheStore)
+        assert isinstance(store.store, FileCacheStore)
+        assert store.store.memory_cache_size == 0
+
+    def test_sqlite_with_path(self, tmp_path: Path):
+        store = create_cache_store(f"sqlite:{tmp_path / 'cache.sqlite3'}")
+
+        assert isinstance(store.store, SQLiteCacheStore)
+        assert store.db_path == tmp_path / "cache.sqlite3"
+        store.close()
+
+    def test_redis_url(self, fake_redis: FakeRedisClient):
+        store = create_cache_store("redis://cache:6379/1")
+
+        assert isinstance(store.store, RedisCacheStore)
+        assert store.redis_url == "redis://cache:6379/1"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            create_cache_store("memcached")
@@ -0,0 +1,310 @@
+"""
+Unit tests for the V3 experimental chunk extractors.
+
+Covers V3A batch token accounting, the V3B parsed-response memo, and the
+V3C batched call and its fallback to V3B per-section calls.
+"""
+
+import importlib
+import re
+import sys
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from src.chunking import concurrency, llm_provider, models, templates
+from src.chunking.models import Document, Structure, Section, LLMProviderError
+
+
+V3_MODULE = "src.chunking.research.chunk_extractor_v3_experimental"
+
+
+@pytest.fixture
+def v3_module(monkeypatch):
+    """
+    Import the V3 module with its sibling imports resolved.
+
+    The research modules import .concurrency, .llm_provider, .models and
+    .templates, which live one package up in src.chunking; alias them into
+    src.chunking.research (models also gets the SectionV2 name V3 uses) and
+    drop everything imported through the aliases afterwards.
+    """
+    research_models = types.ModuleType("src.chunking.research.models")
+    research_models.__dict__.update(vars(models))
+    research_models.SectionV2 = models.Section
+    siblings = {
+        "concurrency": concurrency,
+        "llm_provider": llm_provider,
+        "models": research_models,
+        "templates": templates,
+    }
+    for name, module in siblings.items():
+        monkeypatch.setitem(sys.modules, f"src.chunking.research.{name}", module)
+
+    loaded_before = set(sys.modules)
+    yield importlib.import_module(V3_MODULE)
+    for name in set(sys.modules) - loaded_before:
+        del sys.modules[name]
+
+
+# ============================================================================
+# Fakes
+# ============================================================================
+
+
+class FakeBatchLLMProvider:
+    """
+    Fake provider that can fail the V3A / V3C batched calls.
+
+    Batched calls (recognized by their TARGET SECTIONS list) raise
+    LLMProviderError when fail_batch is set, and otherwise return a response
+    with no usable section. V3A's separate extract and prefix calls return
+    plain text; merged calls return a [CHUNK_TEXT] / [CONTEXTUAL_PREFIX]
+    response for the target section. Every response reports 100 tokens.
+    """
+
+    def __init__(self, fail_batch: bool = True):
+        self.fail_batch = fail_batch
+        self.batch_calls = 0
+        self.section_calls = 0
+
+    def chat_completion(self, model, messages, **kwargs):
+        text = _message_text(messages)
+
+        if "TARGET SECTIONS:" in text:
+            self.batch_calls += 1
+            if self.fail_batch:
+                raise LLMProviderError("batch job failed")
+            return _response("")
+
+        self.section_calls += 1
+        if "CHUNK TEXT:" in text:
+            return _response("This chunk is from the test chapter.")
+        if "TARGET SECTION:" in text:
+            title = re.search(r"- Title: (.*)", text).group(1).strip()
+            return _response(f"Body text of {title}.")
+
+        title = re.search(r"Target Section: (.*)", text).group(1).strip()
+        return _response(
+            f"[CHUNK_TEXT]\nBody text of {title}.\n[/CHUNK_TEXT]\n"
+            f"[CONTEXTUAL_PREFIX]This chunk is from {title} of the test chapter.[/CONTEXTUAL_PREFIX]"
+        )
+
+
+def _message_text(messages) -> str:
+    """Concatenate the text of every message part."""
+    parts = []
+    for message in messages:
+        content = message["content"]
+        if isinstance(content, list):
+            parts.extend(part["text"] for part in content)
+        else:
+            parts.append(content)
+    return "".join(parts)
+
+
+def _response(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}], "usage": {"total_tokens": 100}}
+
+
+def create_structure(num_sections: int = 3) -> Structure:
+    return Structure(
+        document_id="test_doc",
+        chapter_title="Test Chapter",
+        sections=[
+            Section(
+                title=f"Section {n}",
+                level=1,
+                parent_section="ROOT",
+                summary=f"Summary of section {n}",
+                start_words=f"Section {n} starts here",
+                end_words=f"Section {n} ends here"
+            )
+            for n in range(1, num_sections + 1)
+        ],
+        analysis_model="test-model",
+        metadata={}
+    )
+
+
+def create_document(num_sections: int = 3) -> Document:
+    return Document(
+        document_id="test_doc",
+        file_path="/tmp/test_doc.txt",
+        file_hash="test_hash_123",
+        content="\n".join(
+            f"Section {n} starts here. Content of section {n}. Section {n} ends here."
+            for n in range(1, num_sections + 1)
+        )
+    )
+
+
+def create_extractor(v3_module, llm_client):
+    token_counter = Mock()
+    token_counter.count_tokens.return_value = 50
+    return v3_module.ChunkExtractorV3C(
+        llm_client=llm_client,
+        token_counter=token_counter,
+        metadata_validator=Mock(),
+        show_progress=False
+    )
+
+
+class RecordingCacheStore:
+    """In-memory LLM response store that counts lookups"""
+
+    def __init__(self):
+        self.responses = {}
+        self.lookups = 0
+
+    def get_llm_response(self, key):
+        self.lookups += 1
+        return self.responses.get(key)
+
+    def set_llm_response(self, key, response):
+        self.responses[key] = response
+
+
+def extract_first_section(extractor, document: Document, structure: Structure) -> dict:
+    section = structure.sections[0]
+    return extractor._extract_and_generate_prefix(
+        document,
+        structure.chapter_title,
+        section.title,
+        section.summary,
+        section.start_words,
+        section.end_words,
+        max_tokens=1000
+    )
+
+
+# ============================================================================
+# V3A Tests
+# ============================================================================
+
+
+class TestV3ABatchTokens:
+    """Test V3A token accounting for batched extraction"""
+
+    @pytest.mark.parametrize("fail_batch", [False, True])
+    def test_unparsed_batch_tokens_are_counted(self, v3_module, fail_batch):
+        """A batch that yields no section still counts toward tokens_consumed"""
+        # Arrange
+        llm_client = FakeBatchLLMProvider(fail_batch=fail_batch)
+        extractor = v3_module.ChunkExtractorV3A(
+            llm_client, Mock(), Mock(), show_progress=False,
+            strategy=v3_module.STRATEGY_SEPARATE, batch_size=2
+        )
+        extractor.token_counter.count_tokens_batch.side_effect = lambda texts, model: [50] * len(texts)
+
+        # Act
+        result = extractor.extract_chunks(create_document(2), create_structure(2))
+
+        # Assert
+        assert llm_client.batch_calls == 1
+        assert llm_client.section_calls == 4
+        assert [chunk.original_text for chunk in result["chunks"]] == [
+            "Body text of Section 1.",
+            "Body text of Section 2.",
+        ]
+        assert result["tokens_consumed"] == (400 if fail_batch else 500)
+
+
+# ============================================================================
+# V3B Tests
+# ============================================================================
+
+
+class TestV3BResponseMemo:
+    """Test V3B's memo of parsed responses"""
+
+    def test_memo_hit_returns_raw_response(self, v3_module):
+        """A memo hit skips the store and returns the same dict as a store hit"""
+        # Arrange
+        llm_client = FakeBatchLLMProvider(fail_batch=False)
+        cache_store = RecordingCacheStore()
+        document, structure = create_document(), create_structure()
+        extract_first_section(
+            v3_module.ChunkExtractorV3B(
+                llm_client, Mock(), Mock(), cache_store=cache_store, show_progress=False
+            ),
+            document, structure
+        )
+        extractor = v3_module.ChunkExtractorV3B(
+            llm_client, Mock(), Mock(), cache_store=cache_store, show_progress=False
+        )
+
+        # Act
+        store_hit = extract_first_section(extractor, document, structure)
+        memo_hit = extract_first_section(extractor, document, structure)
+
+        # Assert
+        assert llm_client.section_calls == 1
+        assert cache_store.lookups == 2
+        assert memo_hit == store_hit
+        assert memo_hit["llm_response"] == next(iter(cache_store.responses.values()))
+        assert memo_hit["extracted_text"] == "Body text of Section 1."
+
+    def test_fresh_response_is_memoized(self, v3_module):
+        """A response just fetched from the LLM is served from the memo next time"""
+        # Arrange
+        llm_client = FakeBatchLLMProvider(fail_batch=False)
+        cache_store = RecordingCacheStore()
+        extractor = v3_module.ChunkExtractorV3B(
+            llm_client, Mock(), Mock(), cache_store=cache_store, show_progress=False
+        )
+        document, structure = create_document(), create_structure()
+
+        # Act
+        extract_first_section(extractor, document, structure)
+        result = extract_first_section(extractor, document, structure)
+
+        # Assert
+        assert llm_client.section_calls == 1
+        assert cache_store.lookups == 1
+        assert result["llm_response_cached"] is True
+        assert result["llm_response"] is not None
+
+
+# ============================================================================
+# V3C Tests
+# ============================================================================
+
+
+class TestV3CBatchFallback:
+    """Test V3C falling back to per-section calls"""
+
+    def test_failed_batch_falls_back_to_per_section_calls(self, v3_module):
+        """A failed batch call must not abort the document"""
+        # Arrange
+        llm_client = FakeBatchLLMProvider(fail_batch=True)
+        extractor = create_extractor(v3_module, llm_client)
+
+        # Act
+        result = extractor.extract_chunks(create_document(), create_structure())
+
+        # Assert
+        assert llm_client.batch_calls == 1
+        assert llm_client.section_calls == 3
+        assert [chunk.original_text for chunk in result["chunks"]] == [
+            "Body text of Section 1.",
+            "Body text of Section 2.",
+            "Body text of Section 3.",
+        ]
+        assert result["tokens_consumed"] == 300
+
+    def test_empty_batch_response_falls_back_to_per_section_calls(self, v3_module):
+        """Sections missing from the batch output are retried one by one"""
+        # Arrange
+        llm_client = FakeBatchLLMProvider(fail_batch=False)
+        extractor = create_extractor(v3_module, llm_client)
+
+        # Act
+        result = extractor.extract_chunks(create_document(2), create_structure(2))
+
+        # Assert
+        assert llm_client.batch_calls == 1
+        assert llm_client.section_calls == 2
+        assert len(result["chunks"]) == 2
+        assert result["tokens_consumed"] == 300
@@ -0,0 +1,56 @@
+"""
+Unit tests for ChunkingPipeline option checks.
+
+Tests that a bad --output-mode is rejected before any LLM call, both by
+ChunkingPipeline itself and by the process command.
+"""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from src.chunking import cli
+from src.chunking.chunking_pipeline import ChunkingPipeline
+from src.chunking.llm_provider import MockLLMProvider
+
+
+# ============================================================================
+# Output Mode Tests
+# ============================================================================
+
+
+class TestOutputMode:
+    """Test output_mode validation"""
+
+    @pytest.mark.parametrize("output_mode", ["per_chunk", "jsonl"])
+    def test_known_modes_accepted(self, tmp_path: Path, output_mode: str):
+        pipeline = ChunkingPipeline(MockLLMProvider(), tmp_path, output_mode=output_mode)
+
+        assert pipeline.output_mode == output_mode
+
+    def test_unknown_mode_rejected_by_pipeline(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="output_mode"):
+            ChunkingPipeline(MockLLMProvider(), tmp_path, output_mode="parquet")
+
+    def test_unknown_mode_exits_before_processing(self, tmp_path: Path, monkeypatch):
+        """The CLI exits with a usage error before any document is processed"""
+        # Arrange
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        input_file = tmp_path / "chapter.txt"
+        input_file.write_text("Some chapter text.")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process_document must not run")
+
+        monkeypatch.setattr(ChunkingPipeline, "process_document", fail)
+
+        # Act
+        result = CliRunner().invoke(cli.app, [
+            "--input", str(input_file), "--output", str(tmp_path / "out"),
+            "--output-mode", "parquet"
+        ])
+
+        # Assert
+        assert result.exit_code == 2
+        assert "output_mode" in result.output
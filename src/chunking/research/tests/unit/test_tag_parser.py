@@ -0,0 +1,55 @@
+"""
+Unit tests for the tagged-output parser.
+
+Tests parse_tagged_output with and without its single-scan validate mode.
+"""
+
+import pytest
+
+from src.chunking.research.tag_parser import (
+    TagParsingError,
+    parse_tagged_output,
+    validate_tagged_format,
+)
+
+
+# ============================================================================
+# parse_tagged_output Tests
+# ============================================================================
+
+
+class TestParseTaggedOutput:
+    """Test parse_tagged_output"""
+
+    def test_parses_multiline_tags(self):
+        """Tag contents are returned stripped, keyed by tag name"""
+        text = "[CHUNK_TEXT]\nLine one\nLine two\n[/CHUNK_TEXT]\n[SUMMARY]Short[/SUMMARY]"
+
+        result = parse_tagged_output(text, ["CHUNK_TEXT", "SUMMARY"], validate=True)
+
+        assert result == {"CHUNK_TEXT": "Line one\nLine two", "SUMMARY": "Short"}
+
+    @pytest.mark.parametrize("text, message", [
+        ("```\n[A]x[/A]\n```", "markdown code block"),
+        ("Here is the output: [A]x[/A]", "preamble"),
+        ("[A]x[/B][B]y[/A]", "Mismatched tag pair"),
+        ("[A]x[/A][B]y", "Unclosed tags"),
+    ])
+    def test_validate_rejects_malformed_output(self, text, message):
+        """validate=True applies validate_tagged_format's checks"""
+        with pytest.raises(TagParsingError, match=message):
+            parse_tagged_output(text, ["A"], validate=True)
+
+        with pytest.raises(TagParsingError, match=message):
+            validate_tagged_format(text, ["A"])
+
+    def test_without_validate_extra_text_is_ignored(self):
+        """Without validate only the expected tags matter"""
+        text = "Here is the output: [A]x[/A][B]y"
+
+        assert parse_tagged_output(text, ["A"]) == {"A": "x"}
+
+    def test_missing_required_tag(self):
+        """A missing required tag raises even without validate"""
+        with pytest.raises(TagParsingError, match="B"):
+            parse_tagged_output("[A]x[/A]", ["A", "B"])
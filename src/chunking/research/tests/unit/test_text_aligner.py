@@ -0,0 +1,89 @@
+"""
+Unit tests for TextAligner coverage scoring.
+
+Tests verify_text_coverage on a long document, where verbatim chunks are
+anchored with str.find and edited chunks are diffed against the gaps.
+"""
+
+from difflib import SequenceMatcher
+from typing import List, Tuple
+
+import pytest
+
+from src.chunking.text_aligner import TextAligner
+
+
+# ============================================================================
+# verify_text_coverage Tests
+# ============================================================================
+
+
+def create_long_document() -> Tuple[str, List[str]]:
+    """~20k-char document and ten verbatim 2k-char chunks covering it"""
+    sentence = "Patients on drug {n} reported a daily dose of {n} mg with mild effects. "
+    original_text = "".join(sentence.format(n=n) for n in range(300))[:20000]
+    texts = [original_text[i:i + 2000] for i in range(0, len(original_text), 2000)]
+    return original_text, texts
+
+
+class TestVerifyTextCoverage:
+    """Test TextAligner.verify_text_coverage on long documents"""
+
+    def test_verbatim_long_document(self):
+        """Verbatim chunks score the SequenceMatcher ratio of the joined text"""
+        # Arrange
+        original_text, texts = create_long_document()
+
+        # Act
+        coverage_ratio, missing_segments = TextAligner.verify_text_coverage(original_text, texts)
+
+        # Assert
+        joiners = len(texts) - 1
+        assert coverage_ratio == pytest.approx(
+            2 * len(original_text) / (2 * len(original_text) + joiners)
+        )
+        assert missing_segments == []
+
+    def test_one_char_edit_long_document(self):
+        """A single dropped character costs one character of coverage"""
+        # Arrange
+        original_text, texts = create_long_document()
+        texts[4] = texts[4][:1000] + texts[4][1001:]
+
+        # Act
+        coverage_ratio, missing_segments = TextAligner.verify_text_coverage(original_text, texts)
+
+        # Assert
+        joiners = len(texts) - 1
+        assert coverage_ratio == pytest.approx(
+            2 * (len(original_text) - 1) / (2 * len(original_text) - 1 + joiners)
+        )
+        assert missing_segments == [original_text[9000]]
+
+    def test_matches_sequence_matcher(self):
+        """Partly anchored chunks score the same as a full diff"""
+        # Arrange
+        original_text, texts = create_long_document()
+        original_text = original_text[:600]
+        texts = [original_text[:200], original_text[200:400] + "extra", original_text[400:]]
+
+        # Act
+        coverage_ratio, _ = TextAligner.verify_text_coverage(original_text, texts, min_coverage=0.0)
+
+        # Assert
+        expected = SequenceMatcher(None, original_text, " ".join(texts), autojunk=False).ratio()
+        assert coverage_ratio == pytest.approx(expected)
+
+    def test_unanchored_chunks_are_one_diff(self):
+        """With no verbatim chunk the whole document is a single diff"""
+        # Arrange
+        original_text, _ = create_long_document()
+        original_text = original_text[:400]
+        texts = [original_text[:200].upper(), original_text[200:].replace("drug", "dose")]
+
+        # Act
+        coverage_ratio, _ = TextAligner.verify_text_coverage(original_text, texts, min_coverage=0.0)
+
+        # Assert
+        expected = SequenceMatcher(None, original_text, " ".join(texts), autojunk=False).ratio()
+        assert coverage_ratio == pytest.approx(expected)
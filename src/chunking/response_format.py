@@ -0,0 +1,13 @@
+"""
+Limits for sanity-checking raw LLM responses before parsing.
+
+Shared by the production structure analyzer and the V1 / V2 research
+extractors, which all reject preambles and skip TSV header lines.
+"""
+
+# Leading characters of a response lowercased for the preamble check
+# ("here is" / "here are"); the rest of the response is never lowercased
+PREAMBLE_CHECK_LENGTH = 16
+
+# A TSV header line names all four of these columns, so it is at least this long
+HEADER_MIN_LENGTH = len("title") + len("level") + len("parent") + len("summary")
@@ -7,12 +7,16 @@ for improved chunk extraction accuracy.
 """
 
 import json
+import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from .llm_provider import LLMProvider
 from .models import Document, Structure, Section, StructureAnalysisError
+from .response_format import PREAMBLE_CHECK_LENGTH, HEADER_MIN_LENGTH
 
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Prompt Template (7-column TSV with start_words/end_words/is_table)
@@ -87,6 +91,29 @@ DOCUMENT TO ANALYZE:
 OUTPUT (TSV format):"""
 
 
+# ============================================================================
+# Multi-Document Prompt (several small documents marshaled into one request)
+# ============================================================================
+
+# Same rules as the single-document prompt; only the document slot differs
+MULTI_DOCUMENT_PROMPT = STRUCTURE_ANALYSIS_PROMPT.split("DOCUMENT TO ANALYZE:")[0] + """MULTIPLE DOCUMENTS:
+The input below contains several independent documents. Each one starts with a marker line of the form "### DOC <id> ###".
+Segment EACH document separately, applying all rules above to each one. Parent titles refer only to sections of the same document.
+Before each document's TSV rows, output its marker line exactly as given (same id), in the same order as the input. Marker lines are the only non-TSV lines allowed.
+
+DOCUMENTS TO ANALYZE:
+{documents_text}
+
+OUTPUT (marker line + TSV rows for each document):"""
+
+DOCUMENT_MARKER = "### DOC {document_id} ###"
+_DOCUMENT_MARKER_RE = re.compile(r"^###\s*DOC\s+(.+?)\s*###\s*$", re.MULTILINE)
+
+# Upper bound on combined document characters per marshaled request (~50k tokens),
+# leaving room in the output budget for every document's TSV rows
+MARSHAL_MAX_CHARS = 200_000
+
+
 # ============================================================================
 # Structure Analyzer
 # ============================================================================
@@ -133,40 +160,11 @@ class StructureAnalyzer:
         Raises:
             StructureAnalysisError: If LLM fails or returns invalid structure
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Check if structure file already exists (unless redo flag is set)
-        if self.output_dir and not redo:
-            structure_file = self.output_dir / document.document_id / f"{document.document_id}_structure.json"
-            if structure_file.exists():
-                try:
-                    logger.info(f"Structure file exists, loading from: {structure_file}")
-
-                    # Load and validate structure file
-                    with open(structure_file, 'r') as f:
-                        structure_data = json.load(f)
-
-                    # Reconstruct Structure from file
-                    sections = [Section(**section_data) for section_data in structure_data["sections"]]
-                    structure = Structure(
-                        document_id=structure_data["document_id"],
-                        chapter_title=structure_data["chapter_title"],
-                        chapter_number=structure_data.get("chapter_number"),
-                        sections=sections,
-                        metadata={**structure_data.get("metadata", {}), "cache_hit": True},
-                        analysis_model=structure_data["analysis_model"]
-                    )
-
-                    # Return loaded result with zero tokens consumed
-                    return {
-                        "structure": structure,
-                        "tokens_consumed": 0,
-                        "cache_hit": True
-                    }
-                except Exception as e:
-                    # File corrupted or invalid, proceed with fresh analysis
-                    logger.warning(f"Failed to load structure file, will regenerate: {e}")
+        if not redo:
+            existing = self.load_existing_structure(document)
+            if existing is not None:
+                return existing
 
         # No existing file or redo=True, perform fresh analysis
         # Format prompt with document content and max_chunk_tokens
@@ -175,7 +173,225 @@ class StructureAnalyzer:
             max_chunk_tokens=self.max_chunk_tokens
         )
 
-        # Call LLM
+        content, tokens_consumed = self._call_llm(prompt)
+
+        # Validate response format
+        self._validate_llm_response(content)
+
+        # Parse TSV response (6 columns for V2)
+        sections = self._parse_structure_response(content)
+
+        # Return result with token consumption
+        return {
+            "structure": self._build_structure(document, sections),
+            "tokens_consumed": tokens_consumed,
+            "cache_hit": False
+        }
+
+    def analyze_batch(
+        self,
+        documents: List[Document],
+        redo: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several documents, marshaling them into as few LLM calls as possible.
+
+        Documents with an existing structure file are loaded as in analyze().
+        The rest are grouped (up to MARSHAL_MAX_CHARS of content per group) and
+        sent in one prompt per group, separated by "### DOC <id> ###" markers.
+        The response is split on the same markers and each part is parsed like
+        a single-document response. Tokens for a group call are split evenly
+        across the documents it produced.
+
+        Args:
+            documents: Documents to analyze (unique document_ids)
+            redo: If True, ignore existing structure files
+
+        Returns:
+            Mapping document_id -> analyze()-style result. Documents whose part
+            of a batched response is missing or fails to parse are omitted;
+            callers fall back to analyze() for them.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[Document] = []
+        for document in documents:
+            existing = None if redo else self.load_existing_structure(document)
+            if existing is not None:
+                results[document.document_id] = existing
+            else:
+                pending.append(document)
+
+        for group in self._marshal_groups(pending):
+            if len(group) == 1:
+                # Nothing to marshal; the single-document prompt is the better fit
+                continue
+            try:
+                results.update(self._analyze_group(group))
+            except StructureAnalysisError as e:
+                logger.warning("Batched structure analysis failed for %d documents: %s", len(group), e)
+
+        return results
+
+    def _marshal_groups(self, documents: List[Document]) -> List[List[Document]]:
+        """Greedily group documents so each group stays under MARSHAL_MAX_CHARS."""
+        groups: List[List[Document]] = []
+        current: List[Document] = []
+        current_chars = 0
+        for document in documents:
+            size = len(document.content)
+            if current and current_chars + size > MARSHAL_MAX_CHARS:
+                groups.append(current)
+                current, current_chars = [], 0
+            current.append(document)
+            current_chars += size
+        if current:
+            groups.append(current)
+        return groups
+
+    def _analyze_group(self, group: List[Document]) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze a group of documents with one marshaled LLM call.
+
+        Raises:
+            StructureAnalysisError: If the LLM call fails or returns no usable output
+        """
+        documents_text = "\n\n".join(
+            f"{DOCUMENT_MARKER.format(document_id=document.document_id)}\n{document.content}"
+            for document in group
+        )
+        prompt = MULTI_DOCUMENT_PROMPT.format(
+            documents_text=documents_text,
+            max_chunk_tokens=self.max_chunk_tokens
+        )
+
+        content, tokens_consumed = self._call_llm(prompt)
+        self._validate_llm_response(content)
+        parts = self._split_marshaled_response(content)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for document in group:
+            part = parts.get(document.document_id)
+            if part is None:
+                logger.warning("Document %s missing from batched structure response", document.document_id)
+                continue
+            try:
+                sections = self._parse_structure_response(part)
+            except StructureAnalysisError as e:
+                logger.warning("Batched structure for %s failed to parse: %s", document.document_id, e)
+                continue
+            results[document.document_id] = {
+                "structure": self._build_structure(document, sections, marshal_batch=len(group)),
+                "cache_hit": False
+            }
+
+        if not results:
+            raise StructureAnalysisError("No document could be parsed from batched response")
+
+        # Attribute the shared call's tokens evenly (remainder to the first document)
+        share, remainder = divmod(tokens_consumed, len(results))
+        for index, result in enumerate(results.values()):
+            result["tokens_consumed"] = share + (remainder if index == 0 else 0)
+
+        return results
+
+    @staticmethod
+    def _split_marshaled_response(response_text: str) -> Dict[str, str]:
+        """Split a marshaled response on its "### DOC <id> ###" marker lines."""
+        markers = list(_DOCUMENT_MARKER_RE.finditer(response_text))
+        parts: Dict[str, str] = {}
+        for index, marker in enumerate(markers):
+            end = markers[index + 1].start() if index + 1 < len(markers) else len(response_text)
+            parts[marker.group(1)] = response_text[marker.end():end]
+        return parts
+
+    def load_existing_structure(self, document: Document) -> Optional[Dict[str, Any]]:
+        """
+        Load a previously written structure file for the document, if any.
+
+        Returns:
+            analyze()-style result with zero tokens consumed, or None when there is
+            no output directory, no file, or the file cannot be loaded
+        """
+        if not self.output_dir:
+            return None
+
+        structure_file = self.output_dir / document.document_id / f"{document.document_id}_structure.json"
+        if not structure_file.exists():
+            return None
+
+        try:
+            logger.info("Structure file exists, loading from: %s", structure_file)
+
+            # Load and validate structure file
+            with open(structure_file, 'r') as f:
+                structure_data = json.load(f)
+
+            # Reconstruct Structure from file
+            sections = [Section(**section_data) for section_data in structure_data["sections"]]
+            structure = Structure(
+                document_id=structure_data["document_id"],
+                chapter_title=structure_data["chapter_title"],
+                chapter_number=structure_data.get("chapter_number"),
+                sections=sections,
+                metadata={**structure_data.get("metadata", {}), "cache_hit": True},
+                analysis_model=structure_data["analysis_model"]
+            )
+
+            # Return loaded result with zero tokens consumed
+            return {
+                "structure": structure,
+                "tokens_consumed": 0,
+                "cache_hit": True
+            }
+        except Exception as e:
+            # File corrupted or invalid, proceed with fresh analysis
+            logger.warning("Failed to load structure file, will regenerate: %s", e)
+            return None
+
+    def batch_request(self, document: Document) -> Dict[str, Any]:
+        """
+        Build the chat-completion request body analyze() would send.
+
+        Used to queue documents on an offline Batch API instead of calling the
+        LLM synchronously; feed the response back through result_from_response().
+        """
+        prompt = STRUCTURE_ANALYSIS_PROMPT.format(
+            document_text=document.content,
+            max_chunk_tokens=self.max_chunk_tokens
+        )
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.3
+        }
+
+    def result_from_response(self, document: Document, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn a chat-completion response for batch_request(document) into an
+        analyze()-style result.
+
+        Raises:
+            StructureAnalysisError: If the response is malformed or fails to parse
+        """
+        content, tokens_consumed = self._read_response(response)
+        self._validate_llm_response(content)
+        sections = self._parse_structure_response(content)
+        return {
+            "structure": self._build_structure(document, sections),
+            "tokens_consumed": tokens_consumed,
+            "cache_hit": False
+        }
+
+    def _call_llm(self, prompt: str) -> Tuple[str, int]:
+        """
+        Send a structure prompt to the LLM.
+
+        Returns:
+            (response content, total tokens consumed)
+
+        Raises:
+            StructureAnalysisError: If the call fails or the response is malformed
+        """
         try:
             response = self.llm_client.chat_completion(
                 model=self.model,
@@ -187,12 +403,22 @@ class StructureAnalyzer:
                 f"LLM API call failed during structure analysis (V2): {str(e)}"
             ) from e
 
-        # Extract token usage from response
+        return self._read_response(response)
+
+    @staticmethod
+    def _read_response(response: Dict[str, Any]) -> Tuple[str, int]:
+        """
+        Pull content and token usage out of a chat-completion response.
+
+        Raises:
+            StructureAnalysisError: If the response has no message content
+        """
+        # Extract token usage from response (optional, don't fail if unavailable)
+        tokens_consumed = 0
         try:
             usage = response.get("usage", {})
             tokens_consumed = usage.get("total_tokens", 0)
         except Exception:
-            # Token tracking is optional, don't fail if unavailable
             pass
 
         # Extract response content
@@ -203,17 +429,19 @@ class StructureAnalyzer:
                 f"Invalid LLM response format: {str(e)}"
             ) from e
 
-        # Validate response format
-        self._validate_llm_response(content)
-
-        # Parse TSV response (6 columns for V2)
-        sections = self._parse_structure_response(content)
+        return content, tokens_consumed
 
+    def _build_structure(
+        self,
+        document: Document,
+        sections: List[Section],
+        **extra_metadata: Any
+    ) -> Structure:
+        """Create the Structure for freshly parsed sections."""
         # Extract chapter information (use first top-level section as chapter)
         chapter_title = self._extract_chapter_title(sections)
 
-        # Create Structure object
-        structure = Structure(
+        return Structure(
             document_id=document.document_id,
             chapter_title=chapter_title,
             chapter_number=None,  # Can be extracted from title if needed
@@ -221,18 +449,12 @@ class StructureAnalyzer:
             metadata={
                 "cache_hit": False,
                 "version": "v2",  # Mark as V2 structure
-                "has_word_boundaries": True
+                "has_word_boundaries": True,
+                **extra_metadata
             },
             analysis_model=self.model
         )
 
-        # Return result with token consumption
-        return {
-            "structure": structure,
-            "tokens_consumed": tokens_consumed,
-            "cache_hit": False
-        }
-
     def _validate_llm_response(self, response: str) -> None:
         """
         Validate LLM response before parsing.
@@ -243,18 +465,19 @@ class StructureAnalyzer:
         Raises:
             StructureAnalysisError: If response format is invalid
         """
-        if not response or not response.strip():
+        stripped = response.strip() if response else ""
+        if not stripped:
             raise StructureAnalysisError("LLM returned empty response")
 
         # Check for common LLM mistakes
-        if response.strip().startswith("```"):
+        if stripped.startswith("```"):
             raise StructureAnalysisError(
                 "LLM returned markdown code block. "
                 "Expected plain TSV output without formatting."
             )
 
-        if response.strip().lower().startswith("here is") or \
-           response.strip().lower().startswith("here are"):
+        # Only the start can hold a preamble, so only that is lowercased
+        if stripped[:PREAMBLE_CHECK_LENGTH].lower().startswith(("here is", "here are")):
             raise StructureAnalysisError(
                 "LLM added preamble. Expected direct TSV output only."
             )
@@ -273,7 +496,7 @@ class StructureAnalyzer:
             StructureAnalysisError: If parsing fails
         """
         sections = []
-        lines = response_text.strip().split('\n')
+        lines = response_text.split('\n')
 
         # Clean up common LLM formatting issues
         cleaned_lines = []
@@ -288,12 +511,14 @@ class StructureAnalyzer:
             if line.startswith('```'):
                 continue
 
-            # Skip TSV header lines (case-insensitive check for header keywords)
-            line_lower = line.lower()
-            if ('title' in line_lower and 'level' in line_lower and
-                'parent' in line_lower and 'summary' in line_lower):
-                # This looks like a header line, skip it
-                continue
+            # Skip TSV header lines (case-insensitive check for header keywords;
+            # lines too short to hold all four are not lowercased)
+            if len(line) >= HEADER_MIN_LENGTH:
+                line_lower = line.lower()
+                if ('title' in line_lower and 'level' in line_lower and
+                    'parent' in line_lower and 'summary' in line_lower):
+                    # This looks like a header line, skip it
+                    continue
 
             cleaned_lines.append(line)
 
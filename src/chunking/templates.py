@@ -0,0 +1,43 @@
+"""
+Pre-compiled prompt templates.
+
+Prompt templates are split into (literal, field) segments once at import, so
+rendering per section only joins strings instead of rescanning the template.
+Shared by the production extractor and the V3 experimental extractors.
+"""
+
+import string
+from typing import Any, List
+
+
+def compile_template(template: str) -> List[tuple]:
+    """
+    Pre-split a str.format template into (literal, field_name) pairs.
+
+    Parsing happens once at import; fast_format() then only joins segments,
+    avoiding a full template rescan for every section.
+
+    Args:
+        template: Template using plain {field} placeholders (no format specs)
+
+    Returns:
+        List of (literal_text, field_name) tuples (field_name is None for trailing text)
+    """
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+
+def fast_format(compiled: List[tuple], **kwargs: Any) -> str:
+    """
+    Render a template compiled with compile_template().
+
+    Args:
+        compiled: Output of compile_template()
+        **kwargs: Values for every placeholder in the template
+
+    Returns:
+        Rendered string (identical to template.format(**kwargs))
+    """
+    return "".join(
+        literal + str(kwargs[field]) if field is not None else literal
+        for literal, field in compiled
+    )
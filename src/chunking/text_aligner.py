@@ -6,7 +6,7 @@ document text without loss or duplication.
 """
 
 from difflib import SequenceMatcher
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .models import Chunk, TextCoverageError
 
@@ -37,18 +37,39 @@ class TextAligner:
             TextCoverageError: If coverage < min_coverage
         """
         # Reconstruct document from chunks (using original_text, not chunk_text with prefix)
-        reconstructed = " ".join(chunk.original_text for chunk in chunks)
+        return TextAligner.verify_text_coverage(
+            original_text,
+            [chunk.original_text for chunk in chunks],
+            min_coverage=min_coverage
+        )
 
-        # Use SequenceMatcher to compare
-        matcher = SequenceMatcher(None, original_text, reconstructed)
-        coverage_ratio = matcher.ratio()
+    @staticmethod
+    def verify_text_coverage(
+        original_text: str,
+        texts: List[str],
+        min_coverage: float = 0.99
+    ) -> Tuple[float, List[str]]:
+        """
+        Verify coverage from the chunks' original texts alone.
 
-        # Find missing segments
-        missing = []
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'delete':
-                # This segment from original is missing in reconstructed
-                missing.append(original_text[i1:i2])
+        Lets streaming callers drop Chunk objects as they go and keep only
+        the text needed for this check.
+
+        Args:
+            original_text: Original document text
+            texts: original_text of each chunk, in order
+            min_coverage: Minimum acceptable coverage ratio (default: 0.99 = 99%)
+
+        Returns:
+            Tuple of (coverage_ratio, missing_segments), as verify_coverage()
+        """
+        # Chunks are normally verbatim slices of the document, so anchor them
+        # with str.find and only diff the text between anchors; a full
+        # SequenceMatcher pass over the whole document is quadratic-ish.
+        # Edited chunks are simply left unanchored and diffed with their gap,
+        # so one edit does not switch the whole document to a different metric.
+        spans = TextAligner._find_in_order(original_text, texts)
+        coverage_ratio, missing = TextAligner._compare_gaps(original_text, texts, spans)
 
         # Fail if coverage below threshold
         if coverage_ratio < min_coverage:
@@ -57,6 +78,104 @@ class TextAligner:
 
         return coverage_ratio, missing
 
+    @staticmethod
+    def _find_in_order(
+        original_text: str,
+        texts: List[str]
+    ) -> List[Optional[Tuple[int, int]]]:
+        """
+        Locate each text verbatim in original_text, left to right.
+
+        A text may overlap the end of the previous one (extraction boundaries
+        often repeat a few words), but must not start before it.
+
+        Returns:
+            (start, end) span of each text, or None for texts not found in
+            order (edited or reordered chunks)
+        """
+        spans = []
+        previous_start = -1
+        position = 0
+        for text in texts:
+            start = original_text.find(text, position)
+            if start < 0:
+                # Overlapping chunk: starts inside the covered text
+                start = original_text.find(text, previous_start + 1, position + len(text))
+                if start < 0:
+                    spans.append(None)
+                    continue
+            end = start + len(text)
+            spans.append((start, end))
+            previous_start = start
+            position = max(position, end)
+        return spans
+
+    @staticmethod
+    def _compare_gaps(
+        original_text: str,
+        texts: List[str],
+        spans: List[Optional[Tuple[int, int]]]
+    ) -> Tuple[float, List[str]]:
+        """
+        Coverage ratio and missing segments for chunks anchored at spans.
+
+        Each anchored chunk counts as matched except where it repeats text
+        already covered by earlier chunks. The original text between anchors
+        is diffed against whatever the reconstruction has there (the " "
+        joiners plus any unanchored chunks), so the ratio keeps
+        SequenceMatcher's 2*M/T definition whether or not every chunk anchors.
+        """
+        matched = 0
+        missing = []
+        position = 0
+        unanchored = []  # Reconstructed text since the last anchored chunk
+
+        for index, (text, span) in enumerate(zip(texts, spans)):
+            if index:
+                unanchored.append(" ")
+            if span is None:
+                unanchored.append(text)
+                continue
+
+            start, end = span
+            gap_matched, gap_missing = TextAligner._diff_gap(
+                original_text[position:start], "".join(unanchored)
+            )
+            matched += gap_matched + max(0, end - max(start, position))
+            missing.extend(gap_missing)
+            position = max(position, end)
+            unanchored = []
+
+        gap_matched, gap_missing = TextAligner._diff_gap(
+            original_text[position:], "".join(unanchored)
+        )
+        matched += gap_matched
+        missing.extend(gap_missing)
+
+        total = len(original_text) + sum(len(text) for text in texts) + max(0, len(texts) - 1)
+        coverage_ratio = 2.0 * matched / total if total else 1.0
+        return coverage_ratio, missing
+
+    @staticmethod
+    def _diff_gap(gap: str, reconstructed: str) -> Tuple[int, List[str]]:
+        """
+        Matched character count and missing segments between two unanchored spans.
+
+        autojunk is off: its popular-character heuristic discards most matches
+        on long prose and would make the ratio depend on the gap's length.
+        """
+        if not gap and not reconstructed:
+            return 0, []
+
+        matcher = SequenceMatcher(None, gap, reconstructed, autojunk=False)
+        matched = sum(block.size for block in matcher.get_matching_blocks())
+        missing = [
+            gap[i1:i2]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag == 'delete'
+        ]
+        return matched, missing
+
     @staticmethod
     def check_completeness(original_text: str, chunks: List[Chunk]) -> bool:
         """
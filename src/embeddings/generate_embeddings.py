@@ -75,7 +75,7 @@ app = typer.Typer(
 
 def load_chunks_from_directory(input_dir: Path) -> List[Dict[str, Any]]:
     """
-    Load all chunk JSON files from directory (searches recursively).
+    Load all chunk JSON files and *_chunks.jsonl files from directory (searches recursively).
 
     Args:
         input_dir: Directory containing chunk JSON files (may be in subdirectories)
@@ -90,11 +90,16 @@ def load_chunks_from_directory(input_dir: Path) -> List[Dict[str, Any]]:
     assert input_path.exists(), f"Input directory not found: {input_path}"
     assert input_path.is_dir(), f"Input path is not a directory: {input_path}"
 
-    # Find all chunk JSON files (search recursively with **)
+    # Find all chunk JSON files and per-document JSONL files (search recursively with **)
     chunk_files = sorted(input_path.glob("**/*_chunk*.json"))
-    assert len(chunk_files) > 0, f"No chunk files found in {input_path} (searched recursively)"
+    jsonl_files = sorted(input_path.glob("**/*_chunks.jsonl"))
+    assert len(chunk_files) + len(jsonl_files) > 0, \
+        f"No chunk files found in {input_path} (searched recursively)"
 
-    console.print(f"[cyan]📂 Found {len(chunk_files)} chunk files in {input_dir}[/cyan]")
+    console.print(
+        f"[cyan]📂 Found {len(chunk_files)} chunk files and "
+        f"{len(jsonl_files)} JSONL files in {input_dir}[/cyan]"
+    )
 
     # Load all chunks
     chunks = []
@@ -105,6 +110,15 @@ def load_chunks_from_directory(input_dir: Path) -> List[Dict[str, Any]]:
             chunk_data["_source_file"] = str(chunk_file)
             chunks.append(chunk_data)
 
+    for jsonl_file in jsonl_files:
+        with open(jsonl_file, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                chunk_data = json.loads(line)
+                chunk_data["_source_file"] = f"{jsonl_file}:{line_number}"
+                chunks.append(chunk_data)
+
     # Validate required fields
     required_fields = {"chunk_id", "source_document", "chunk_text"}
     for i, chunk in enumerate(chunks):